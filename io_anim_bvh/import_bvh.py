@@ -20,10 +20,11 @@
 
 # Script copyright (C) Campbell Barton
 
-from math import radians, ceil
+from math import ceil, floor, pi
 
 import bpy
-from mathutils import Vector, Euler, Matrix
+import numpy as np
+from mathutils import Vector, Matrix
 
 
 class BVH_Node:
@@ -51,7 +52,7 @@ class BVH_Node:
         'rot_order',
         # Same as above but a string 'XYZ' format..
         'rot_order_str',
-        # A list one tuple's one for each frame: (locx, locy, locz, rotx, roty, rotz),
+        # A (frames, 6) array, one row for each frame: (locx, locy, locz, rotx, roty, rotz),
         # euler rotation ALWAYS stored xyz order, even when native used.
         'anim_data',
         # Convenience function, bool, same as: (channels[0] != -1 or channels[1] != -1 or channels[2] != -1).
@@ -92,9 +93,9 @@ class BVH_Node:
 
         self.children = []
 
-        # List of 6 length tuples: (lx, ly, lz, rx, ry, rz)
+        # Rows of (lx, ly, lz, rx, ry, rz),
         # even if the channels aren't used they will just be zero.
-        self.anim_data = [(0, 0, 0, 0, 0, 0)]
+        self.anim_data = np.zeros((1, 6))
 
     def __repr__(self):
         return (
@@ -123,8 +124,27 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     if len(file_lines) == 1:
         file_lines = file_lines[0].split('\r')
 
-    # Split by whitespace.
-    file_lines = [ll for ll in [l.split() for l in file_lines] if ll]
+    # Split the hierarchy by whitespace, up to the MOTION header,
+    # the frames that follow are parsed in bulk.
+    file_lines_iter = iter(file_lines)
+    file_lines = []
+    for l in file_lines_iter:
+        ll = l.split()
+        if not ll:
+            continue
+        file_lines.append(ll)
+        if len(ll) == 1 and ll[0].lower() == 'motion':
+            # Also split the frame count and frame time lines.
+            header_count = 0
+            for l in file_lines_iter:
+                ll = l.split()
+                if ll:
+                    file_lines.append(ll)
+                    header_count += 1
+                    if header_count == 2:
+                        break
+            break
+    motion_lines = list(file_lines_iter)
 
     # Create hierarchy as empties
     if file_lines[0][0].lower() == 'hierarchy':
@@ -274,31 +294,23 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # second life expects it, which isn't to spec.
     bvh_nodes_list = sorted_nodes(bvh_nodes)
 
-    while lineIdx < len(file_lines):
-        line = file_lines[lineIdx]
-        for bvh_node in bvh_nodes_list:
-            # for bvh_node in bvh_nodes_serial:
-            lx = ly = lz = rx = ry = rz = 0.0
-            channels = bvh_node.channels
-            anim_data = bvh_node.anim_data
-            if channels[0] != -1:
-                lx = global_scale * float(line[channels[0]])
-
-            if channels[1] != -1:
-                ly = global_scale * float(line[channels[1]])
+    # A (frames, channels) array of all the motion data.
+    motion = read_bvh_motion(file_lines[lineIdx:], motion_lines, channelIndex + 1)
 
-            if channels[2] != -1:
-                lz = global_scale * float(line[channels[2]])
+    for bvh_node in bvh_nodes_list:
+        channels = bvh_node.channels
+        # Frame 0 is left at zero.
+        anim_data = np.zeros((len(motion) + 1, 6))
+        for i in range(3):
+            if channels[i] != -1:
+                anim_data[1:, i] = global_scale * motion[:, channels[i]]
 
-            if channels[3] != -1 or channels[4] != -1 or channels[5] != -1:
+        if bvh_node.has_rot:
+            # Note that a missing rotation channel (-1) reads the last channel of the line.
+            anim_data[1:, 3:] = np.radians(motion[:, channels[3:]])
 
-                rx = radians(float(line[channels[3]]))
-                ry = radians(float(line[channels[4]]))
-                rz = radians(float(line[channels[5]]))
-
-            # Done importing motion data #
-            anim_data.append((lx, ly, lz, rx, ry, rz))
-        lineIdx += 1
+        # Done importing motion data #
+        bvh_node.anim_data = anim_data
 
     # Assign children
     for bvh_node in bvh_nodes_list:
@@ -341,6 +353,27 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     return bvh_nodes, bvh_frame_time, bvh_frame_count
 
 
+def read_bvh_motion(motion_words_lines, motion_lines, channel_count):
+    """
+    Parse the MOTION frames into a (frames, channel_count) array.
+
+    motion_words_lines are frame lines already split into words, motion_lines the remaining raw lines.
+    """
+    motion_lines = [l for l in motion_lines if l and not l.isspace()]
+    frame_count = len(motion_words_lines) + len(motion_lines)
+
+    words = [word for ll in motion_words_lines for word in ll]
+    words += " ".join(motion_lines).split()
+    if len(words) == frame_count * channel_count:
+        return np.array(words, dtype=np.float64).reshape(frame_count, channel_count)
+
+    # Lines of irregular length, only keep the values used by the channels.
+    lines = list(motion_words_lines) + [l.split() for l in motion_lines]
+    return np.array(
+        [ll[:channel_count] for ll in lines], dtype=np.float64
+    ).reshape(frame_count, channel_count)
+
+
 def bvh_node_dict2objects(context, bvh_name, bvh_nodes, rotate_mode='NATIVE', frame_start=1, IMPORT_LOOP=False):
 
     if frame_start < 1:
@@ -404,6 +437,175 @@ def bvh_node_dict2objects(context, bvh_name, bvh_nodes, rotate_mode='NATIVE', fr
     return objects
 
 
+def _axis_rotation_matrices(angles, axis):
+    """(N, 3, 3) rotation matrices around axis (0, 1, 2 for X, Y, Z) for the given angles."""
+    j = (axis + 1) % 3
+    k = (axis + 2) % 3
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    mats = np.zeros((len(angles), 3, 3))
+    mats[:, axis, axis] = 1.0
+    mats[:, j, j] = cos
+    mats[:, j, k] = -sin
+    mats[:, k, j] = sin
+    mats[:, k, k] = cos
+    return mats
+
+
+def euler_to_matrices(eulers, order):
+    """
+    (N, 3, 3) rotation matrices for the (N, 3) xyz euler angles, rotations being applied in the given order.
+
+    Same as mathutils ``Euler(euler, order).to_matrix()`` for all rows at once.
+    """
+    mats = np.broadcast_to(np.identity(3), (len(eulers), 3, 3))
+    for axis_name in order:
+        axis = 'XYZ'.index(axis_name)
+        mats = _axis_rotation_matrices(eulers[:, axis], axis) @ mats
+    return mats
+
+
+def matrices_to_quaternions(mats):
+    """
+    (N, 4) wxyz quaternions of (N, 3, 3) rotation matrices.
+
+    Follows mathutils ``Matrix.to_quaternion()`` (including its choice of sign).
+    """
+    m00, m11, m22 = mats[:, 0, 0], mats[:, 1, 1], mats[:, 2, 2]
+    quats = np.empty((len(mats), 4))
+
+    tr = 0.25 * (1.0 + m00 + m11 + m22)
+    case_w = tr > np.finfo(np.float32).eps
+    case_x = ~case_w & (m00 > m11) & (m00 > m22)
+    case_y = ~case_w & ~case_x & (m11 > m22)
+    case_z = ~case_w & ~case_x & ~case_y
+
+    m = mats[case_w]
+    s = np.sqrt(tr[case_w])
+    inv = 1.0 / (4.0 * s)
+    quats[case_w] = np.stack((
+        s,
+        (m[:, 2, 1] - m[:, 1, 2]) * inv,
+        (m[:, 0, 2] - m[:, 2, 0]) * inv,
+        (m[:, 1, 0] - m[:, 0, 1]) * inv,
+    ), axis=-1)
+
+    m = mats[case_x]
+    s = 2.0 * np.sqrt(np.maximum(1.0 + m[:, 0, 0] - m[:, 1, 1] - m[:, 2, 2], 0.0))
+    inv = 1.0 / s
+    quats[case_x] = np.stack((
+        (m[:, 2, 1] - m[:, 1, 2]) * inv,
+        0.25 * s,
+        (m[:, 0, 1] + m[:, 1, 0]) * inv,
+        (m[:, 0, 2] + m[:, 2, 0]) * inv,
+    ), axis=-1)
+
+    m = mats[case_y]
+    s = 2.0 * np.sqrt(np.maximum(1.0 + m[:, 1, 1] - m[:, 0, 0] - m[:, 2, 2], 0.0))
+    inv = 1.0 / s
+    quats[case_y] = np.stack((
+        (m[:, 0, 2] - m[:, 2, 0]) * inv,
+        (m[:, 0, 1] + m[:, 1, 0]) * inv,
+        0.25 * s,
+        (m[:, 1, 2] + m[:, 2, 1]) * inv,
+    ), axis=-1)
+
+    m = mats[case_z]
+    s = 2.0 * np.sqrt(np.maximum(1.0 + m[:, 2, 2] - m[:, 0, 0] - m[:, 1, 1], 0.0))
+    inv = 1.0 / s
+    quats[case_z] = np.stack((
+        (m[:, 1, 0] - m[:, 0, 1]) * inv,
+        (m[:, 0, 2] + m[:, 2, 0]) * inv,
+        (m[:, 1, 2] + m[:, 2, 1]) * inv,
+        0.25 * s,
+    ), axis=-1)
+
+    quats /= np.linalg.norm(quats, axis=1)[:, np.newaxis]
+    return quats
+
+
+# Axes and parity of each euler order, as used by mathutils.
+_eul_order_axes = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True),
+}
+
+
+def _compatible_euler(eul, old):
+    """
+    Make the euler angles list eul as close as possible to old in place.
+
+    Same as ``compatible_eul`` used by mathutils ``Matrix.to_euler(order, compatible)``.
+    """
+    deul = [0.0, 0.0, 0.0]
+    for i in range(3):
+        d = eul[i] - old[i]
+        if d > 5.1:
+            eul[i] -= floor(d / (2.0 * pi) + 0.5) * (2.0 * pi)
+            d = eul[i] - old[i]
+        elif d < -5.1:
+            eul[i] += floor(-d / (2.0 * pi) + 0.5) * (2.0 * pi)
+            d = eul[i] - old[i]
+        deul[i] = d
+
+    # One of the axis rotations larger than 180 degrees and the other ones small.
+    for i in range(3):
+        if abs(deul[i]) > 3.2 and abs(deul[(i + 1) % 3]) < 1.6 and abs(deul[(i + 2) % 3]) < 1.6:
+            if deul[i] > 0.0:
+                eul[i] -= 2.0 * pi
+            else:
+                eul[i] += 2.0 * pi
+
+
+def matrices_to_eulers(mats, order):
+    """
+    (N, 3) xyz euler angles in the given order of (N, 3, 3) rotation matrices.
+
+    Same as successive calls to mathutils ``Matrix.to_euler(order, previous_euler)``
+    starting from a zero euler: of the two euler solutions of each matrix, the one
+    closest to the previous frame is used.
+    """
+    (i, j, k), parity = _eul_order_axes[order]
+    cy = np.hypot(mats[:, i, i], mats[:, j, i])
+
+    eulers1 = np.empty((len(mats), 3))
+    eulers1[:, i] = np.arctan2(mats[:, k, j], mats[:, k, k])
+    eulers1[:, j] = np.arctan2(-mats[:, k, i], cy)
+    eulers1[:, k] = np.arctan2(mats[:, j, i], mats[:, i, i])
+
+    eulers2 = np.empty((len(mats), 3))
+    eulers2[:, i] = np.arctan2(-mats[:, k, j], -mats[:, k, k])
+    eulers2[:, j] = np.arctan2(-mats[:, k, i], -cy)
+    eulers2[:, k] = np.arctan2(-mats[:, j, i], -mats[:, i, i])
+
+    # Gimbal lock
+    locked = cy <= 16.0 * np.finfo(np.float32).eps
+    eulers1[locked, i] = np.arctan2(-mats[locked, j, k], mats[locked, j, j])
+    eulers1[locked, k] = 0.0
+    eulers2[locked] = eulers1[locked]
+
+    if parity:
+        eulers1 = -eulers1
+        eulers2 = -eulers2
+
+    # Choosing the solution depends on the previous frame, this can't be vectorized.
+    eulers = []
+    prev = [0.0, 0.0, 0.0]
+    for eul1, eul2 in zip(eulers1.tolist(), eulers2.tolist()):
+        _compatible_euler(eul1, prev)
+        _compatible_euler(eul2, prev)
+        d1 = abs(eul1[0] - prev[0]) + abs(eul1[1] - prev[1]) + abs(eul1[2] - prev[2])
+        d2 = abs(eul2[0] - prev[0]) + abs(eul2[1] - prev[1]) + abs(eul2[2] - prev[2])
+        prev = eul2 if d1 > d2 else eul1
+        eulers.append(prev)
+
+    return np.array(eulers).reshape(-1, 3)
+
+
 def bvh_node_dict2armature(
         context,
         bvh_name,
@@ -528,7 +730,8 @@ def bvh_node_dict2armature(
     arm_ob.animation_data.action = action
 
     # Replace the bvh_node.temp (currently an editbone)
-    # With a tuple  (pose_bone, armature_bone, bone_rest_matrix, bone_rest_matrix_inv)
+    # With a tuple  (pose_bone, armature_bone, bone_rest_matrix, bone_rest_matrix_inv),
+    # the rest matrices being 3x3 arrays.
     num_frame = 0
     for bvh_node in bvh_nodes_list:
         bone_name = bvh_node.temp  # may not be the same name as the bvh_node, could have been shortened.
@@ -539,9 +742,7 @@ def bvh_node_dict2armature(
         bone_rest_matrix_inv = Matrix(bone_rest_matrix)
         bone_rest_matrix_inv.invert()
 
-        bone_rest_matrix_inv.resize_4x4()
-        bone_rest_matrix.resize_4x4()
-        bvh_node.temp = (pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv)
+        bvh_node.temp = (pose_bone, bone, np.array(bone_rest_matrix), np.array(bone_rest_matrix_inv))
 
         if 0 == num_frame:
             num_frame = len(bvh_node.anim_data)
@@ -554,99 +755,63 @@ def bvh_node_dict2armature(
         num_frame = num_frame - skip_frame
 
     # Create a shared time axis for all animation curves.
-    time = [float(frame_start)] * num_frame
     if use_fps_scale:
         dt = scene.render.fps * bvh_frame_time
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i) * dt
     else:
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i)
+        dt = 1.0
+    time = float(frame_start) + np.arange(num_frame) * dt
+
+    linear_enum_value = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
+    interpolation = np.full(num_frame, linear_enum_value, dtype=np.int32)
 
     # print("bvh_frame_time = %f, dt = %f, num_frame = %d"
     #      % (bvh_frame_time, dt, num_frame]))
 
+    def add_fcurves(data_path, values):
+        # values is a (num_frame, number of axes) array.
+        co = np.empty((num_frame, 2), dtype=np.float32)
+        co[:, 0] = time
+        for axis_i in range(values.shape[1]):
+            curve = action.fcurves.new(data_path=data_path, index=axis_i)
+            keyframe_points = curve.keyframe_points
+            keyframe_points.add(num_frame)
+
+            co[:, 1] = values[:, axis_i]
+            keyframe_points.foreach_set('co', co.ravel())
+            keyframe_points.foreach_set('interpolation', interpolation)
+
     for i, bvh_node in enumerate(bvh_nodes_list):
         pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv = bvh_node.temp
+        anim_data = bvh_node.anim_data[skip_frame:skip_frame + num_frame]
 
         if bvh_node.has_loc:
             # Not sure if there is a way to query this or access it in the
             # PoseBone structure.
             data_path = 'pose.bones["%s"].location' % pose_bone.name
 
-            location = [(0.0, 0.0, 0.0)] * num_frame
-            for frame_i in range(num_frame):
-                bvh_loc = bvh_node.anim_data[frame_i + skip_frame][:3]
-
-                bone_translate_matrix = Matrix.Translation(
-                    Vector(bvh_loc) - bvh_node.rest_head_local)
-                location[frame_i] = (bone_rest_matrix_inv @
-                                     bone_translate_matrix).to_translation()
+            # Translation in the bone rest space, for all frames at once.
+            location = (anim_data[:, :3] - np.array(bvh_node.rest_head_local)) @ bone_rest_matrix_inv.T
 
             # For each location x, y, z.
-            for axis_i in range(3):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        location[frame_i][axis_i],
-                    )
+            add_fcurves(data_path, location)
 
         if bvh_node.has_rot:
-            data_path = None
-            rotate = None
+            # apply rotation order and convert to XYZ
+            # note that the rot_order_str is reversed.
+            bone_rotation_matrices = euler_to_matrices(anim_data[:, 3:], bvh_node.rot_order_str[::-1])
+            bone_rotation_matrices = bone_rest_matrix_inv @ bone_rotation_matrices @ bone_rest_matrix
 
             if 'QUATERNION' == rotate_mode:
-                rotate = [(1.0, 0.0, 0.0, 0.0)] * num_frame
                 data_path = ('pose.bones["%s"].rotation_quaternion'
                              % pose_bone.name)
+                rotate = matrices_to_quaternions(bone_rotation_matrices)
             else:
-                rotate = [(0.0, 0.0, 0.0)] * num_frame
                 data_path = ('pose.bones["%s"].rotation_euler' %
                              pose_bone.name)
-
-            prev_euler = Euler((0.0, 0.0, 0.0))
-            for frame_i in range(num_frame):
-                bvh_rot = bvh_node.anim_data[frame_i + skip_frame][3:]
-
-                # apply rotation order and convert to XYZ
-                # note that the rot_order_str is reversed.
-                euler = Euler(bvh_rot, bvh_node.rot_order_str[::-1])
-                bone_rotation_matrix = euler.to_matrix().to_4x4()
-                bone_rotation_matrix = (
-                    bone_rest_matrix_inv @
-                    bone_rotation_matrix @
-                    bone_rest_matrix
-                )
-
-                if len(rotate[frame_i]) == 4:
-                    rotate[frame_i] = bone_rotation_matrix.to_quaternion()
-                else:
-                    rotate[frame_i] = bone_rotation_matrix.to_euler(
-                        pose_bone.rotation_mode, prev_euler)
-                    prev_euler = rotate[frame_i]
+                rotate = matrices_to_eulers(bone_rotation_matrices, pose_bone.rotation_mode)
 
             # For each euler angle x, y, z (or quaternion w, x, y, z).
-            for axis_i in range(len(rotate[0])):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        rotate[frame_i][axis_i],
-                    )
-
-    for cu in action.fcurves:
-        if IMPORT_LOOP:
-            pass  # 2.5 doenst have cyclic now?
-
-        for bez in cu.keyframe_points:
-            bez.interpolation = 'LINEAR'
+            add_fcurves(data_path, rotate)
 
     # finally apply matrix
     arm_ob.matrix_world = global_matrix
@@ -19,7 +19,7 @@
 # <pep8 compliant>
 
 import re
-import xml.dom.minidom
+from xml.etree import ElementTree
 from math import cos, sin, tan, atan2, pi, ceil
 
 import bpy
@@ -30,6 +30,7 @@ from .svg_util import (units,
                        srgb_to_linearrgb,
                        check_points_equal,
                        parse_array_of_floats,
+                       parse_path_tokens,
                        read_float)
 
 #### Common utilities ####
@@ -37,6 +38,43 @@ from .svg_util import (units,
 SVGEmptyStyles = {'useFill': None,
                   'fill': None}
 
+SVGNamespace = '{http://www.w3.org/2000/svg}'
+XLinkNamespace = '{http://www.w3.org/1999/xlink}'
+
+
+class SVGNode:
+    """
+    Tag name and attributes of an XML element
+    """
+
+    __slots__ = ('tagName',  # Tag name without SVG namespace
+                 '_attributes')  # Dictionary of attributes
+
+    def __init__(self, element):
+        """
+        Initialize node from ElementTree element
+        """
+
+        tag = element.tag
+        if tag.startswith(SVGNamespace):
+            tag = tag[len(SVGNamespace):]
+
+        attributes = element.attrib
+        href = attributes.get(XLinkNamespace + 'href')
+        if href is not None:
+            attributes = dict(attributes)
+            attributes['xlink:href'] = href
+
+        self.tagName = tag
+        self._attributes = attributes
+
+    def getAttribute(self, name):
+        """
+        Get attribute value, empty string if node doesn't have it
+        """
+
+        return self._attributes.get(name, '')
+
 
 def SVGCreateCurve(context):
     """
@@ -189,33 +227,44 @@ def SVGParseTransform(transform):
     return m
 
 
+SVGRGBColor = re.compile(r'^\s*rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,(\d+)\s*\)\s*$')
+
+
 def SVGGetMaterial(color, context):
     """
     Get material for specified color
+
+    Materials are remembered by color string and by color value,
+    so all spellings of a color share one material
     """
 
     materials = context['materials']
-    rgb_re = re.compile('^\s*rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,(\d+)\s*\)\s*$')
 
     if color in materials:
         return materials[color]
 
     diff = None
     if color.startswith('#'):
-        color = color[1:]
+        code = color[1:]
 
-        if len(color) == 3:
-            color = color[0] * 2 + color[1] * 2 + color[2] * 2
+        if len(code) == 3:
+            code = code[0] * 2 + code[1] * 2 + code[2] * 2
 
-        diff = (int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16))
+        diff = (int(code[0:2], 16), int(code[2:4], 16), int(code[4:6], 16))
     elif color in svg_colors.SVGColors:
         diff = svg_colors.SVGColors[color]
-    elif rgb_re.match(color):
-        c = rgb_re.findall(color)[0]
+    elif SVGRGBColor.match(color):
+        c = SVGRGBColor.findall(color)[0]
         diff = (float(c[0]), float(c[1]), float(c[2]))
     else:
+        materials[color] = None
         return None
 
+    diff = tuple(diff)
+    if diff in materials:
+        mat = materials[color] = materials[diff]
+        return mat
+
     diffuse_color = ([x / 255.0 for x in diff])
 
     if context['do_colormanage']:
@@ -227,6 +276,7 @@ def SVGGetMaterial(color, context):
     mat.diffuse_color = (*diffuse_color, 1.0)
 
     materials[color] = mat
+    materials[diff] = mat
 
     return mat
 
@@ -325,49 +375,67 @@ SVGTransforms = {'translate': SVGTransformTranslate,
                  'rotate': SVGTransformRotate}
 
 
+def SVGParseStyleString(style, context):
+    """
+    Parse value of style attribute
+    """
+
+    styles = SVGEmptyStyles.copy()
+
+    elems = style.split(';')
+    for elem in elems:
+        s = elem.split(':')
+
+        if len(s) != 2:
+            continue
+
+        name = s[0].strip().lower()
+        val = s[1].strip()
+
+        if name == 'fill':
+            val = val.lower()
+            if val == 'none':
+                styles['useFill'] = False
+            else:
+                styles['useFill'] = True
+                styles['fill'] = SVGGetMaterial(val, context)
+
+    if styles['useFill'] is None:
+        styles['useFill'] = True
+        styles['fill'] = SVGGetMaterial('#000', context)
+
+    return styles
+
+
 def SVGParseStyles(node, context):
     """
     Parse node to get different styles for displaying geometries
     (materials, filling flags, etc..)
-    """
 
-    styles = SVGEmptyStyles.copy()
+    Styles are shared between nodes with the same style attribute,
+    they must not be modified
+    """
 
     style = node.getAttribute('style')
     if style:
-        elems = style.split(';')
-        for elem in elems:
-            s = elem.split(':')
+        parsed_styles = context['parsed_styles']
 
-            if len(s) != 2:
-                continue
+        styles = parsed_styles.get(style)
+        if styles is None:
+            styles = parsed_styles[style] = SVGParseStyleString(style, context)
 
-            name = s[0].strip().lower()
-            val = s[1].strip()
+        return styles
 
-            if name == 'fill':
-                val = val.lower()
-                if val == 'none':
-                    styles['useFill'] = False
-                else:
-                    styles['useFill'] = True
-                    styles['fill'] = SVGGetMaterial(val, context)
+    styles = SVGEmptyStyles.copy()
 
-        if styles['useFill'] is None:
+    fill = node.getAttribute('fill')
+    if fill:
+        fill = fill.lower()
+        if fill == 'none':
+            styles['useFill'] = False
+        else:
             styles['useFill'] = True
-            styles['fill'] = SVGGetMaterial('#000', context)
-
-        return styles
-
-    if styles['useFill'] is None:
-        fill = node.getAttribute('fill')
-        if fill:
-            fill = fill.lower()
-            if fill == 'none':
-                styles['useFill'] = False
-            else:
-                styles['useFill'] = True
-                styles['fill'] = SVGGetMaterial(fill, context)
+            styles['fill'] = SVGGetMaterial(fill, context)
 
     if styles['useFill'] is None and context['style']:
         styles = context['style'].copy()
@@ -403,33 +471,9 @@ class SVGPathData:
         d - the definition of the outline of a shape
         """
 
-        spaces = ' ,\t'
-        commands = {'m', 'l', 'h', 'v', 'c', 's', 'q', '', 't', 'a', 'z'}
-        tokens = []
-
-        i = 0
-        n = len(d)
-        while i < n:
-            c = d[i]
-
-            if c in spaces:
-                pass
-            elif c.lower() in commands:
-                tokens.append(c)
-            elif c in ['-', '.'] or c.isdigit():
-                token, last_char = read_float(d, i)
-                tokens.append(token)
-
-                # in most cases len(token) and (last_char - i) are the same
-                # but with whitespace or ',' prefix they are not.
-
-                i += (last_char - i) - 1
-
-            i += 1
-
-        self._data = tokens
+        self._data = parse_path_tokens(d)
         self._index = 0
-        self._len = len(tokens)
+        self._len = len(self._data)
 
     def eof(self):
         """
@@ -1071,20 +1115,27 @@ class SVGGeometryContainer(SVGGeometry):
     def parse(self):
         """
         Parse XML node to memory
+
+        Child geometries are added by the loader while it reads
+        the file, until finishParse() is called
         """
 
-        if type(self._node) is xml.dom.minidom.Element:
+        if self._node is not None:
             self._styles = SVGParseStyles(self._node, self._context)
 
         self._pushStyle(self._styles)
 
-        for node in self._node.childNodes:
-            if type(node) is not xml.dom.minidom.Element:
-                continue
+    def addGeometry(self, geom):
+        """
+        Add parsed child geometry
+        """
 
-            ob = parseAbstractNode(node, self._context)
-            if ob is not None:
-                self._geometries.append(ob)
+        self._geometries.append(geom)
+
+    def finishParse(self):
+        """
+        All child geometries are parsed
+        """
 
         self._popStyle()
 
@@ -1153,12 +1204,18 @@ class SVGGeometryPATH(SVGGeometry):
         else:
             cu.dimensions = '3D'
 
+        handle_types = {item.identifier: item.value for item in
+                        bpy.types.BezierSplinePoint.bl_rna.properties['handle_left_type'].enum_items}
+
         for spline in self._splines:
-            act_spline = None
+            points = spline['points']
+
+            if not points:
+                continue
 
-            if spline['closed'] and len(spline['points']) >= 2:
-                first = spline['points'][0]
-                last = spline['points'][-1]
+            if spline['closed'] and len(points) >= 2:
+                first = points[0]
+                last = points[-1]
                 if (    first['handle_left_type'] == 'FREE' and
                         last['handle_right_type'] == 'VECTOR'):
                     last['handle_right_type'] = 'FREE'
@@ -1168,29 +1225,39 @@ class SVGGeometryPATH(SVGGeometry):
                     first['handle_left_type'] = 'FREE'
                     first['handle_left'] = (first['x'], first['y'])
 
-            for point in spline['points']:
-                co = self._transformCoord((point['x'], point['y']))
+            # Handles which are not specified are calculated by Blender
+            # from their type, start them at the point itself
+            co = []
+            handles_left = []
+            handles_right = []
 
-                if act_spline is None:
-                    cu.splines.new('BEZIER')
+            for point in points:
+                point_co = self._transformCoord((point['x'], point['y']))
+                co.extend(point_co)
 
-                    act_spline = cu.splines[-1]
-                    act_spline.use_cyclic_u = spline['closed']
-                else:
-                    act_spline.bezier_points.add(1)
+                handle = point['handle_left']
+                handles_left.extend(point_co if handle is None else self._transformCoord(handle))
+
+                handle = point['handle_right']
+                handles_right.extend(point_co if handle is None else self._transformCoord(handle))
 
-                bezt = act_spline.bezier_points[-1]
-                bezt.co = co
+            act_spline = cu.splines.new('BEZIER')
+            act_spline.use_cyclic_u = spline['closed']
 
-                bezt.handle_left_type = point['handle_left_type']
-                if point['handle_left'] is not None:
-                    handle = point['handle_left']
-                    bezt.handle_left = self._transformCoord(handle)
+            bezier_points = act_spline.bezier_points
+            bezier_points.add(len(points) - 1)
+            bezier_points.foreach_set('co', co)
+            bezier_points.foreach_set('handle_left', handles_left)
+            bezier_points.foreach_set('handle_right', handles_right)
 
-                bezt.handle_right_type = point['handle_right_type']
-                if point['handle_right'] is not None:
-                    handle = point['handle_right']
-                    bezt.handle_right = self._transformCoord(handle)
+            bezier_points.foreach_set('handle_left_type',
+                                      [handle_types[point['handle_left_type']] for point in points])
+            bezier_points.foreach_set('handle_right_type',
+                                      [handle_types[point['handle_right_type']] for point in points])
+
+            # foreach_set() does not update the spline, assigning a handle type
+            # recalculates all its VECTOR and AUTO handles once
+            bezier_points[0].handle_left_type = points[0]['handle_left_type']
 
         SVGFinishCurve()
 
@@ -1806,7 +1873,7 @@ class SVGLoader(SVGGeometryContainer):
         collection = bpy.data.collections.new(name=svg_name)
         scene.collection.children.link(collection)
 
-        node = xml.dom.minidom.parse(filepath)
+        self._filepath = filepath
 
         m = Matrix()
         m = m @ Matrix.Scale(1.0 / 90.0 * 0.3048 / 12.0, 4, Vector((1.0, 0.0, 0.0)))
@@ -1820,12 +1887,56 @@ class SVGLoader(SVGGeometryContainer):
                          'rect': rect,
                          'matrix': m,
                          'materials': {},
+                         'parsed_styles': {},
                          'styles': [None],
                          'style': None,
                          'do_colormanage': do_colormanage,
                          'collection': collection}
 
-        super().__init__(node, self._context)
+        super().__init__(None, self._context)
+
+    def parse(self):
+        """
+        Read SVG file and parse its elements as soon as they are started
+
+        Elements are dropped when they end, geometries only keep
+        attributes of their nodes. Defined elements (defs, symbols, ids)
+        stay reachable from geometries for USE nodes.
+        """
+
+        super().parse()
+
+        # Containers of the currently open elements,
+        # None for elements which children are not parsed
+        containers = [self]
+        elements = []
+
+        with open(self._filepath, 'rb') as f:
+            for event, element in ElementTree.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    container = containers[-1]
+                    ob = None
+
+                    if container is not None:
+                        ob = parseAbstractNode(SVGNode(element), self._context)
+                        if ob is not None:
+                            container.addGeometry(ob)
+
+                    if not isinstance(ob, SVGGeometryContainer):
+                        ob = None
+
+                    containers.append(ob)
+                    elements.append(element)
+                else:
+                    container = containers.pop()
+                    if container is not None:
+                        container.finishParse()
+
+                    elements.pop()
+                    if elements:
+                        del elements[-1][-1]
+
+        super().finishParse()
 
 
 svgGeometryClasses = {
@@ -1880,7 +1991,7 @@ def load(operator, context, filepath=""):
     do_colormanage = context.scene.display_settings.display_device != 'NONE'
     try:
         load_svg(context, filepath, do_colormanage)
-    except (xml.parsers.expat.ExpatError, UnicodeEncodeError) as e:
+    except (ElementTree.ParseError, UnicodeEncodeError) as e:
         import traceback
         traceback.print_exc()
 
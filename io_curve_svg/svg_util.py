@@ -50,19 +50,30 @@ match_first_comma = r"^\s*(?=,)"
 match_comma_pair = r",\s*(?=,)"
 match_last_comma = r",\s*$"
 
-match_number_optional_parts = r"(-?\d+(\.\d*)?([eE][-+]?\d+)?)|(-?\.\d+([eE][-+]?\d+)?)"
+match_number_optional_parts = r"-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|-?\.\d+(?:[eE][-+]?\d+)?"
 re_match_number_optional_parts = re.compile(match_number_optional_parts)
 
 array_of_floats_pattern = f"({match_number_optional_parts})|{match_first_comma}|{match_comma_pair}|{match_last_comma}"
 re_array_of_floats_pattern = re.compile(array_of_floats_pattern)
 
+# Path data is a sequence of command letters and numbers, everything else is a separator.
+path_tokens_pattern = f"[MmLlHhVvCcSsQqTtAaZz]|{match_number_optional_parts}"
+re_path_tokens_pattern = re.compile(path_tokens_pattern)
+
 def parse_array_of_floats(text):
     """
     Accepts comma or space separated list of floats (without units) and returns an array
     of floating point values.
     """
     elements = re_array_of_floats_pattern.findall(text)
-    return [value_to_float(v[0]) for v in elements]
+    return [value_to_float(v) for v in elements]
+
+
+def parse_path_tokens(text):
+    """
+    Splits path data into a list of tokens: command letters and numbers (as strings).
+    """
+    return re_path_tokens_pattern.findall(text)
 
 
 def read_float(text: str, start_index: int = 0):
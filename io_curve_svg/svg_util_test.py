@@ -24,9 +24,9 @@
 # XXX Not really nice, but that hack is needed to allow execution of that test
 #     from both automated CTest and by directly running the file manually.
 if __name__ == '__main__':
-    from svg_util import (parse_array_of_floats, read_float, parse_coord,)
+    from svg_util import (parse_array_of_floats, read_float, parse_coord, parse_path_tokens,)
 else:
-    from .svg_util import (parse_array_of_floats, read_float, parse_coord,)
+    from .svg_util import (parse_array_of_floats, read_float, parse_coord, parse_path_tokens,)
 import unittest
 
 class ParseArrayOfFloatsTest(unittest.TestCase):
@@ -179,5 +179,24 @@ class ParseCoordTest(unittest.TestCase):
         self.assertEqual(parse_coord("1.2%", 200), 2.4)
 
 
+class ParsePathTokensTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(parse_path_tokens(""), [])
+        self.assertEqual(parse_path_tokens(" ,\t\n"), [])
+
+    def test_commands_and_values(self):
+        self.assertEqual(parse_path_tokens("M 10,20 L30 40z"),
+                         ['M', '10', '20', 'L', '30', '40', 'z'])
+
+    def test_sign_as_separator(self):
+        self.assertEqual(parse_path_tokens("m1-2.5-3"), ['m', '1', '-2.5', '-3'])
+
+    def test_decimal_as_separator(self):
+        self.assertEqual(parse_path_tokens("l.5.5-.5"), ['l', '.5', '.5', '-.5'])
+
+    def test_scientific_value(self):
+        self.assertEqual(parse_path_tokens("h1e-3v2E+2"), ['h', '1e-3', 'v', '2E+2'])
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
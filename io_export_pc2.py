@@ -49,6 +49,7 @@ from os import remove
 import time
 import math
 import struct
+import numpy as np
 
 
 def get_sampled_frames(start, end, sampling):
@@ -81,6 +82,8 @@ def do_export(context, props, filepath):
     file = open(filepath, "wb")
     file.write(headerStr)
 
+    co = np.empty(vertCount * 3, dtype=np.float32)
+
     for frame in sampletimes:
         # stupid modf() gives decimal part first!
         sc.frame_set(int(frame[1]), subframe=frame[0])
@@ -106,11 +109,8 @@ def do_export(context, props, filepath):
         if props.rot_x90:
             me.transform(mat_x90)
 
-        for v in me.vertices:
-            thisVertex = struct.pack('<fff', float(v.co[0]),
-                                     float(v.co[1]),
-                                     float(v.co[2]))
-            file.write(thisVertex)
+        me.vertices.foreach_get("co", co)
+        co.astype('<f4').tofile(file)
 
     if apply_modifiers:
         ob.evaluated_get(depsgraph).to_mesh_clear()
@@ -31,11 +31,11 @@ from .color import aci_to_true_color
 
 
 def read(stream, options=None):
-    if hasattr(stream, 'readline'):
+    if hasattr(stream, 'read'):
         from .drawing import Drawing
         return Drawing(stream, options)
     else:
-        raise AttributeError('stream object requires a readline() method.')
+        raise AttributeError('stream object requires a read() method.')
 
 
 def readfile(filename, options=None):
@@ -5,13 +5,14 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
-from .tags import stream_tagger
+from .tags import RawTags
 from .sections import Sections
 
 DEFAULT_OPTIONS = {
     "grab_blocks": True,  # import block definitions True=yes, False=No
     "assure_3d_coords": False,  # guarantees (x, y, z) tuples for ALL coordinates
     "resolve_text_styles": True,  # Text, Attrib, Attdef and MText attributes will be set by the associated text style if necessary
+    "skip_sections": (),  # names of sections to ignore, e.g. ('OBJECTS', 'ACDSDATA')
 }
 
 
@@ -23,26 +24,30 @@ class Drawing(object):
         self.assure_3d_coords = options.get('assure_3d_coords', False)
         self.resolve_text_styles = options.get('resolve_text_styles', True)
 
-        tagreader = stream_tagger(stream, self.assure_3d_coords)
+        skip_sections = set(options.get('skip_sections', ()))
+        if not self.grab_blocks:
+            skip_sections.add('BLOCKS')
+
+        raw_tags = RawTags.from_stream(stream)
         self.dxfversion = 'AC1009'
         self.encoding = 'cp1252'
         self.filename = None
-        sections = Sections(tagreader, self)
+        self._sab_data = None
+        sections = Sections(raw_tags, self, skip_sections)
         self.header = sections.header
         self.layers = sections.tables.layers
         self.styles = sections.tables.styles
         self.linetypes = sections.tables.linetypes
         self.blocks = sections.blocks
-        self.entities = sections.entities
+        self.entities = sections.entities  # entities are built on demand
         self.objects = sections.objects if ('objects' in sections) else []
         if 'acdsdata' in sections:
             self.acdsdata = sections.acdsdata
             # sab data introduced with DXF version AC1027 (R2013)
-            if self.dxfversion >= 'AC1027':
-                self.collect_sab_data()
+            if self.dxfversion >= 'AC1027' and 'ACDSDATA' not in skip_sections:
+                self._sab_data = self.acdsdata.sab_data
 
         if self.resolve_text_styles:
-            resolve_text_styles(self.entities, self.styles)
             for block in self.blocks:
                 resolve_text_styles(block, self.styles)
 
@@ -52,11 +57,12 @@ class Drawing(object):
     def paperspace(self):
         return (entity for entity in self.entities if entity.paperspace)
 
-    def collect_sab_data(self):
-        for entity in self.entities:
-            if hasattr(entity, 'set_sab_data'):
-                sab_data = self.acdsdata.sab_data[entity.handle]
-                entity.set_sab_data(sab_data)
+    def prepare_entity(self, entity):
+        """ Called for each entity of the ENTITIES and OBJECTS sections when it is built. """
+        if self.resolve_text_styles and hasattr(entity, 'resolve_text_style'):
+            entity.resolve_text_style(self.styles)
+        if self._sab_data is not None and hasattr(entity, 'set_sab_data'):
+            entity.set_sab_data(self._sab_data[entity.handle])
 
 
 def resolve_text_styles(entities, text_styles):
@@ -17,6 +17,7 @@ class EntitySection(object):
 
     def __init__(self):
         self._entities = list()
+        self._builder = None  # generator of not yet built entities
 
     @classmethod
     def from_tags(cls, tags, drawing):
@@ -24,18 +25,43 @@ class EntitySection(object):
         entity_section._build(tags)
         return entity_section
 
+    @classmethod
+    def from_raw_tags(cls, raw_tags, start, end, drawing):
+        """ Entities are built on demand from the uncast tags of the section in index range [start, end). """
+        entity_section = cls()
+        groups = raw_tags.iter_groups(start + 2, end - 1, drawing.assure_3d_coords)
+        entity_section._builder = iter_entities(groups, drawing.prepare_entity)
+        return entity_section
+
     def get_entities(self):
+        self._build_all()
         return self._entities
 
     # start of public interface
 
     def __len__(self):
+        self._build_all()
         return len(self._entities)
 
     def __iter__(self):
-        return iter(self._entities)
+        # builds entities while iterating, already built entities are reused by following iterations
+        index = 0
+        while True:
+            if index < len(self._entities):
+                entity = self._entities[index]
+            elif self._builder is None:
+                return
+            else:
+                entity = next(self._builder, None)
+                if entity is None:
+                    self._builder = None
+                    return
+                self._entities.append(entity)
+            index += 1
+            yield entity
 
     def __getitem__(self, index):
+        self._build_all()
         return self._entities[index]
 
     # end of public interface
@@ -46,12 +72,21 @@ class EntitySection(object):
         groups = TagGroups(islice(tags, 2, len(tags)-1))
         self._entities = build_entities(groups)
 
+    def _build_all(self):
+        if self._builder is not None:
+            self._entities.extend(self._builder)
+            self._builder = None
+
 
 class ObjectsSection(EntitySection):
     name = 'objects'
 
 
 def build_entities(tag_groups):
+    return list(iter_entities(tag_groups))
+
+
+def iter_entities(tag_groups, prepare_entity=None):
     def build_entity(group):
         try:
             entity = entity_factory(Tags(group))
@@ -59,7 +94,6 @@ def build_entities(tag_groups):
             entity = None  # ignore unsupported entities
         return entity
 
-    entities = list()
     collector = None
     for group in tag_groups:
         entity = build_entity(group)
@@ -67,17 +101,20 @@ def build_entities(tag_groups):
             if collector:
                 if entity.dxftype == 'SEQEND':
                     collector.stop()
-                    entities.append(collector.entity)
+                    entity = collector.entity
                     collector = None
                 else:
                     collector.append(entity)
+                    continue
             elif entity.dxftype in ('POLYLINE', 'POLYFACE', 'POLYMESH'):
                 collector = _Collector(entity)
+                continue
             elif entity.dxftype == 'INSERT' and entity.attribsfollow:
                 collector = _Collector(entity)
-            else:
-                entities.append(entity)
-    return entities
+                continue
+            if prepare_entity is not None:
+                prepare_entity(entity)
+            yield entity
 
 
 class _Collector:
@@ -6,7 +6,7 @@ from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
 from .codepage import toencoding
-from .defaultchunk import DefaultChunk, iterchunks
+from .defaultchunk import DefaultChunk
 from .headersection import HeaderSection
 from .tablessection import TablesSection
 from .entitysection import EntitySection, ObjectsSection
@@ -15,10 +15,10 @@ from .acdsdata import AcDsDataSection
 
 
 class Sections(object):
-    def __init__(self, tagreader, drawing):
+    def __init__(self, raw_tags, drawing, skip_sections=()):
         self._sections = {}
         self._create_default_sections()
-        self._setup_sections(tagreader, drawing)
+        self._setup_sections(raw_tags, drawing, skip_sections)
 
     def __contains__(self, name):
         return name in self._sections
@@ -29,23 +29,22 @@ class Sections(object):
             section = cls()
             self._sections[section.name] = section
 
-    def _setup_sections(self, tagreader, drawing):
-        def name(section):
-            return section[1].value
-
-        for section in iterchunks(tagreader, stoptag='EOF', endofchunk='ENDSEC'):
-            if name(section) == 'HEADER':
-                new_section = HeaderSection.from_tags(section)
+    def _setup_sections(self, raw_tags, drawing, skip_sections):
+        for section_name, start, end in raw_tags.section_index():
+            if section_name == 'HEADER':
+                new_section = HeaderSection.from_tags(raw_tags.tags(start, end, drawing.assure_3d_coords))
                 drawing.dxfversion = new_section.get('$ACADVER', 'AC1009')
                 codepage = new_section.get('$DWGCODEPAGE', 'ANSI_1252')
                 drawing.encoding = toencoding(codepage)
-            else:
-                section_name = name(section)
-                if section_name in SECTIONMAP:
-                    section_class = get_section_class(section_name)
-                    new_section = section_class.from_tags(section, drawing)
+            elif section_name in SECTIONMAP and section_name not in skip_sections:
+                section_class = get_section_class(section_name)
+                if hasattr(section_class, 'from_raw_tags'):  # builds its content on demand
+                    new_section = section_class.from_raw_tags(raw_tags, start, end, drawing)
                 else:
-                    new_section = None
+                    new_section = section_class.from_tags(raw_tags.tags(start, end, drawing.assure_3d_coords),
+                                                          drawing)
+            else:  # unsupported or unneeded sections are not even cast
+                new_section = None
             if new_section is not None:
                 self._sections[new_section.name] = new_section
 
@@ -12,6 +12,7 @@ from array import array
 
 from io import StringIO
 from collections import namedtuple
+from functools import partial
 from itertools import chain, islice
 from . import tostr
 
@@ -123,63 +124,243 @@ cast_tag = _TagCaster.cast
 cast_tag_value = _TagCaster.cast_value
 
 
-def stream_tagger(stream, assure_3d_coords=False):
-    """ Generates DXFTag() from a stream (untrusted external source). Does not skip comment tags 999.
+STREAM_CHUNK_SIZE = 1 << 20  # characters read from the stream at once
+ENTITY_BATCH_SIZE = 4096  # tag groups cast at once by RawTags.iter_groups()
+
+
+def _build_fast_casters():
+    """ Casters indexed by group code for the batch conversion, point x coordinates are cast to float like their
+    y and z coordinates. The table has a tail of tostr entries so that negative group codes, which index the table
+    from its end, keep their string values.
     """
-    class Counter:
-        def __init__(self):
-            self.counter = 0
-
-    undo_tag = None
-    line = Counter()  # writeable line counter for next_tag(), Python 2.7 does not support the nonlocal statement
-
-    def next_tag():
-        code = stream.readline()
-        value = stream.readline()
-        line.counter += 2
-        if code and value:  # StringIO(): empty strings indicates EOF
-            return DXFTag(int(code.rstrip('\r\n')), value.rstrip('\r\n'))  # without line ending
-        else:  # StringIO(): empty lines indicates EOF
-            raise EOFError()
+    table = [tostr] * 1100
+    for caster, codes in TYPES:
+        if caster is point_tuple or caster is to_float_with_infinite:
+            caster = float
+        for code in codes:
+            table[code] = caster
+    return table
+
+_FAST_CASTERS = _build_fast_casters()
 
+
+def _iter_line_chunks(stream, chunk_size=STREAM_CHUNK_SIZE):
+    """ Reads stream in large chunks and yields lists of lines without line endings. Every list contains an even
+    number of lines (complete tags), an incomplete tag at the end of the stream is ignored.
+    """
+    rest = ''
     while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        data = rest + data
+        lines = data.split('\n')
+        if len(lines) % 2 == 0:  # odd number of complete lines, keep the last code line for the next chunk
+            rest = lines[-2] + '\n' + lines[-1]
+            del lines[-2:]
+        else:
+            rest = lines.pop()
+        if '\r' in data:
+            lines = [line.rstrip('\r') for line in lines]
+        if lines:
+            yield lines
+    lines = rest.split('\n')
+    if len(lines) == 2 and lines[1]:  # last value without line ending
+        yield [lines[0].rstrip('\r'), lines[1].rstrip('\r')]
+
+
+def _parse_codes(lines, first_line):
+    try:
+        return list(map(int, lines))
+    except ValueError:
+        for index, line in enumerate(lines):
+            try:
+                int(line)
+            except ValueError:
+                raise DXFStructureError('Invalid group code "{code}" near line: {line}.'.format(
+                    code=line,
+                    line=first_line + 2 * index,
+                ))
+        raise
+
+
+def _cast_values(codes, values, first_line):
+    """ Casts all values at once, values which need special treatment are cast one by one. """
+    casters = _FAST_CASTERS
+    if codes and min(codes) >= 0:
+        try:
+            return [casters[code](value) for code, value in zip(codes, values)]
+        except (ValueError, IndexError):
+            pass
+
+    result = []
+    append = result.append
+    for index, (code, value) in enumerate(zip(codes, values)):
+        try:
+            append(casters[code](value) if code >= 0 else tostr(value))
+            continue
+        except (ValueError, IndexError):
+            pass
         try:
-            if undo_tag is not None:
-                x = undo_tag
-                undo_tag = None
-            else:
-                x = next_tag()
-            code = x.code
-            if code == 999:  # skip comments
-                continue
             if code in POINT_CODES:
-                y = next_tag()  # y coordinate is mandatory
-                if y.code != code + 10:
-                    raise DXFStructureError("Missing required y coordinate near line: {}.".format(line.counter))
-                z = next_tag()  # z coordinate just for 3d points
-                try:
-                    if z.code == code + 20:
-                        point = (float(x.value), float(y.value), float(z.value))
-                    else:
-                        if assure_3d_coords:
-                            point = (float(x.value), float(y.value), 0.)
-                        else:
-                            point = (float(x.value), float(y.value))
-                        undo_tag = z
-                except ValueError:
-                    raise DXFStructureError('Invalid floating point values near line: {}.'.format(line.counter))
-                yield DXFTag(code, point)
-            else:  # just a single tag
-                try:
-                    yield cast_tag(x)
-                except ValueError:
-                    raise DXFStructureError('Invalid tag (code={code}, value="{value}") near line: {line}.'.format(
-                        line=line.counter,
-                        code=x.code,
-                        value=x.value,
-                    ))
-        except EOFError:
-            return
+                append(to_float_with_infinite(value))
+            else:
+                append(cast_tag_value(code, value))
+        except ValueError:
+            raise DXFStructureError('Invalid tag (code={code}, value="{value}") near line: {line}.'.format(
+                line=first_line + 2 * index,
+                code=code,
+                value=value,
+            ))
+    return result
+
+
+_new_tag = partial(tuple.__new__, DXFTag)  # DXFTag() from a (code, value) tuple
+_ASSEMBLED_CODES = POINT_CODES | frozenset([999])
+
+
+def _assemble_tags(codes, values, first_line, assure_3d_coords=False, final=True):
+    """ Creates DXFTag() from cast codes and values, joins point coordinates and skips comment tags 999.
+
+    Returns the tags and the count of consumed codes. If not final, a point at the end of the input is left
+    unconsumed, because its coordinates could continue in the next chunk.
+    """
+    tag_codes = []
+    tag_values = []
+    count = len(codes)
+    index = 0
+    for special in [i for i, code in enumerate(codes) if code in _ASSEMBLED_CODES]:
+        if special < index:
+            continue
+        tag_codes.extend(codes[index:special])  # just single tags
+        tag_values.extend(values[index:special])
+        index = special
+        code = codes[index]
+        if code == 999:  # skip comments
+            index += 1
+            continue
+        if index + 2 >= count and not final:
+            break
+        if index + 1 >= count or codes[index + 1] != code + 10:  # y coordinate is mandatory
+            raise DXFStructureError("Missing required y coordinate near line: {}.".format(first_line + 2 * index))
+        tag_codes.append(code)
+        if index + 2 < count and codes[index + 2] == code + 20:  # z coordinate just for 3d points
+            tag_values.append((values[index], values[index + 1], values[index + 2]))
+            index += 3
+        else:
+            if assure_3d_coords:
+                tag_values.append((values[index], values[index + 1], 0.))
+            else:
+                tag_values.append((values[index], values[index + 1]))
+            index += 2
+    else:
+        tag_codes.extend(codes[index:])
+        tag_values.extend(values[index:])
+        index = count
+    return list(map(_new_tag, zip(tag_codes, tag_values))), index
+
+
+def stream_tagger(stream, assure_3d_coords=False):
+    """ Generates DXFTag() from a stream (untrusted external source). Skips comment tags 999.
+
+    The stream is read in large chunks, the tags of each chunk are cast at once.
+    """
+    codes = []
+    values = []
+    first_line = 1
+    chunks = _iter_line_chunks(stream)
+    final = False
+    while not final:
+        lines = next(chunks, None)
+        if lines is None:
+            final = True
+        else:
+            codes.extend(_parse_codes(lines[0::2], first_line + 2 * len(codes)))
+            values.extend(lines[1::2])
+        cast_values = _cast_values(codes, values, first_line)
+        tags, consumed = _assemble_tags(codes, cast_values, first_line, assure_3d_coords, final)
+        for tag in tags:
+            yield tag
+        first_line += 2 * consumed
+        del codes[:consumed]
+        del values[:consumed]
+
+
+class RawTags(object):
+    """ Tags of a whole DXF stream as group codes and uncast value strings.
+
+    Tags are cast on demand by index range, so sections and entities can be located without casting the tags
+    of the whole stream.
+    """
+    def __init__(self, codes, values):
+        self.codes = codes
+        self.values = values
+
+    @staticmethod
+    def from_stream(stream):
+        codes = []
+        values = []
+        for lines in _iter_line_chunks(stream):
+            codes.extend(_parse_codes(lines[0::2], 2 * len(codes) + 1))
+            values.extend(lines[1::2])
+        return RawTags(codes, values)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def tags(self, start=0, end=None, assure_3d_coords=False):
+        """ Returns the cast tags of index range [start, end) as Tags(). """
+        codes = self.codes[start:end]
+        first_line = 2 * start + 1
+        values = _cast_values(codes, self.values[start:end], first_line)
+        tags, _ = _assemble_tags(codes, values, first_line, assure_3d_coords)
+        return Tags(tags)
+
+    def find(self, code, value, start=0, end=None):
+        """ Returns index of first tag (code, value) in index range [start, end) or None. """
+        if end is None:
+            end = len(self.values)
+        values = self.values
+        codes = self.codes
+        while True:
+            try:
+                index = values.index(value, start, end)
+            except ValueError:
+                return None
+            if codes[index] == code:
+                return index
+            start = index + 1
+
+    def section_index(self):
+        """ Returns a list of (name, start, end) for all sections, start is the index of DXFTag(0, 'SECTION') and
+        end the index behind DXFTag(0, 'ENDSEC').
+        """
+        index = []
+        eof = self.find(0, 'EOF')
+        start = self.find(0, 'SECTION', 0, eof)
+        while start is not None:
+            end = self.find(0, 'ENDSEC', start, eof)
+            if end is None:
+                raise DXFStructureError("Missing DXFTag(0, 'ENDSEC') for section near line: {}.".format(
+                    2 * start + 1))
+            index.append((self.values[start + 1], start, end + 1))
+            start = self.find(0, 'SECTION', end + 1, eof)
+        return index
+
+    def group_index(self, start, end, split_code=0):
+        """ Returns indices of all split tags in index range [start, end). """
+        codes = self.codes
+        return [index for index in range(start, end) if codes[index] == split_code]
+
+    def iter_groups(self, start, end, assure_3d_coords=False, split_code=0, batch_size=ENTITY_BATCH_SIZE):
+        """ Yields the tag groups of index range [start, end) like TagGroups(), casts batch_size groups at once.
+        """
+        group_starts = self.group_index(start, end, split_code)
+        group_starts.append(end)
+        for index in range(0, len(group_starts) - 1, batch_size):
+            batch_end = group_starts[min(index + batch_size, len(group_starts) - 1)]
+            for group in TagGroups(self.tags(group_starts[index], batch_end, assure_3d_coords), split_code):
+                yield group
 
 
 def string_tagger(s):
@@ -0,0 +1,146 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+
+def _flatten(points):
+    return [c for p in points for c in p]
+
+
+class SplineBatch:
+    """
+    Collects the POLY and BEZIER splines of a Blender curve as flat coordinate lists.
+    write() creates all splines at once and sets the coordinates of each spline with foreach_set().
+    """
+    def __init__(self):
+        self.splines = []  # (type, is_closed, co, handle_left, handle_right)
+
+    def __len__(self):
+        return len(self.splines)
+
+    def add_poly(self, points, is_closed=False):
+        """
+        points: list of (x,y,z)
+        """
+        co = []
+        for p in points:
+            co.extend((p[0], p[1], p[2], 1.0))
+        self.splines.append(("POLY", is_closed, co, None, None))
+
+    def add_bezier(self, handles_left, points, handles_right, is_closed=False):
+        """
+        handles_left, points, handles_right: lists of (x,y,z) of the same length
+        """
+        self.splines.append(("BEZIER", is_closed, _flatten(points), _flatten(handles_left), _flatten(handles_right)))
+
+    def write(self, curve):
+        """
+        curve: Blender curve data of type "CURVE" (object.data) to which the splines should be added to
+        """
+        for TYPE, is_closed, co, handle_left, handle_right in self.splines:
+            spline = curve.splines.new(TYPE)
+            spline.use_cyclic_u = is_closed
+            if TYPE == "POLY":
+                spline.use_smooth = False
+                spline.points.add(len(co) // 4 - 1)
+                spline.points.foreach_set("co", co)
+            else:
+                b = spline.bezier_points
+                b.add(len(co) // 3 - 1)
+                b.foreach_set("co", co)
+                b.foreach_set("handle_left", handle_left)
+                b.foreach_set("handle_right", handle_right)
+        self.splines = []
+
+    def is_3d(self):
+        """
+        True if any point (not handle) has a z coordinate != 0.
+        """
+        for TYPE, is_closed, co, handle_left, handle_right in self.splines:
+            step = 4 if TYPE == "POLY" else 3
+            if any(z != 0 for z in co[2::step]):
+                return True
+        return False
+
+
+class MeshBatch:
+    """
+    Collects vertices, edges and faces of a Blender mesh as flat lists.
+    write() creates all of them at once with foreach_set().
+    """
+    def __init__(self):
+        self.co = []
+        self.edges = []
+        self.loops = []
+        self.loop_totals = []
+        self.creases = {}  # key: (vertex index, vertex index) sorted -> value: edge crease
+
+    def __len__(self):
+        return len(self.co) // 3
+
+    def add_verts(self, points):
+        """
+        points: list of (x,y,z)
+        Returns the list of the new vertex indices.
+        """
+        start = len(self)
+        for p in points:
+            self.co.extend((p[0], p[1], p[2]))
+        return list(range(start, len(self)))
+
+    def add_edge(self, v1, v2, crease=None):
+        self.edges.extend((v1, v2))
+        if crease is not None:
+            self.creases[(v1, v2) if v1 < v2 else (v2, v1)] = crease
+
+    def add_face(self, verts):
+        self.loops.extend(verts)
+        self.loop_totals.append(len(verts))
+
+    def write(self, mesh):
+        """
+        mesh: Blender mesh data (object.data) that should be empty
+        """
+        mesh.vertices.add(len(self))
+        mesh.vertices.foreach_set("co", self.co)
+
+        mesh.edges.add(len(self.edges) // 2)
+        mesh.edges.foreach_set("vertices", self.edges)
+
+        loop_starts = []
+        start = 0
+        for total in self.loop_totals:
+            loop_starts.append(start)
+            start += total
+        mesh.loops.add(len(self.loops))
+        mesh.loops.foreach_set("vertex_index", self.loops)
+        mesh.polygons.add(len(self.loop_totals))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        mesh.polygons.foreach_set("loop_total", self.loop_totals)
+
+        mesh.update(calc_edges=True)
+        mesh.validate(clean_customdata=False)
+
+        if self.creases:
+            verts = [0] * (len(mesh.edges) * 2)
+            mesh.edges.foreach_get("vertices", verts)
+            creases = self.creases
+            mesh.edges.foreach_set("crease", [
+                creases.get((v1, v2) if v1 < v2 else (v2, v1), 0.0) for v1, v2 in zip(verts[0::2], verts[1::2])
+            ])
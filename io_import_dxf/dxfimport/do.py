@@ -28,6 +28,7 @@ import bmesh
 from .. import dxfgrabber
 from . import convert, is_, groupsort
 from .line_merger import line_merger
+from .batch import SplineBatch, MeshBatch
 from ..transverse_mercator import TransverseMercator
 
 
@@ -95,13 +96,15 @@ class Do:
         "dwg", "combination", "known_blocks", "import_text", "import_light", "export_acis", "merge_lines",
         "do_bounding_boxes", "acis_files", "errors", "block_representation", "recenter", "did_group_instance",
         "objects_before", "pDXF", "pScene", "thickness_and_width", "but_group_by_att", "current_scene",
-        "dxf_unit_scale"
+        "dxf_unit_scale", "spline_batches", "block_stats"
     )
 
     def __init__(self, dxf_filename, c=BY_LAYER, import_text=True, import_light=True, export_acis=True,
                  merge_lines=True, do_bbox=True, block_rep=LINKED_OBJECTS, recenter=False, pDXF=None, pScene=None,
                  thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0):
-        self.dwg = dxfgrabber.readfile(dxf_filename, {"assure_3d_coords": True})
+        # OBJECTS are never used and ACDSDATA only holds the ACIS data of R2013+ drawings
+        skip_sections = ("OBJECTS",) if export_acis else ("OBJECTS", "ACDSDATA")
+        self.dwg = dxfgrabber.readfile(dxf_filename, {"assure_3d_coords": True, "skip_sections": skip_sections})
         self.combination = c
         self.known_blocks = {}
         self.import_text = import_text
@@ -121,6 +124,8 @@ class Do:
         self.but_group_by_att = but_group_by_att
         self.current_scene = None
         self.dxf_unit_scale = dxf_unit_scale
+        self.spline_batches = {}
+        self.block_stats = {}
 
     def proj(self, co, elevation=0):
         """
@@ -188,39 +193,46 @@ class Do:
     """ GEOMETRY DXF TYPES TO BLENDER CURVES FILTERS"""
     # type(self, dxf entity, blender curve data)
 
+    def _spline_batch(self, curve):
+        """
+        curve: Blender curve data of type "CURVE"
+        Returns the SplineBatch collecting the splines of curve; object_curve() creates them all at once.
+        """
+        key = curve.as_pointer()
+        batch = self.spline_batches.get(key)
+        if batch is None:
+            batch = SplineBatch()
+            self.spline_batches[key] = batch
+        return batch
+
     def _cubic_bezier_closed(self, ptuple, curve):
-        count = (len(ptuple)-1)/3
         points = [ptuple[-2]]
         ptuples = ptuple[:-2]
         points += [p for p in ptuples]
 
-        spl = curve.splines.new('BEZIER')
-        spl.use_cyclic_u = True
-        b = spl.bezier_points
-        b.add(count - 1)
-        for i, j in enumerate(range(1, len(points), 3)):
-            b[i].handle_left = self.proj(points[j - 1])
-            b[i].co = self.proj(points[j])
-            b[i].handle_right = self.proj(points[j + 1])
+        handles_left = []
+        co = []
+        handles_right = []
+        for j in range(1, len(points), 3):
+            handles_left.append(self.proj(points[j - 1]))
+            co.append(self.proj(points[j]))
+            handles_right.append(self.proj(points[j + 1]))
+        self._spline_batch(curve).add_bezier(handles_left, co, handles_right, True)
 
     def _cubic_bezier_open(self, points, curve):
-        count = (len(points) - 1) / 3 + 1
-        spl = curve.splines.new('BEZIER')
-        b = spl.bezier_points
-        b.add(count - 1)
-
-        b[0].co = self.proj(points[0])
-        b[0].handle_left = self.proj(points[0])
-        b[0].handle_right = self.proj(points[1])
+        handles_left = [self.proj(points[0])]
+        co = [self.proj(points[0])]
+        handles_right = [self.proj(points[1])]
 
-        b[-1].co = self.proj(points[-1])
-        b[-1].handle_right = self.proj(points[-1])
-        b[-1].handle_left = self.proj(points[-2])
+        for j in range(3, len(points) - 2, 3):
+            handles_left.append(self.proj(points[j - 1]))
+            co.append(self.proj(points[j]))
+            handles_right.append(self.proj(points[j + 1]))
 
-        for i, j in enumerate(range(3, len(points) - 2, 3), 1):
-            b[i].handle_left = self.proj(points[j - 1])
-            b[i].co = self.proj(points[j])
-            b[i].handle_right = self.proj(points[j + 1])
+        handles_left.append(self.proj(points[-2]))
+        co.append(self.proj(points[-1]))
+        handles_right.append(self.proj(points[-1]))
+        self._spline_batch(curve).add_bezier(handles_left, co, handles_right, False)
 
     def _cubic_bezier(self, points, curve, is_closed):
         """
@@ -240,13 +252,7 @@ class Do:
         param elevation: float (lwpolyline code 38)
         is_closed: True / False to indicate if the polygon is open or closed
         """
-        p = curve.splines.new("POLY")
-        p.use_smooth = False
-        p.use_cyclic_u = is_closed
-        p.points.add(len(points) - 1)
-
-        for i, pt in enumerate(points):
-            p.points[i].co = self.proj(pt, elevation).to_4d()
+        self._spline_batch(curve).add_poly([self.proj(pt, elevation) for pt in points], is_closed)
 
     def _gen_poly(self, en, curve, elevation=0):
         if any([b != 0 for b in en.bulge]):
@@ -481,10 +487,10 @@ class Do:
     """ GEOMETRY DXF TYPES TO BLENDER MESHES FILTERS"""
     # type(self, dxf entity, blender bmesh data)
 
-    def _gen_meshface(self, points, bm):
+    def _gen_meshface(self, points, batch):
         """
         points: list of (x,y,z) tuples
-        bm: bmesh to add the (face-) points
+        batch: MeshBatch to add the (face-) points
         Used by the3dface() and solid()
         """
 
@@ -500,73 +506,67 @@ class Do:
             else:
                 i += 1
 
-        verts = []
-        for p in points:
-            verts.append(bm.verts.new(self.proj(p)))
+        co = [self.proj(p) for p in points]
+        verts = batch.add_verts(co)
 
         # add only an edge if len points < 3
         if len(points) == 2:
-            bm.edges.new(verts)
+            batch.add_edge(*verts)
         elif len(points) > 2:
-            face = bm.faces.new(verts)
+            faces = []
 
             if len(points) == 4:
                 for i in range(2):
-                    edge1 = verts[i].co
-                    edge2 = verts[i + 1].co
-                    opposite1 = verts[i + 2].co
-                    opposite2 = verts[(i + 3) % 4].co
+                    edge1 = co[i]
+                    edge2 = co[i + 1]
+                    opposite1 = co[i + 2]
+                    opposite2 = co[(i + 3) % 4]
                     ii = geometry.intersect_line_line(edge1, edge2, opposite1, opposite2)
                     if ii is not None:
                         if _is_on_edge(ii[0]):
-                            try:
-                                bm.faces.remove(face)
-                            except Exception as e:
-                                pass
-                            iv = bm.verts.new(ii[0])
-                            bm.faces.new((verts[i], iv, verts[(i + 3) % 4]))
-                            bm.faces.new((verts[i + 1], iv, verts[i + 2]))
-
-    def the3dface(self, en, bm):
+                            # replace the self intersecting face by two triangles
+                            iv = batch.add_verts([ii[0]])[0]
+                            faces.append((verts[i], iv, verts[(i + 3) % 4]))
+                            faces.append((verts[i + 1], iv, verts[i + 2]))
+
+            for face in faces or [verts]:
+                batch.add_face(face)
+
+    def the3dface(self, en, batch):
         """ f: dxf entity
-            bm: Blender bmesh data to which the 3DFACE should be added to.
-            <-? bm.from_mesh(object.data) ?->
+            batch: MeshBatch to which the 3DFACE should be added to.
         """
         if en.points[-1] == en.points[-2]:
             points = en.points[:3]
         else:
             points = en.points
-        self._gen_meshface(points, bm)
+        self._gen_meshface(points, batch)
 
-    def solid(self, en, bm):
+    def solid(self, en, batch):
         """ f: dxf entity
-            bm: Blender bmesh data to which the SOLID should be added to.
-            <-? bm.from_mesh(object.data) ?->
+            batch: MeshBatch to which the SOLID should be added to.
         """
         p = en.points
         points = (p[0], p[1], p[3], p[2])
-        self._gen_meshface(points, bm)
+        self._gen_meshface(points, batch)
 
-    def trace(self, en, bm):
-        self.solid(en, bm)
+    def trace(self, en, batch):
+        self.solid(en, batch)
 
-    def point(self, en, bm):
+    def point(self, en, batch):
         """
         en: DXF entity of type `POINT`
-        bm: Blender bmesh instance
+        batch: MeshBatch
         """
-        bm.verts.new(en.point)
+        batch.add_verts([en.point])
 
-    def polyface(self, en, bm):
+    def polyface(self, en, batch):
         """
         pf: polyface
-        bm: Blender bmesh data to which the POLYFACE should be added to.
-        <-? bm.from_mesh(object.data) ?->
+        batch: MeshBatch to which the POLYFACE should be added to.
         """
-        for v in en.vertices:
-            bm.verts.new(v.location)
+        verts = batch.add_verts([v.location for v in en.vertices])
 
-        bm.verts.ensure_lookup_table()
         for subface in en:
             idx = subface.indices()
             points = []
@@ -574,12 +574,12 @@ class Do:
                 if p not in points:
                     points.append(p)
             if len(points) in (3, 4):
-                bm.faces.new([bm.verts[i] for i in points])
+                batch.add_face([verts[i] for i in points])
 
-    def polymesh(self, en, bm):
+    def polymesh(self, en, batch):
         """
         en: POLYMESH entity
-        bm: Blender bmesh instance
+        batch: MeshBatch
         """
         mc = en.mcount if not en.is_mclosed else en.mcount + 1
         nc = en.ncount if not en.is_nclosed else en.ncount + 1
@@ -589,37 +589,33 @@ class Do:
             for j in range(1, nc):
                 j = j % en.ncount
                 j_ = (j - 1) % en.ncount
-                face = []
-                face.append(bm.verts.new(en.get_location((i_, j_))))
-                face.append(bm.verts.new(en.get_location((i, j_))))
-                face.append(bm.verts.new(en.get_location((i, j))))
-                face.append(bm.verts.new(en.get_location((i_, j))))
+                face = batch.add_verts((
+                    en.get_location((i_, j_)),
+                    en.get_location((i, j_)),
+                    en.get_location((i, j)),
+                    en.get_location((i_, j)),
+                ))
+                batch.add_face(face)
 
-                bm.faces.new(face)
-
-    def mesh(self, en, bm):
+    def mesh(self, en, batch):
         """
         mesh: dxf entity
-        m: Blender MESH data (object.data) to which the dxf-mesh should be added
+        batch: MeshBatch to which the dxf-mesh should be added
         """
         # verts:
-        for v in en.vertices:
-            bm.verts.new(v)
+        verts = batch.add_verts(en.vertices)
 
         # edges:
-        bm.verts.ensure_lookup_table()
         if any((c < 0 for c in en.edge_crease_list)):
-            layerkey = bm.edges.layers.crease.new("SubsurfCrease")
             for i, edge in enumerate(en.edges):
-                bme = bm.edges.new([bm.verts[edge[0]], bm.verts[edge[1]]])
-                bme[layerkey] = -en.edge_crease_list[i]
+                batch.add_edge(verts[edge[0]], verts[edge[1]], -en.edge_crease_list[i])
         else:
             for i, edge in enumerate(en.edges):
-                bm.edges.new([bm.verts[edge[0]], bm.verts[edge[1]]])
+                batch.add_edge(verts[edge[0]], verts[edge[1]])
 
         # faces:
         for face in en.faces:
-            bm.faces.new([bm.verts[i] for i in face])
+            batch.add_face([verts[i] for i in face])
 
     """ SEPARATE BLENDER OBJECTS FROM (CON)TEXT / STRUCTURE DXF TYPES """
     # type(self, dxf entity, name string)
@@ -1026,12 +1022,16 @@ class Do:
         """
         aunits = self.dwg.header.get('$AUNITS', 0)
 
-        # check if group instances are needed
-        kids = sum(1 for i in self.dwg.blocks[entity.name] if i.dxftype == "INSERT")
-        sep = sum(1 for sep in self.dwg.blocks[entity.name] if is_.separated_entity(sep))
-        objtypes = sum(1 for ot, ens in groupsort.by_blender_type(en for en in self.dwg.blocks[entity.name]
-                                                                  if is_.combined_entity(en))
-                       if ot in {"object_mesh", "object_curve"})
+        # check if group instances are needed; the block content is counted once for all its inserts
+        block_stats = self.block_stats.get(entity.name)
+        if block_stats is None:
+            block = self.dwg.blocks[entity.name]
+            kids = sum(1 for i in block if i.dxftype == "INSERT")
+            sep = sum(1 for sep in block if is_.separated_entity(sep))
+            objtypes = sum(1 for ot, ens in groupsort.by_blender_type(en for en in block if is_.combined_entity(en))
+                           if ot in {"object_mesh", "object_curve"})
+            block_stats = self.block_stats[entity.name] = (kids, sep, objtypes)
+        kids, sep, objtypes = block_stats
         if need_group_inst is None:
             need_group_inst = (entity.row_count or entity.col_count) > 1 and \
                               (kids > 0 or objtypes > 1 or sep > 1 or (objtypes > 0 and sep > 0))
@@ -1217,21 +1217,19 @@ class Do:
 
     def polys_to_mesh(self, entities, scene, name):
         d = bpy.data.meshes.new(name)
-        bm = bmesh.new()
+        batch = MeshBatch()
         m = Matrix(((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)))
         for en in entities:
             t = m
-            verts = []
             if is_.extrusion(en):
                 t = convert.extrusion_to_matrix(en)
-            for p in en.points:
-                verts.append(bm.verts.new(self.proj((t*Vector(p)).to_3d())))
+            verts = batch.add_verts([self.proj((t*Vector(p)).to_3d()) for p in en.points])
             if len(verts) > 2:
-                bm.faces.new(verts)
+                batch.add_face(verts)
             elif len(verts) == 2:
-                bm.edges.new(verts)
+                batch.add_edge(*verts)
 
-        bm.to_mesh(d)
+        batch.write(d)
         o = bpy.data.objects.new(name, d)
         scene.collection.objects.link(o)
         return o
@@ -1243,24 +1241,28 @@ class Do:
         Accumulates all entities into a Blender bmesh and returns a Blender object containing it.
         """
         d = bpy.data.meshes.new(name)
-        bm = bmesh.new()
+        batch = MeshBatch()
 
         i = 0
         for en in entities:
             i += 1
             if en.dxftype == "3DFACE":
-                self.the3dface(en, bm)
+                self.the3dface(en, batch)
             else:
                 dxftype = getattr(self, en.dxftype.lower(), None)
                 if dxftype is not None:
-                    dxftype(en, bm)
+                    dxftype(en, batch)
                 else:
                     self.errors.add(en.dxftype.lower() + " - unknown dxftype")
         if i > 0:
+            batch.write(d)
             if hasattr(en, "thickness"):
-                if en.thickness != 0:
+                if en.thickness != 0 and self.thickness_and_width:
+                    bm = bmesh.new()
+                    bm.from_mesh(d)
                     self._thickness(bm, en.thickness)
-            bm.to_mesh(d)
+                    bm.to_mesh(d)
+                    bm.free()
             o = bpy.data.objects.new(name, d)
             # for POLYFACE
             if hasattr(en, "extrusion"):
@@ -1295,8 +1297,15 @@ class Do:
         if len(lines) > 0:
             self._merge_lines(lines, d)
 
+        # the collected splines are created at once, after checking the ones created directly (e.g. circles)
+        batch = self.spline_batches.pop(d.as_pointer(), SplineBatch())
         if i > 0:
             self._check3D_object(d)
+            if batch.is_3d():
+                d.dimensions = '3D'
+        batch.write(d)
+
+        if i > 0:
             o = bpy.data.objects.new(name, d)
             self._thickness_and_width(o, en, scene)
             self._extrusion(o, en)
@@ -19,6 +19,11 @@
 # <pep8 compliant>
 
 
+from collections import deque
+from itertools import product
+from math import floor
+
+
 def line_merger(lines, precision=6):
     merger = _LineMerger(lines, precision)
     return merger.polylines
@@ -28,19 +33,75 @@ def _round_point(point, precision):
     return tuple(round(c, precision) for c in point)
 
 
+class _PointHash:
+    """
+    Spatial hash to merge points within tolerance of each other, even if they are rounded to different values.
+    Points get the id of the first added point within tolerance, self.points holds the rounded point of each id.
+    """
+    def __init__(self, precision):
+        self.precision = precision
+        self.tolerance = 10 ** -precision
+        self.cell_size = self.tolerance * 64
+        # cells are centered on multiples of cell_size, so that round coordinates (like z = 0 of 2D drawings)
+        # are far from cell borders, points within margin of their cell center need no neighbour cell search
+        self.margin = self.cell_size / 2 - self.tolerance
+        self.points = list()  # index: point id -> value: rounded point
+        self.known = dict()  # key: point -> value: point id, exact matches need no cell search
+        self.cells = dict()  # key: cell index -> value: list of (point, point id) in this cell
+
+    def point_id(self, point):
+        point_id = self.known.get(point)
+        if point_id is not None:
+            return point_id
+
+        size = self.cell_size
+        margin = self.margin
+        cell = tuple([floor(c / size + 0.5) for c in point])
+        deltas = [c - i * size for c, i in zip(point, cell)]
+        if -margin <= min(deltas) and max(deltas) <= margin:
+            keys = (cell, )
+        else:  # search neighbour cells only where the point is within tolerance of the cell border
+            keys = product(*(range(i - (d < -margin), i + (d > margin) + 1) for d, i in zip(deltas, cell)))
+
+        tolerance = self.tolerance
+        for key in keys:
+            for other, other_id in self.cells.get(key, ()):
+                if all(abs(a - b) <= tolerance for a, b in zip(point, other)):
+                    self.known[point] = other_id
+                    return other_id
+
+        point_id = len(self.points)
+        self.points.append(_round_point(point, self.precision))
+        self.cells.setdefault(cell, []).append((point, point_id))
+        self.known[point] = point_id
+        return point_id
+
+
 class _LineMerger:
     def __init__(self, lines, precision):
-        self.segments = set()  # single lines as tuples: ((sx, sy[, sz]), (ex, ey[, ez]))
-        self.used_segments = set()
-        self.points = dict()  # key: point -> value: list of segments with this point as start or end point
+        self.segments = list()  # single lines as tuples of point ids: (start, end), index is the segment id
+        self.used = list()  # index: segment id -> value: True if the segment is part of a polyline
+        self.known_segments = set()  # to detect doubles
+        self.point_hash = _PointHash(precision)
+        self.point_segments = list()  # index: point id -> value: list of segment ids with this point as start or end
+        self.first_unused = list()  # index: point id -> value: index in point_segments to continue the search
+        self.unused_count = list()  # index: point id -> value: count of unused segments with this point
         self.precision = precision
         self.setup(lines)
         self.polylines = self.merge_lines()  # result of merging process
 
     def setup(self, lines):
+        known = self.point_hash.known
+        point_id = self.point_hash.point_id
         for line in lines:
-            s = _round_point(line.start, self.precision)
-            e = _round_point(line.end, self.precision)
+            start = tuple(line.start)
+            end = tuple(line.end)
+            s = known.get(start)
+            if s is None:
+                s = point_id(start)
+            e = known.get(end)
+            if e is None:
+                e = point_id(end)
             self.add_segment(s, e)
 
     def add_segment(self, start, end):
@@ -50,64 +111,67 @@ class _LineMerger:
             segment = (end, start)
         else:
             segment = (start, end)
-        if segment in self.segments:
+        if segment in self.known_segments:
             return  # this segment already exist
-        self.segments.add(segment)
-        self.add_point(start, segment)
-        self.add_point(end, segment)
-
-    def add_point(self, point, segment):
-        segments = self.points.get(point)
-        if segments is None:
-            segments = list()
-            self.points[point] = segments
-        segments.append(segment)
+        self.known_segments.add(segment)
+        segment_id = len(self.segments)
+        self.segments.append(segment)
+        self.used.append(False)
+        missing = max(start, end) + 1 - len(self.point_segments)
+        if missing > 0:
+            self.point_segments.extend(list() for _ in range(missing))
+            self.first_unused.extend([0] * missing)
+            self.unused_count.extend([0] * missing)
+        self.point_segments[start].append(segment_id)
+        self.point_segments[end].append(segment_id)
+        self.unused_count[start] += 1
+        self.unused_count[end] += 1
 
     def get_segment_with_point(self, point):
-        segments = self.points.get(point)
-        if segments is None:
+        if not self.unused_count[point]:
             return None
 
-        # Very important: do not return already used segments
-        for segment in segments:
-            if segment not in self.used_segments:
-                return segment
-        return None
+        # Very important: do not return already used segments,
+        # segments before first_unused are used, so every segment is skipped at most once
+        segment_ids = self.point_segments[point]
+        index = self.first_unused[point]
+        while self.used[segment_ids[index]]:
+            index += 1
+        self.first_unused[point] = index
+        return segment_ids[index]
 
-    def mark_as_used_segment(self, segment):
-        self.used_segments.add(segment)
-        self.segments.discard(segment)
+    def mark_as_used_segment(self, segment_id):
+        self.used[segment_id] = True
+        start, end = self.segments[segment_id]
+        self.unused_count[start] -= 1
+        self.unused_count[end] -= 1
 
     def merge_lines(self):
         def get_extension_point(point):
             extension = self.get_segment_with_point(point)
             if extension is not None:
                 self.mark_as_used_segment(extension)
-                if extension[0] == point:
-                    return extension[1]
+                start, end = self.segments[extension]
+                if start == point:
+                    return end
                 else:
-                    return extension[0]
+                    return start
             return None
 
+        def extend(point, add):
+            extension_point = get_extension_point(point)
+            while extension_point is not None:
+                add(extension_point)
+                extension_point = get_extension_point(extension_point)
+
+        points = self.point_hash.points
         polylines = []
-        while len(self.segments):
-            segment = self.segments.pop()  # take an arbitrary segment
-            self.mark_as_used_segment(segment)
-            polyline = list(segment)  # start a new polyline
-            extend_start = True
-            extend_end = True
-            while extend_start or extend_end:
-                if extend_start:
-                    extension_point = get_extension_point(polyline[0])  # extend start of polyline
-                    if extension_point is not None:
-                        polyline.insert(0, extension_point)
-                    else:
-                        extend_start = False
-                if extend_end:
-                    extension_point = get_extension_point(polyline[-1])  # extend end of polyline
-                    if extension_point is not None:
-                        polyline.append(extension_point)
-                    else:
-                        extend_end = False
-            polylines.append(polyline)
+        for segment_id, segment in enumerate(self.segments):
+            if self.used[segment_id]:
+                continue
+            self.mark_as_used_segment(segment_id)
+            polyline = deque(segment)  # start a new polyline
+            extend(polyline[-1], polyline.append)  # extend end of polyline
+            extend(polyline[0], polyline.appendleft)  # extend start of polyline
+            polylines.append([points[point] for point in polyline])
         return polylines
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""
+Benchmark of the line merger on synthetic contours, run it from the dxfimport directory:
+
+    python3 line_merger_benchmark.py
+
+Compares line_merger() against the former implementation (rounded points as dict keys, polylines grown
+with list.insert(0, ...)) on shuffled open chains, closed contours and lines sharing a single point.
+"""
+
+import random
+import time
+from collections import namedtuple
+from math import cos, sin, pi
+
+from line_merger import line_merger, _round_point
+
+
+Line = namedtuple("Line", ("start", "end"))
+
+
+class _OldLineMerger:
+    """The line merger as it was before merging points within tolerance."""
+    def __init__(self, lines, precision):
+        self.segments = set()
+        self.used_segments = set()
+        self.points = dict()
+        for line in lines:
+            self.add_segment(_round_point(line.start, precision), _round_point(line.end, precision))
+        self.polylines = self.merge_lines()
+
+    def add_segment(self, start, end):
+        if start == end:
+            return
+        segment = (end, start) if end < start else (start, end)
+        if segment in self.segments:
+            return
+        self.segments.add(segment)
+        self.points.setdefault(start, []).append(segment)
+        self.points.setdefault(end, []).append(segment)
+
+    def get_extension_point(self, point):
+        for segment in self.points.get(point, ()):
+            if segment not in self.used_segments:
+                self.used_segments.add(segment)
+                self.segments.discard(segment)
+                return segment[1] if segment[0] == point else segment[0]
+        return None
+
+    def merge_lines(self):
+        polylines = []
+        while len(self.segments):
+            segment = self.segments.pop()
+            self.used_segments.add(segment)
+            polyline = list(segment)
+            extend_start = True
+            extend_end = True
+            while extend_start or extend_end:
+                if extend_start:
+                    extension_point = self.get_extension_point(polyline[0])
+                    if extension_point is not None:
+                        polyline.insert(0, extension_point)
+                    else:
+                        extend_start = False
+                if extend_end:
+                    extension_point = self.get_extension_point(polyline[-1])
+                    if extension_point is not None:
+                        polyline.append(extension_point)
+                    else:
+                        extend_end = False
+            polylines.append(polyline)
+        return polylines
+
+
+def open_chain(num_lines):
+    points = [(i * 0.5, (i % 7) * 0.25, 0.0) for i in range(num_lines + 1)]
+    return [Line(a, b) for a, b in zip(points, points[1:])]
+
+
+def closed_contours(num_contours, num_lines):
+    lines = []
+    for i in range(num_contours):
+        points = [(i * 10.0 + cos(2.0 * pi * j / num_lines), sin(2.0 * pi * j / num_lines), 0.0)
+                  for j in range(num_lines)]
+        lines.extend(Line(a, b) for a, b in zip(points, points[1:] + points[:1]))
+    return lines
+
+
+def star(num_lines):
+    return [Line((0.0, 0.0, 0.0), (cos(2.0 * pi * i / num_lines), sin(2.0 * pi * i / num_lines), 0.0))
+            for i in range(num_lines)]
+
+
+def edges(polylines):
+    """Set of the segments making the polylines, independent of where each polyline starts."""
+    return {frozenset(segment) for polyline in polylines for segment in zip(polyline, polyline[1:])}
+
+
+def bench(name, func):
+    t = time.perf_counter()
+    ret = func()
+    print("    %-10s %.3f sec" % (name, time.perf_counter() - t))
+    return ret
+
+
+def main():
+    rng = random.Random(0)
+    cases = (
+        ("shuffled open chain of 100k lines", open_chain(100000)),
+        ("20 closed contours of 2000 lines", closed_contours(20, 2000)),
+        ("200 shuffled closed contours of 2000 lines", closed_contours(200, 2000)),
+        ("10k lines sharing one point", star(10000)),
+    )
+    for name, lines in cases:
+        if "shuffled" in name:
+            rng.shuffle(lines)
+        print(name)
+        old = bench("former", lambda: _OldLineMerger(lines, 6).polylines)
+        new = bench("current", lambda: line_merger(lines))
+        assert(len(old) == len(new))
+        assert(edges(old) == edges(new))
+
+
+if __name__ == '__main__':
+    main()
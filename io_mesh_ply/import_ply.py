@@ -36,6 +36,141 @@ class ElementSpec:
             stream = stream.readline().split()
         return [x.load(format, stream) for x in self.properties]
 
+    def load_rows_as_columns(self, format, stream):
+        """
+        Load all elements one by one (slow path, for ascii files and strings properties),
+        and return them as columns (see load_binary_columns()).
+        """
+        import numpy as np
+
+        rows = [self.load(format, stream) for j in range(self.count)]
+        columns = []
+        for i, prop in enumerate(self.properties):
+            if prop.numeric_type == 's':
+                columns.append([row[i] for row in rows])
+            elif prop.list_type is not None:
+                counts = np.array([len(row[i]) for row in rows], dtype=np.int64)
+                values = np.array([v for row in rows for v in row[i]], dtype=prop.numeric_dtype(''))
+                columns.append((counts, values))
+            else:
+                columns.append(np.array([row[i] for row in rows], dtype=prop.numeric_dtype('')))
+        return columns
+
+    def load_binary_columns(self, format, buf, offset):
+        """
+        Load all elements from given buffer at given offset, return a list of columns (one per property)
+        and the offset following the last element.
+
+        Scalar properties give a numpy array, list properties a (counts, flat values) tuple of numpy arrays.
+        Elements with a fixed layout (no lists, or lists of constant size) are read as a single structured array.
+        For others, element starts are found first (see _find_list_elements(), elements are only walked in Python
+        when it cannot be used), values being gathered in bulk afterwards.
+        """
+        import numpy as np
+
+        if any(prop.numeric_type == 's' for prop in self.properties):
+            import io
+            stream = io.BytesIO(buf)
+            stream.seek(offset)
+            return self.load_rows_as_columns(format, stream), stream.tell()
+
+        count = self.count
+        if count == 0:
+            return self.load_rows_as_columns(format, None), offset
+
+        # Try fixed layout, using the list sizes of the first element.
+        fields = []
+        pos = offset
+        for i, prop in enumerate(self.properties):
+            if prop.list_type is not None:
+                count_dtype = prop.list_dtype(format)
+                list_len = int(np.frombuffer(buf, count_dtype, 1, pos)[0])
+                fields.append(('c%d' % i, count_dtype))
+                fields.append(('p%d' % i, prop.numeric_dtype(format), (list_len,)))
+                pos += count_dtype.itemsize + list_len * prop.numeric_dtype(format).itemsize
+            else:
+                fields.append(('p%d' % i, prop.numeric_dtype(format)))
+                pos += prop.numeric_dtype(format).itemsize
+        elem_dtype = np.dtype(fields)
+
+        if offset + count * elem_dtype.itemsize <= len(buf):
+            data = np.frombuffer(buf, elem_dtype, count, offset)
+            if all((data['c%d' % i] == data['c%d' % i][0]).all()
+                   for i, prop in enumerate(self.properties) if prop.list_type is not None):
+                columns = []
+                for i, prop in enumerate(self.properties):
+                    values = np.ascontiguousarray(data['p%d' % i])
+                    if prop.list_type is not None:
+                        list_len = values.shape[1]
+                        columns.append((np.full(count, list_len, dtype=np.int64), values.reshape(-1)))
+                    else:
+                        columns.append(values)
+                return columns, offset + count * elem_dtype.itemsize
+
+        # Variable layout, find where each element starts, and the size of its lists.
+        buf_bytes = np.frombuffer(buf, np.uint8)
+        found = None
+        list_indices = [i for i, prop in enumerate(self.properties) if prop.list_type is not None]
+        if len(list_indices) == 1 and self.properties[list_indices[0]].list_dtype(format).itemsize == 1:
+            # Common case of faces with a one byte vertex count, no need to walk them one by one.
+            i_list = list_indices[0]
+            pre = sum(prop.numeric_dtype(format).itemsize for prop in self.properties[:i_list])
+            post = sum(prop.numeric_dtype(format).itemsize for prop in self.properties[i_list + 1:])
+            num_size = self.properties[i_list].numeric_dtype(format).itemsize
+            found = _find_list_elements(buf_bytes, offset, count, pre, post, num_size)
+            if found is not None:
+                elem_starts, counts, pos = found
+                list_counts = {i_list: counts}
+        if found is None:
+            elem_starts, list_counts, pos = self._walk_elements(format, buf, offset)
+
+        columns = []
+        prop_starts = elem_starts
+        for i, prop in enumerate(self.properties):
+            num_dtype = prop.numeric_dtype(format)
+            if prop.list_type is not None:
+                counts = list_counts[i]
+                prop_starts = prop_starts + prop.list_dtype(format).itemsize
+                values = _gather_spans(buf_bytes, prop_starts, counts * num_dtype.itemsize, num_dtype)
+                columns.append((counts, values))
+                prop_starts = prop_starts + counts * num_dtype.itemsize
+            else:
+                columns.append(_gather_spans(buf_bytes, prop_starts, num_dtype.itemsize, num_dtype))
+                prop_starts = prop_starts + num_dtype.itemsize
+        return columns, pos
+
+    def _walk_elements(self, format, buf, offset):
+        """
+        Walk the elements one by one from given offset, return where each of them starts,
+        the sizes of their lists (a dict mapping list properties indices to arrays), and the offset following them.
+        """
+        import struct
+        import numpy as np
+
+        count = self.count
+        elem_starts = np.empty(count, dtype=np.int64)
+        list_counts = {i: np.empty(count, dtype=np.int64)
+                       for i, prop in enumerate(self.properties) if prop.list_type is not None}
+        walk = []
+        for i, prop in enumerate(self.properties):
+            num_size = prop.numeric_dtype(format).itemsize
+            if prop.list_type is not None:
+                count_unpack = struct.Struct(format + prop.list_type).unpack_from
+                walk.append((count_unpack, prop.list_dtype(format).itemsize, num_size, list_counts[i]))
+            else:
+                walk.append((None, num_size, 0, None))
+        pos = offset
+        for j in range(count):
+            elem_starts[j] = pos
+            for count_unpack, size, num_size, counts in walk:
+                if count_unpack is None:
+                    pos += size
+                else:
+                    list_len = count_unpack(buf, pos)[0]
+                    counts[j] = list_len
+                    pos += size + list_len * num_size
+        return elem_starts, list_counts, pos
+
     def index(self, name):
         for i, p in enumerate(self.properties):
             if p.name == name:
@@ -43,6 +178,107 @@ class ElementSpec:
         return -1
 
 
+# Amount of elements whose list sizes give the range of sizes expected by _find_list_elements(),
+# and highest amount of rounds it may take to drop candidates.
+_FIND_LIST_SAMPLE_SIZE = 1000
+_FIND_LIST_MAX_ROUNDS = 64
+
+
+def _find_list_elements(buf_bytes, offset, count, pre, post, num_size):
+    """
+    Find where count elements made of a single list with a one byte size (and pre/post bytes of fixed size
+    properties before/after it) start, without walking them one by one.
+
+    Every position whose size byte is in the expected range is a candidate element start, linked to the position
+    following that element. Actual element starts are all linked from the previous one, so candidates no other
+    candidate links to (except the first one) are dropped, until the first candidates form a chain.
+    Return (element starts, list sizes, offset following the elements), or None if the elements could not be found
+    that way (list sizes out of the expected range...).
+    """
+    import numpy as np
+
+    head_size = pre + 1 + post
+    data = buf_bytes[offset:]
+    data_size = len(data)
+
+    # Expect the list sizes of the first elements (and at least triangles and quads).
+    min_count, max_count = 3, 4
+    pos = 0
+    for _ in range(min(count, _FIND_LIST_SAMPLE_SIZE)):
+        if pos + head_size > data_size:
+            return None
+        list_count = int(data[pos + pre])
+        min_count = min(min_count, list_count)
+        max_count = max(max_count, list_count)
+        pos += head_size + list_count * num_size
+
+    # Positions are relative to offset from here, a list size read at each of them.
+    num_pos = min(data_size - head_size + 1, count * (head_size + max_count * num_size))
+    pos_counts = data[pre:pre + num_pos]
+    is_cand = (pos_counts >= min_count) & (pos_counts <= max_count)
+    tail = max(num_pos - max_count * num_size, 0)
+    tail_ends = tail + np.arange(num_pos - tail) + head_size + pos_counts[tail:].astype(np.int64) * num_size
+    is_cand[tail:] &= tail_ends <= data_size
+
+    # Drop candidates no candidate links to.
+    cand = np.flatnonzero(is_cand)
+    if len(cand) < count or cand[0] != 0:
+        return None
+    cand_next = cand + head_size + pos_counts[cand].astype(np.int64) * num_size
+    is_linked = np.zeros(num_pos + 1, dtype=np.bool_)
+    is_linked[np.minimum(cand_next, num_pos)] = True
+    dropped = cand[~is_linked[cand]][1:]
+    del cand, cand_next, is_linked
+
+    # Dropping candidates may leave the positions they link to unlinked, drop those too, and so on.
+    for _ in range(_FIND_LIST_MAX_ROUNDS):
+        if len(dropped) == 0:
+            break
+        is_cand[dropped] = False
+        targets = dropped + head_size + pos_counts[dropped].astype(np.int64) * num_size
+        targets = targets[targets < num_pos]
+        targets = targets[is_cand[targets]]
+        is_linked = np.zeros(len(targets), dtype=np.bool_)
+        for list_count in range(min_count, max_count + 1):
+            sources = targets - (head_size + list_count * num_size)
+            has_source = sources >= 0
+            sources = sources[has_source]
+            is_linked[has_source] |= is_cand[sources] & (pos_counts[sources] == list_count)
+        dropped = targets[~is_linked]
+    else:
+        return None
+
+    starts = np.flatnonzero(is_cand)[:count]
+    if len(starts) < count:
+        return None
+    counts = pos_counts[starts].astype(np.int64)
+    ends = starts + head_size + counts * num_size
+    if not (ends[:-1] == starts[1:]).all():
+        return None
+    return starts + offset, counts, int(ends[-1]) + offset
+
+
+def _gather_spans(buf_bytes, starts, sizes, dtype):
+    """
+    Concatenate the sorted, non-overlapping spans of sizes bytes (an array, or a single size for all spans)
+    at starts in a uint8 array, return them as a flat array of given dtype.
+    """
+    import numpy as np
+
+    if len(starts) == 0:
+        return np.empty(0, dtype)
+    ends = starts + sizes
+    begin = int(starts[0])
+    end = int(ends[-1])
+
+    # Mark the start and end of each span, their cumulative sum is one inside spans.
+    span_edges = np.zeros(end - begin + 1, dtype=np.int8)
+    span_edges[starts - begin] = 1
+    span_edges[ends - begin] -= 1
+    in_span = np.cumsum(span_edges[:-1], dtype=np.int8).view(np.bool_)
+    return buf_bytes[begin:end][in_span].view(dtype)
+
+
 class PropertySpec:
     __slots__ = (
         "name",
@@ -55,6 +291,14 @@ class PropertySpec:
         self.list_type = list_type
         self.numeric_type = numeric_type
 
+    def numeric_dtype(self, format):
+        import numpy as np
+        return np.dtype(format + self.numeric_type)
+
+    def list_dtype(self, format):
+        import numpy as np
+        return np.dtype(format + self.list_type)
+
     def read_format(self, format, count, num_type, stream):
         import struct
 
@@ -110,12 +354,22 @@ class ObjectSpec:
         self.specs = []
 
     def load(self, format, stream):
-        return {
-            i.name: [
-                i.load(format, stream) for j in range(i.count)
-            ]
-            for i in self.specs
-        }
+        """
+        Return a dict mapping elements names to their list of columns (see ElementSpec.load_binary_columns()).
+        """
+        if format == b'ascii':
+            return {
+                i.name: i.load_rows_as_columns(format, stream)
+                for i in self.specs
+            }
+
+        # Binary data is read at once, and decoded as whole arrays.
+        buf = stream.read()
+        offset = 0
+        obj = {}
+        for i in self.specs:
+            obj[i.name], offset = i.load_binary_columns(format, buf, offset)
+        return obj
 
 
 def read(filepath):
@@ -251,6 +505,7 @@ def read(filepath):
 
 def load_ply_mesh(filepath, ply_name):
     import bpy
+    import numpy as np
 
     obj_spec, obj, texture = read(filepath)
     # XXX28: use texture
@@ -291,107 +546,78 @@ def load_ply_mesh(filepath, ply_name):
         elif el.name == b'edge':
             eindex1, eindex2 = el.index(b'vertex1'), el.index(b'vertex2')
 
-    mesh_faces = []
-    mesh_uvs = []
-    mesh_colors = []
-
-    def add_face(vertices, indices, uvindices, colindices):
-        mesh_faces.append(indices)
-        if uvindices:
-            mesh_uvs.extend([(vertices[index][uvindices[0]], vertices[index][uvindices[1]]) for index in indices])
-        if colindices:
-            if len(colindices) == 3:
-                mesh_colors.extend([
-                    (
-                        vertices[index][colindices[0]] * colmultiply[0],
-                        vertices[index][colindices[1]] * colmultiply[1],
-                        vertices[index][colindices[2]] * colmultiply[2],
-                        1.0,
-                    )
-                    for index in indices
-                ])
-            elif len(colindices) == 4:
-                mesh_colors.extend([
-                    (
-                        vertices[index][colindices[0]] * colmultiply[0],
-                        vertices[index][colindices[1]] * colmultiply[1],
-                        vertices[index][colindices[2]] * colmultiply[2],
-                        vertices[index][colindices[3]] * colmultiply[3],
-                    )
-                    for index in indices
-                ])
-
-    if uvindices or colindices:
-        # If we have Cols or UVs then we need to check the face order.
-        add_face_simple = add_face
-
+    def face_order_fix(counts, indices):
         # EVIL EEKADOODLE - face order annoyance.
-        def add_face(vertices, indices, uvindices, colindices):
-            if len(indices) == 4:
-                if indices[2] == 0 or indices[3] == 0:
-                    indices = indices[2], indices[3], indices[0], indices[1]
-            elif len(indices) == 3:
-                if indices[2] == 0:
-                    indices = indices[1], indices[2], indices[0]
-
-            add_face_simple(vertices, indices, uvindices, colindices)
+        loop_start = np.cumsum(counts) - counts
+        for size, rot in ((4, 2), (3, 1)):
+            starts = loop_start[counts == size]
+            faces = indices[starts[:, None] + np.arange(size)]
+            if size == 4:
+                swap = (faces[:, 2] == 0) | (faces[:, 3] == 0)
+            else:
+                swap = faces[:, 2] == 0
+            indices[starts[swap][:, None] + np.arange(size)] = np.roll(faces[swap], -rot, axis=1)
 
     verts = obj[b'vertex']
+    num_verts = len(verts[vindices_x])
+
+    faces_counts = []
+    faces_indices = []
 
     if b'face' in obj:
-        for f in obj[b'face']:
-            ind = f[findex]
-            add_face(verts, ind, uvindices, colindices)
+        counts, indices = obj[b'face'][findex]
+        faces_counts.append(counts)
+        faces_indices.append(indices)
 
     if b'tristrips' in obj:
-        for t in obj[b'tristrips']:
-            ind = t[trindex]
-            len_ind = len(ind)
-            for j in range(len_ind - 2):
-                add_face(verts, (ind[j], ind[j + 1], ind[j + 2]), uvindices, colindices)
+        counts, indices = obj[b'tristrips'][trindex]
+        # Each strip of n indices gives (n - 2) triangles, starting at each of its first (n - 2) indices.
+        tris_counts = np.maximum(counts - 2, 0)
+        strips_start = np.cumsum(counts) - counts
+        tris_start = (np.repeat(strips_start, tris_counts) +
+                      np.arange(tris_counts.sum()) - np.repeat(np.cumsum(tris_counts) - tris_counts, tris_counts))
+        faces_counts.append(np.full(len(tris_start), 3, dtype=np.int64))
+        faces_indices.append(indices[tris_start[:, None] + np.arange(3)].reshape(-1))
+
+    if faces_counts:
+        faces_counts = np.concatenate(faces_counts).astype(np.int32)
+        loops_vert_idx = np.concatenate(faces_indices).astype(np.int32)
+        if uvindices or colindices:
+            # If we have Cols or UVs then we need to check the face order.
+            face_order_fix(faces_counts, loops_vert_idx)
 
     mesh = bpy.data.meshes.new(name=ply_name)
 
-    mesh.vertices.add(len(obj[b'vertex']))
+    mesh.vertices.add(num_verts)
 
-    mesh.vertices.foreach_set("co", [a for v in obj[b'vertex'] for a in (v[vindices_x], v[vindices_y], v[vindices_z])])
+    mesh.vertices.foreach_set("co", np.column_stack((verts[vindices_x], verts[vindices_y], verts[vindices_z])).astype(np.float32).ravel())
 
     if b'edge' in obj:
-        mesh.edges.add(len(obj[b'edge']))
-        mesh.edges.foreach_set("vertices", [a for e in obj[b'edge'] for a in (e[eindex1], e[eindex2])])
-
-    if mesh_faces:
-        loops_vert_idx = []
-        faces_loop_start = []
-        faces_loop_total = []
-        lidx = 0
-        for f in mesh_faces:
-            nbr_vidx = len(f)
-            loops_vert_idx.extend(f)
-            faces_loop_start.append(lidx)
-            faces_loop_total.append(nbr_vidx)
-            lidx += nbr_vidx
+        edges = obj[b'edge']
+        mesh.edges.add(len(edges[eindex1]))
+        mesh.edges.foreach_set("vertices", np.column_stack((edges[eindex1], edges[eindex2])).astype(np.int32).ravel())
+
+    if len(faces_counts):
+        faces_loop_start = (np.cumsum(faces_counts) - faces_counts).astype(np.int32)
 
         mesh.loops.add(len(loops_vert_idx))
-        mesh.polygons.add(len(mesh_faces))
+        mesh.polygons.add(len(faces_counts))
 
         mesh.loops.foreach_set("vertex_index", loops_vert_idx)
         mesh.polygons.foreach_set("loop_start", faces_loop_start)
-        mesh.polygons.foreach_set("loop_total", faces_loop_total)
+        mesh.polygons.foreach_set("loop_total", faces_counts)
 
         if uvindices:
             uv_layer = mesh.uv_layers.new()
-            for i, uv in enumerate(uv_layer.data):
-                uv.uv = mesh_uvs[i]
+            uvs = np.column_stack((verts[uvindices[0]], verts[uvindices[1]])).astype(np.float32)
+            uv_layer.data.foreach_set("uv", uvs[loops_vert_idx].ravel())
 
         if colindices:
             vcol_lay = mesh.vertex_colors.new()
-
-            for i, col in enumerate(vcol_lay.data):
-                col.color[0] = mesh_colors[i][0]
-                col.color[1] = mesh_colors[i][1]
-                col.color[2] = mesh_colors[i][2]
-                col.color[3] = mesh_colors[i][3]
+            colors = np.ones((num_verts, 4), dtype=np.float32)
+            for i, (colindex, mult) in enumerate(zip(colindices, colmultiply)):
+                colors[:, i] = verts[colindex] * mult
+            vcol_lay.data.foreach_set("color", colors[loops_vert_idx].ravel())
 
     mesh.update()
     mesh.validate()
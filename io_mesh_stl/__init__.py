@@ -59,6 +59,7 @@ from bpy.props import (
     CollectionProperty,
     EnumProperty,
     FloatProperty,
+    IntProperty,
 )
 from bpy_extras.io_utils import (
     ImportHelper,
@@ -243,6 +244,13 @@ class ExportSTL(Operator, ExportHelper):
             ('OBJECT', "Object", "Each object as a file"),
         ),
     )
+    num_processes: IntProperty(
+        name="Processes",
+        description="Number of worker processes packing triangles in parallel "
+                    "(0 to use all CPU cores, 1 to pack everything in Blender's own process)",
+        min=0, max=256,
+        default=1,
+    )
 
     @property
     def check_extension(self):
@@ -250,7 +258,6 @@ class ExportSTL(Operator, ExportHelper):
 
     def execute(self, context):
         import os
-        import itertools
         from mathutils import Matrix
         from . import stl_utils
         from . import blender_utils
@@ -286,18 +293,17 @@ class ExportSTL(Operator, ExportHelper):
         ).to_4x4() @ Matrix.Scale(global_scale, 4)
 
         if self.batch_mode == 'OFF':
-            faces = itertools.chain.from_iterable(
-                    blender_utils.faces_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
+            tris = (blender_utils.triangles_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
                     for ob in data_seq)
 
-            stl_utils.write_stl(faces=faces, **keywords)
+            stl_utils.write_stl_tris(tris=tris, **keywords)
         elif self.batch_mode == 'OBJECT':
             prefix = os.path.splitext(self.filepath)[0]
             keywords_temp = keywords.copy()
             for ob in data_seq:
-                faces = blender_utils.faces_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
+                tris = blender_utils.triangles_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
                 keywords_temp["filepath"] = prefix + bpy.path.clean_name(ob.name) + ".stl"
-                stl_utils.write_stl(faces=faces, **keywords_temp)
+                stl_utils.write_stl_tris(tris=(tris,), **keywords_temp)
 
         return {'FINISHED'}
 
@@ -329,6 +335,7 @@ class STL_PT_export_main(bpy.types.Panel):
 
         layout.prop(operator, "ascii")
         layout.prop(operator, "batch_mode")
+        layout.prop(operator, "num_processes")
 
 
 class STL_PT_export_include(bpy.types.Panel):
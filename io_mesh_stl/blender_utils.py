@@ -21,30 +21,41 @@
 
 def create_and_link_mesh(name, faces, face_nors, points, global_matrix):
     """
-    Create a blender mesh and object called name from a list of
-    *points* and *faces* and link it in the current scene.
+    Create a blender mesh and object called name from arrays of
+    *points* (M, 3) and triangle *faces* (N, 3) and link it in the current scene.
     """
 
     import array
-    from itertools import chain
+    import numpy as np
     import bpy
 
-    mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata(points, [], faces)
+    faces = np.ascontiguousarray(faces, dtype=np.int32).reshape(-1, 3)
+    points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+    num_faces = len(faces)
 
-    if face_nors:
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(points))
+    mesh.vertices.foreach_set("co", points.ravel())
+    mesh.loops.add(num_faces * 3)
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    mesh.polygons.add(num_faces)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 3, 3, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(num_faces, 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    if face_nors is not None:
         # Note: we store 'temp' normals in loops, since validate() may alter final mesh,
         #       we can only set custom lnors *after* calling it.
         mesh.create_normals_split()
-        lnors = tuple(chain(*chain(*zip(face_nors, face_nors, face_nors))))
-        mesh.loops.foreach_set("normal", lnors)
+        lnors = np.repeat(np.asarray(face_nors, dtype=np.float32).reshape(-1, 3), 3, axis=0)
+        mesh.loops.foreach_set("normal", lnors.ravel())
 
     mesh.transform(global_matrix)
 
     # update mesh to allow proper display
     mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
-    if face_nors:
+    if face_nors is not None:
         clnors = array.array('f', [0.0] * (len(mesh.loops) * 3))
         mesh.loops.foreach_get("normal", clnors)
 
@@ -111,3 +122,51 @@ def faces_from_mesh(ob, global_matrix, use_mesh_modifiers=False):
         yield [vertices[index].co.copy() for index in tri.vertices]
 
     mesh_owner.to_mesh_clear()
+
+
+def triangles_from_mesh(ob, global_matrix, use_mesh_modifiers=False):
+    """
+    From an object, return a (N, 3, 3) float32 array of its triangles' vertices coordinates,
+    extracted in bulk with foreach_get.
+
+    use_mesh_modifiers
+        Apply the preview modifier to the returned triangles
+    """
+
+    import numpy as np
+    import bpy
+
+    # get the editmode data
+    if ob.mode == "EDIT":
+        ob.update_from_editmode()
+
+    # get the modifiers
+    if use_mesh_modifiers:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh_owner = ob.evaluated_get(depsgraph)
+    else:
+        mesh_owner = ob
+
+    # Object.to_mesh() is not guaranteed to return a mesh.
+    try:
+        mesh = mesh_owner.to_mesh()
+    except RuntimeError:
+        mesh = None
+
+    if mesh is None:
+        return np.empty((0, 3, 3), dtype=np.float32)
+
+    mat = global_matrix @ ob.matrix_world
+    mesh.transform(mat)
+    if mat.is_negative:
+        mesh.flip_normals()
+    mesh.calc_loop_triangles()
+
+    cos = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", cos)
+    tris_verts = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris_verts)
+
+    mesh_owner.to_mesh_clear()
+
+    return cos.reshape(-1, 3)[tris_verts].reshape(-1, 3, 3)
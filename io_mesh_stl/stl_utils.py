@@ -103,40 +103,61 @@ def _is_ascii_file(data):
     return (file_size != BINARY_HEADER + 4 + BINARY_STRIDE * size)
 
 
-def _binary_read(data):
-    # Skip header...
+BINARY_DTYPE = (
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attribute', '<u2'),
+)
+
 
+def _binary_read_arrays(data):
+    """
+    Read a whole binary STL file at once, return (normals, vertices) float32 arrays,
+    of shapes (N, 3) and (N, 3, 3).
+    """
     import os
     import struct
+    import numpy as np
 
     data.seek(BINARY_HEADER)
     size = struct.unpack('<I', data.read(4))[0]
 
+    data.seek(0, os.SEEK_END)
+    file_size = data.tell() - (BINARY_HEADER + 4)
+    # Reset to after-the-size in the file.
+    data.seek(BINARY_HEADER + 4)
+
     if size == 0:
         # Workaround invalid crap.
-        data.seek(0, os.SEEK_END)
-        file_size = data.tell()
-        # Reset to after-the-size in the file.
-        data.seek(BINARY_HEADER + 4)
-
-        file_size -= BINARY_HEADER + 4
         size = file_size // BINARY_STRIDE
         print("WARNING! Reported size (facet number) is 0, inferring %d facets from file size." % size)
 
-    # We read 4096 elements at once, avoids too much calls to read()!
-    CHUNK_LEN = 4096
-    chunks = [CHUNK_LEN] * (size // CHUNK_LEN)
-    chunks.append(size % CHUNK_LEN)
+    facets = np.fromfile(data, dtype=np.dtype(list(BINARY_DTYPE)), count=size)
+    return facets['normal'], facets['vertices']
+
+
+def _weld_points(tri_pts):
+    """
+    Merge identical points of given (N, 3, 3) triangles array,
+    return ((N, 3) int32 array of triangles' point indices, (M, 3) float32 array of points).
+
+    Points are kept in order of first appearance, like ListDict would do.
+    """
+    import numpy as np
 
-    unpack = struct.Struct('<12f').unpack_from
-    for chunk_len in chunks:
-        if chunk_len == 0:
-            continue
-        buf = data.read(BINARY_STRIDE * chunk_len)
-        for i in range(chunk_len):
-            # read the normal and points coordinates of each triangle
-            pt = unpack(buf, BINARY_STRIDE * i)
-            yield pt[:3], (pt[3:6], pt[6:9], pt[9:])
+    # Adding 0.0 turns -0.0 into 0.0, so that both are merged, as they would be in a dict.
+    pts = np.ascontiguousarray(tri_pts.reshape(-1, 3), dtype=np.float32) + np.float32(0.0)
+    # Compare points as raw 12 bytes items, much quicker than np.unique(..., axis=0).
+    pts_keys = pts.view(np.dtype((np.void, pts.dtype.itemsize * 3))).ravel()
+    _keys, first_idx, inverse = np.unique(pts_keys, return_index=True, return_inverse=True)
+
+    # np.unique sorts its output, get back to order of first appearance.
+    order = np.argsort(first_idx, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    tris = rank[inverse.ravel()].astype(np.int32).reshape(-1, 3)
+    return tris, pts[first_idx[order]]
 
 
 def _ascii_read(data):
@@ -215,6 +236,166 @@ def _ascii_write(filepath, faces):
         fw('endsolid %s\n' % header)
 
 
+def _tris_normals(tris):
+    """
+    Return the (N, 3) array of normals of given (N, 3, 3) triangles array.
+    """
+    import numpy as np
+
+    nors = np.cross(tris[:, 0] - tris[:, 1], tris[:, 1] - tris[:, 2])
+    lengths = np.sqrt(np.einsum('ij,ij->i', nors, nors))[:, None]
+    # Degenerate triangles get a null normal.
+    np.divide(nors, lengths, out=nors, where=lengths != 0.0)
+    return nors
+
+
+# Number of triangles processed at once by arrays writers, caps temp memory usage.
+ARRAYS_CHUNK_LEN = 1 << 20
+
+
+def _init_worker(addon_path):
+    """
+    Initializer of worker processes: make this module importable as part of the add-on
+    by registering a bare package for it, the real one imports bpy.
+    """
+    import os
+    import sys
+    import types
+
+    package = types.ModuleType(os.path.basename(addon_path))
+    package.__path__ = [addon_path]
+    sys.modules[package.__name__] = package
+
+
+def _process_pool(num_processes):
+    """
+    Return a ProcessPoolExecutor with num_processes worker processes able to run this module's functions,
+    or None when worker processes can't be started from this Python.
+    """
+    import multiprocessing
+    import os
+    import runpy
+    import sys
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Spawn fresh interpreters rather than forking Blender. This requires sys.executable to be a Python binary,
+    # it is Blender's bundled one since 2.91, before that it was the Blender executable.
+    if not os.path.basename(sys.executable).lower().startswith('python'):
+        return None
+
+    # This file (which has no bpy import at module level) is run as the initializer, see the end of it:
+    # _init_worker could not be unpickled before the add-on package is registered.
+    return ProcessPoolExecutor(
+        num_processes,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=runpy.run_path,
+        initargs=(__file__, None, '__mp_worker__'),
+    )
+
+
+def _map_chunks(func, tris_seq, chunk_len, num_processes):
+    """
+    Yield func(chunk) for all chunks of chunk_len triangles of the arrays in tris_seq, in order.
+    With num_processes other than 1 (0 meaning all CPU cores), func is run by worker processes.
+    """
+    import os
+    from collections import deque
+
+    chunks = (tris[i:i + chunk_len] for tris in tris_seq for i in range(0, len(tris), chunk_len))
+
+    executor = None
+    if num_processes != 1:
+        num_processes = num_processes or os.cpu_count()
+        executor = _process_pool(num_processes)
+        if executor is None:
+            print("STL Export: worker processes can't be used here, packing everything in Blender's process")
+
+    if executor is None:
+        yield from map(func, chunks)
+        return
+
+    with executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            # Do not keep too many packed chunks around.
+            while len(pending) > 2 * num_processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _binary_pack_tris(tris):
+    import numpy as np
+
+    facets = np.zeros(len(tris), dtype=np.dtype(list(BINARY_DTYPE)))
+    facets['normal'] = _tris_normals(tris)
+    facets['vertices'] = tris
+    return facets.tobytes()
+
+
+def _binary_write_tris(filepath, tris_seq, num_processes=1):
+    import struct
+
+    with open(filepath, 'wb') as data:
+        fw = data.write
+        # header, number of facets is written once known.
+        fw(struct.calcsize('<80sI') * b'\0')
+
+        nb = 0
+
+        for facets in _map_chunks(_binary_pack_tris, tris_seq, ARRAYS_CHUNK_LEN, num_processes):
+            fw(facets)
+            nb += len(facets) // 50
+
+        # header, with correct value now
+        data.seek(0)
+        fw(struct.pack('<80sI', _header_version().encode('ascii'), nb))
+
+
+def _ascii_format_tris(tris):
+    import numpy as np
+
+    facet_fmt = ('facet normal %f %f %f\nouter loop\n'
+                 'vertex %f %f %f\nvertex %f %f %f\nvertex %f %f %f\n'
+                 'endloop\nendfacet\n')
+
+    values = np.hstack((_tris_normals(tris), tris.reshape(-1, 9)))
+    return (facet_fmt * len(tris)) % tuple(values.ravel().tolist())
+
+
+def _ascii_write_tris(filepath, tris_seq, num_processes=1):
+    with open(filepath, 'w') as data:
+        fw = data.write
+        header = _header_version()
+        fw('solid %s\n' % header)
+
+        # Smaller chunks here, formatting goes through a tuple of python floats.
+        for facets in _map_chunks(_ascii_format_tris, tris_seq, ARRAYS_CHUNK_LEN // 16, num_processes):
+            fw(facets)
+
+        fw('endsolid %s\n' % header)
+
+
+def write_stl_tris(filepath="", tris=(), ascii=False, num_processes=1):
+    """
+    Write a stl file from arrays of triangles, facet normals are computed in bulk.
+
+    filepath
+       output filepath
+
+    tris
+       iterable of float32 arrays of shape (N, 3, 3) (N triangles of 3 vertices of 3 coordinates)
+
+    ascii
+       save the file in ascii format (very huge)
+
+    num_processes
+       number of worker processes packing triangles in parallel (0 for all CPU cores, 1 to do it in this process)
+    """
+    (_ascii_write_tris if ascii else _binary_write_tris)(filepath, tris, num_processes)
+
+
 def write_stl(filepath="", faces=(), ascii=False):
     """
     Write a stl file from faces,
@@ -235,50 +416,54 @@ def read_stl(filepath):
     """
     Return the triangles and points of an stl binary file.
 
-    Please note that this process can take lot of time if the file is
-    huge (~1m30 for a 1 Go stl file on an quad core i7).
+    Binary files are read and welded as whole arrays, ascii ones
+    (which are much slower to parse anyway) are read line by line.
 
     - returns a tuple(triangles, triangles' normals, points).
 
       triangles
-          A list of triangles, each triangle as a tuple of 3 index of
-          point in *points*.
+          A (N, 3) int32 array of triangles, each triangle as 3 indices
+          of points in *points*.
 
       triangles' normals
-          A list of vectors3 (tuples, xyz).
+          A (N, 3) float32 array of vectors (xyz).
 
       points
-          An indexed list of points, each point is a tuple of 3 float
-          (xyz).
+          A (M, 3) float32 array of points (xyz).
 
     Example of use:
 
        >>> tris, tri_nors, pts = read_stl(filepath)
-       >>> pts = list(pts)
        >>>
        >>> # print the coordinate of the triangle n
-       >>> print(pts[i] for i in tris[n])
+       >>> print(pts[tris[n]])
     """
     import time
+    import numpy as np
     start_time = time.process_time()
 
-    tris, tri_nors, pts = [], [], ListDict()
-
     with open(filepath, 'rb') as data:
         # check for ascii or binary
-        gen = _ascii_read if _is_ascii_file(data) else _binary_read
-
-        for nor, pt in gen(data):
-            # Add the triangle and the point.
-            # If the point is already in the list of points, the
-            # index returned by pts.add() will be the one from the
-            # first equal point inserted.
-            tris.append([pts.add(p) for p in pt])
-            tri_nors.append(nor)
+        if _is_ascii_file(data):
+            tris, tri_nors, pts = [], [], ListDict()
+            for nor, pt in _ascii_read(data):
+                # Add the triangle and the point.
+                # If the point is already in the list of points, the
+                # index returned by pts.add() will be the one from the
+                # first equal point inserted.
+                tris.append([pts.add(p) for p in pt])
+                tri_nors.append(nor)
+
+            tris = np.array(tris, dtype=np.int32).reshape(-1, 3)
+            tri_nors = np.array(tri_nors, dtype=np.float32).reshape(-1, 3)
+            pts = np.array(pts.list, dtype=np.float32).reshape(-1, 3)
+        else:
+            tri_nors, tri_pts = _binary_read_arrays(data)
+            tris, pts = _weld_points(tri_pts)
 
     print('Import finished in %.4f sec.' % (time.process_time() - start_time))
 
-    return tris, tri_nors, pts.list
+    return tris, tri_nors, pts
 
 
 if __name__ == '__main__':
@@ -293,3 +478,7 @@ if __name__ == '__main__':
         tris, pts = read_stl(filepath)
 
         blender_utils.create_and_link_mesh(objName, tris, pts)
+
+elif __name__ == '__mp_worker__':
+    import os
+    _init_worker(os.path.dirname(__file__))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""
+Benchmark of the binary STL reader on a synthetic file, run it from the io_mesh_stl directory:
+
+    python3 stl_utils_benchmark.py [grid_size]
+
+The file is a grid_size * grid_size grid of quads, split in two triangles each (2M triangles by default).
+Compares reading and welding the points with numpy against the former per-facet unpacking and ListDict welding.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import stl_utils
+
+
+def write_synthetic_stl(fn, grid_size):
+    rng = np.random.default_rng(0)
+    co = np.stack(np.meshgrid(np.arange(grid_size + 1), np.arange(grid_size + 1), indexing='ij'), axis=-1)
+    co = np.concatenate((co, rng.random(co.shape[:2] + (1,))), axis=-1).astype(np.float32)
+    quads = np.stack((co[:-1, :-1], co[1:, :-1], co[1:, 1:], co[:-1, 1:]), axis=2).reshape(-1, 4, 3)
+    tris = np.concatenate((quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]), axis=1).reshape(-1, 3, 3)
+
+    facets = np.zeros(len(tris), dtype=np.dtype(list(stl_utils.BINARY_DTYPE)))
+    facets['normal'] = stl_utils._tris_normals(tris)
+    facets['vertices'] = tris
+    with open(fn, 'wb') as f:
+        f.write(struct.pack('<80sI', b'', len(facets)))
+        f.write(facets.tobytes())
+
+
+def read_old(fn):
+    """The binary reader and welding as they were before using numpy."""
+    tris, tri_nors, pts = [], [], stl_utils.ListDict()
+    with open(fn, 'rb') as data:
+        data.seek(stl_utils.BINARY_HEADER)
+        size = struct.unpack('<I', data.read(4))[0]
+
+        CHUNK_LEN = 4096
+        chunks = [CHUNK_LEN] * (size // CHUNK_LEN)
+        chunks.append(size % CHUNK_LEN)
+
+        unpack = struct.Struct('<12f').unpack_from
+        for chunk_len in chunks:
+            if chunk_len == 0:
+                continue
+            buf = data.read(stl_utils.BINARY_STRIDE * chunk_len)
+            for i in range(chunk_len):
+                pt = unpack(buf, stl_utils.BINARY_STRIDE * i)
+                tris.append([pts.add(p) for p in (pt[3:6], pt[6:9], pt[9:])])
+                tri_nors.append(pt[:3])
+    return tris, tri_nors, pts.list
+
+
+def read_new(fn):
+    with open(fn, 'rb') as data:
+        tri_nors, tri_pts = stl_utils._binary_read_arrays(data)
+    tris, pts = stl_utils._weld_points(tri_pts)
+    return tris, tri_nors, pts
+
+
+def bench(name, func):
+    t = time.perf_counter()
+    ret = func()
+    print("%-30s %.3f sec" % (name, time.perf_counter() - t))
+    return ret
+
+
+def main():
+    grid_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "benchmark.stl")
+        write_synthetic_stl(fn, grid_size)
+        print("%d triangles, %.1f MiB file" % (2 * grid_size * grid_size, os.path.getsize(fn) / 1048576))
+
+        old = bench("read + weld (struct, ListDict)", lambda: read_old(fn))
+        new = bench("read + weld (numpy)", lambda: read_new(fn))
+
+        for old_arr, new_arr in zip(old, new):
+            assert(np.array_equal(np.array(old_arr, dtype=new_arr.dtype).reshape(new_arr.shape), new_arr))
+
+
+if __name__ == '__main__':
+    main()
@@ -46,6 +46,7 @@ import bpy
 from bpy.props import (
         StringProperty,
         BoolProperty,
+        IntProperty,
         FloatProperty,
         EnumProperty,
         CollectionProperty,
@@ -199,6 +200,14 @@ class ImportFBX(bpy.types.Operator, ImportHelper):
             default=True,
             )
 
+    decompress_threads: IntProperty(
+            name="Decompression Threads",
+            description="Number of threads used to decompress mesh, skinning and animation arrays ahead of time "
+                        "(0 to use all available cores, 1 to only decompress data on demand)",
+            min=0, max=1024,
+            default=1,
+            )
+
     def draw(self, context):
         pass
 
@@ -248,6 +257,7 @@ class FBX_PT_import_include(bpy.types.Panel):
         sub.enabled = operator.use_custom_props
         sub.prop(operator, "use_custom_props_enum_as_string")
         layout.prop(operator, "use_image_search")
+        layout.prop(operator, "decompress_threads")
 
 
 class FBX_PT_import_transform(bpy.types.Panel):
@@ -591,6 +601,27 @@ class ExportFBX(bpy.types.Operator, ExportHelper):
             description="Embed textures in FBX binary file (only for \"Copy\" path mode!)",
             default=False,
             )
+    compression_level: IntProperty(
+            name="Compression Level",
+            description="Zlib compression level of array data (lower is faster, higher gives smaller files)",
+            min=0, max=9,
+            default=1,
+            )
+    compression_threshold: IntProperty(
+            name="Compression Threshold",
+            description="Size (in bytes) above which array data gets compressed",
+            min=0, max=2 ** 30,
+            default=128,
+            )
+    fbx_version: EnumProperty(
+            name="FBX Version",
+            items=(('7400', "FBX 7.4 Binary", "Most widely supported binary format, limited to files smaller than 4 GB"),
+                   ('7500', "FBX 7.5 Binary",
+                    "Binary format with 64-bit offsets, needed for files larger than 4 GB "
+                    "(not supported by older applications)"),
+                   ),
+            default='7400',
+            )
     batch_mode: EnumProperty(
             name="Batch Mode",
             items=(('OFF', "Off", "Active scene to file"),
@@ -671,6 +702,9 @@ class FBX_PT_export_main(bpy.types.Panel):
         sub = row.row(align=True)
         sub.enabled = (operator.path_mode == 'COPY')
         sub.prop(operator, "embed_textures", text="", icon='PACKAGE' if operator.embed_textures else 'UGLYPACKAGE')
+        layout.prop(operator, "fbx_version")
+        layout.prop(operator, "compression_level")
+        layout.prop(operator, "compression_threshold")
         row = layout.row(align=True)
         row.prop(operator, "batch_mode")
         sub = row.row(align=True)
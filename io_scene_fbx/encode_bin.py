@@ -25,12 +25,14 @@ try:
 except:
     import data_types
 
-from struct import pack
+from struct import pack, Struct
+from concurrent.futures import Future
 import array
 import zlib
 
-_BLOCK_SENTINEL_LENGTH = 13
-_BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
+_BLOCK_SENTINEL_LENGTH = ...
+_BLOCK_SENTINEL_DATA = ...
+_ELEM_HEAD_STRUCT = ...
 _IS_BIG_ENDIAN = (__import__("sys").byteorder != 'little')
 _HEAD_MAGIC = b'Kaydara FBX Binary\x20\x20\x00\x1a\x00'
 
@@ -46,6 +48,44 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
 
+# FBX 7500 (aka FBX2016) introduces incompatible changes at binary level:
+#   * The NULL block marking end of nested stuff switches from 13 bytes long to 25 bytes long.
+#   * The FBX element metadata (end_offset, prop_count and prop_length) switch from uint32 to uint64.
+def init_version(fbx_version):
+    global _BLOCK_SENTINEL_LENGTH, _BLOCK_SENTINEL_DATA, _ELEM_HEAD_STRUCT
+
+    if fbx_version < 7500:
+        _BLOCK_SENTINEL_LENGTH = 13
+        _ELEM_HEAD_STRUCT = Struct('<3I')
+    else:
+        _BLOCK_SENTINEL_LENGTH = 25
+        _ELEM_HEAD_STRUCT = Struct('<3Q')
+    _BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
+
+
+init_version(7400)
+
+
+# Arrays bigger than threshold (in bytes) get compressed, either immediately, or in background when an executor is
+# given (zlib releases the GIL, so this can use all cores while the rest of the element tree is being generated).
+_COMPRESSION_LEVEL = 1
+_COMPRESSION_THRESHOLD = 128
+_COMPRESSION_EXECUTOR = None
+
+
+def init_compression(level=1, threshold=128, executor=None):
+    global _COMPRESSION_LEVEL, _COMPRESSION_THRESHOLD, _COMPRESSION_EXECUTOR
+
+    _COMPRESSION_LEVEL = level
+    _COMPRESSION_THRESHOLD = threshold
+    _COMPRESSION_EXECUTOR = executor
+
+
+def _compress_array_data(length, data, level):
+    data = zlib.compress(data, level)
+    return pack('<3I', length, 1, len(data)) + data
+
+
 class FBXElem:
     __slots__ = (
         "id",
@@ -142,16 +182,14 @@ class FBXElem:
         data = data.tobytes()
 
         # mimic behavior of fbxconverter (also common sense)
-        # we could make this configurable.
-        encoding = 0 if len(data) <= 128 else 1
+        encoding = 0 if len(data) <= _COMPRESSION_THRESHOLD else 1
         if encoding == 0:
-            pass
-        elif encoding == 1:
-            data = zlib.compress(data, 1)
-
-        comp_len = len(data)
-
-        data = pack('<3I', length, encoding, comp_len) + data
+            data = pack('<3I', length, encoding, len(data)) + data
+        elif _COMPRESSION_EXECUTOR is None:
+            data = _compress_array_data(length, data, _COMPRESSION_LEVEL)
+        else:
+            # Future, resolved when computing offsets before writing.
+            data = _COMPRESSION_EXECUTOR.submit(_compress_array_data, length, data, _COMPRESSION_LEVEL)
 
         self.props_type.append(prop_type)
         self.props.append(data)
@@ -196,21 +234,26 @@ class FBXElem:
         assert(self._end_offset == -1)
         assert(self._props_length == -1)
 
-        offset += 12  # 3 uints
+        offset += _ELEM_HEAD_STRUCT.size  # 3 uints (or uint64 since 7500)
         offset += 1 + len(self.id)  # len + idname
 
-        props_length = 0
-        for data in self.props:
-            # 1 byte for the prop type
-            props_length += 1 + len(data)
-        self._props_length = props_length
-        offset += props_length
+        offset += self._calc_props_length()
 
         offset = self._calc_offsets_children(offset, is_last)
 
         self._end_offset = offset
         return offset
 
+    def _calc_props_length(self):
+        props_length = 0
+        for i, data in enumerate(self.props):
+            if isinstance(data, Future):
+                data = self.props[i] = data.result()
+            # 1 byte for the prop type
+            props_length += 1 + len(data)
+        self._props_length = props_length
+        return props_length
+
     def _calc_offsets_children(self, offset, is_last):
         if self.elems:
             elem_last = self.elems[-1]
@@ -227,7 +270,15 @@ class FBXElem:
         assert(self._end_offset != -1)
         assert(self._props_length != -1)
 
-        write(pack('<3I', self._end_offset, len(self.props), self._props_length))
+        self._write_head(write)
+        self._write_children(write, tell, is_last)
+
+        if tell() != self._end_offset:
+            raise IOError("scope length not reached, "
+                          "something is wrong (%d)" % (end_offset - tell()))
+
+    def _write_head(self, write):
+        write(_ELEM_HEAD_STRUCT.pack(self._end_offset, len(self.props), self._props_length))
 
         write(bytes((len(self.id),)))
         write(self.id)
@@ -236,12 +287,6 @@ class FBXElem:
             write(bytes((self.props_type[i],)))
             write(data)
 
-        self._write_children(write, tell, is_last)
-
-        if tell() != self._end_offset:
-            raise IOError("scope length not reached, "
-                          "something is wrong (%d)" % (end_offset - tell()))
-
     def _write_children(self, write, tell, is_last):
         if self.elems:
             elem_last = self.elems[-1]
@@ -254,53 +299,189 @@ class FBXElem:
                 write(_BLOCK_SENTINEL_DATA)
 
 
-def _write_timedate_hack(elem_root):
+def _write_timedate_hack_elem(elem):
     # perform 2 changes
     # - set the FileID
     # - set the CreationTime
+    # return True if given element was one of those.
+
+    if elem.id == b'FileId':
+        assert(elem.props_type[0] == b'R'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_bytes(_FILE_ID)
+        return True
+    elif elem.id == b'CreationTime':
+        assert(elem.props_type[0] == b'S'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_string(_TIME_ID)
+        return True
+    return False
+
+
+class FBXStreamWriter:
+    """
+    Incremental FBX binary writer.
+
+    Complete element subtrees are written to the file as soon as they are added (actually, once their next sibling
+    is known, since the last element of a scope may be written differently), so that they can be freed right away.
+    Elements may also be 'opened', in which case only their header and properties are written, their children are
+    then added one by one, and their end offset is back-patched when they get closed.
+    """
+    __slots__ = (
+        "_file",
+        "_filepath",  # Target path, the data is written to a temporary file (self._file) until closing.
+        "_version",
+        "_stack",  # [elem, head offset, is_last, pending child] items of opened elements, root first.
+        "_timedate_count",
+        )
 
-    ok = 0
-    for elem in elem_root.elems:
-        if elem.id == b'FileId':
-            assert(elem.props_type[0] == b'R'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_bytes(_FILE_ID)
-            ok += 1
-        elif elem.id == b'CreationTime':
-            assert(elem.props_type[0] == b'S'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_string(_TIME_ID)
-            ok += 1
+    def __init__(self, fn, version, compression_level=1, compression_threshold=128, compression_threads=1):
+        """
+        Array data added to elements while the writer is active is compressed with given settings,
+        by a pool of compression_threads threads (0 meaning as many as CPU cores) when it is not 1.
+        """
+        init_version(version)
+
+        executor = None
+        if compression_threads != 1:
+            import os
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=compression_threads or os.cpu_count())
+        init_compression(compression_level, compression_threshold, executor)
+
+        # Write to a temporary file next to the target one, so that an existing file is only replaced once
+        # the export succeeded.
+        import os
+        self._file = open("%s.%d.tmp" % (fn, os.getpid()), 'wb')
+        self._filepath = fn
+        self._version = version
+        self._stack = [[None, -1, False, None]]
+        self._timedate_count = 0
+
+        self._file.write(_HEAD_MAGIC)
+        self._file.write(pack('<I', version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            try:
+                self.close()
+            except BaseException:
+                self._discard()
+                raise
+        else:
+            self._discard()
+
+    def _discard(self):
+        """
+        Remove the temporary file, leaving the target path untouched.
+        """
+        import os
+        self._end_compression()
+        self._file.close()
+        if os.path.exists(self._file.name):
+            os.remove(self._file.name)
+
+    @staticmethod
+    def _end_compression():
+        if _COMPRESSION_EXECUTOR is not None:
+            _COMPRESSION_EXECUTOR.shutdown()
+        init_compression()
+
+    def _write_elem(self, elem, is_last):
+        f = self._file
+        elem._calc_offsets(f.tell(), is_last)
+        elem._write(f.write, f.tell, is_last)
+
+    def _flush_pending(self, is_last):
+        item = self._stack[-1]
+        if item[3] is not None:
+            self._write_elem(item[3], is_last)
+            item[3] = None
+            return True
+        return False
+
+    def add_elem(self, elem):
+        """
+        Add a complete element (with all its children) to the currently opened one.
+        """
+        assert(elem.id != b'')
+        self._flush_pending(False)
+        item = self._stack[-1]
+        if len(self._stack) == 1 and self._timedate_count < 2:
+            # hack since we don't decode time.
+            # ideally we would _not_ modify this data.
+            self._timedate_count += _write_timedate_hack_elem(elem)
+        item[3] = elem
+
+    def add_children(self, elem):
+        """
+        Add (and then remove) all children of given element to the currently opened one.
+        """
+        for sub_elem in elem.elems:
+            self.add_elem(sub_elem)
+        elem.elems.clear()
 
-        if ok == 2:
-            break
+    def open_elem(self, elem, is_last=False):
+        """
+        Start writing given element, which must not have children yet.
+        is_last tells whether it will be the last child of its parent.
+        """
+        assert(elem.id != b'' and not elem.elems)
+        self._flush_pending(False)
 
-    if ok != 2:
-        print("Missing fields!")
+        f = self._file
+        head_offset = f.tell()
+        elem._end_offset = 0  # Will be patched once closed.
+        elem._calc_props_length()
+        elem._write_head(f.write)
+        self._stack.append([elem, head_offset, is_last, None])
 
+    def close_elem(self):
+        """
+        Finish writing the last opened element.
+        """
+        assert(len(self._stack) > 1)
+        f = self._file
+        if self._flush_pending(True):
+            f.write(_BLOCK_SENTINEL_DATA)
+            has_children = True
+        else:
+            has_children = False
+        elem, head_offset, is_last, _pending = self._stack.pop()
+        if not has_children and (not elem.props or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL):
+            if not is_last:
+                f.write(_BLOCK_SENTINEL_DATA)
 
-def write(fn, elem_root, version):
-    assert(elem_root.id == b'')
+        end_offset = f.tell()
+        elem._end_offset = end_offset
+        f.seek(head_offset)
+        f.write(_ELEM_HEAD_STRUCT.pack(end_offset, len(elem.props), elem._props_length))
+        f.seek(end_offset)
 
-    with open(fn, 'wb') as f:
+    def close(self):
+        """
+        Finish writing the file (all opened elements must have been closed).
+        """
+        assert(len(self._stack) == 1)
+        f = self._file
         write = f.write
         tell = f.tell
 
-        write(_HEAD_MAGIC)
-        write(pack('<I', version))
+        # The root element has no props, hence its children block always ends with a sentinel.
+        self._flush_pending(True)
+        write(_BLOCK_SENTINEL_DATA)
 
-        # hack since we don't decode time.
-        # ideally we would _not_ modify this data.
-        _write_timedate_hack(elem_root)
-
-        elem_root._calc_offsets_children(tell(), False)
-        elem_root._write_children(write, tell, False)
+        if self._timedate_count != 2:
+            print("Missing fields!")
 
         write(_FOOT_ID)
         write(b'\x00' * 4)
@@ -314,8 +495,21 @@ def write(fn, elem_root, version):
 
         write(b'\0' * pad)
 
-        write(pack('<I', version))
+        write(pack('<I', self._version))
 
         # unknown magic (always the same)
         write(b'\0' * 120)
         write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+
+        f.close()
+        self._end_compression()
+
+        import os
+        os.replace(f.name, self._filepath)
+
+
+def write(fn, elem_root, version):
+    assert(elem_root.id == b'')
+
+    with FBXStreamWriter(fn, version) as stream:
+        stream.add_children(elem_root)
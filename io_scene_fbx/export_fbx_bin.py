@@ -43,10 +43,12 @@ import bpy_extras
 from bpy_extras import node_shader_utils
 from mathutils import Vector, Matrix
 
+import numpy as np
+
 from . import encode_bin, data_types, fbx_utils
 from .fbx_utils import (
     # Constants.
-    FBX_VERSION, FBX_HEADER_VERSION, FBX_SCENEINFO_VERSION, FBX_TEMPLATES_VERSION,
+    FBX_HEADER_VERSION, FBX_SCENEINFO_VERSION, FBX_TEMPLATES_VERSION,
     FBX_MODELS_VERSION,
     FBX_GEOMETRY_VERSION, FBX_GEOMETRY_NORMAL_VERSION, FBX_GEOMETRY_BINORMAL_VERSION, FBX_GEOMETRY_TANGENT_VERSION,
     FBX_GEOMETRY_SMOOTHING_VERSION, FBX_GEOMETRY_CREASE_VERSION, FBX_GEOMETRY_VCOLOR_VERSION, FBX_GEOMETRY_UV_VERSION,
@@ -99,7 +101,6 @@ from .fbx_utils import (
 
 # Units convertors!
 convert_sec_to_ktime = units_convertor("second", "ktime")
-convert_sec_to_ktime_iter = units_convertor_iter("second", "ktime")
 
 convert_mm_to_inch = units_convertor("millimeter", "inch")
 
@@ -1725,7 +1726,12 @@ def fbx_data_animation_elements(root, scene_data):
     fps = scene.render.fps / scene.render.fps_base
 
     def keys_to_ktimes(keys):
-        return (int(v) for v in convert_sec_to_ktime_iter((f / fps for f, _v in keys)))
+        # astype() truncates like int() does.
+        ktimes = convert_sec_to_ktime(keys.times / fps).astype(np.int64)
+        return array.array(data_types.ARRAY_INT64, ktimes.tobytes())
+
+    def keys_to_values(keys):
+        return array.array(data_types.ARRAY_FLOAT32, keys.values.astype(np.float32).tobytes())
 
     # Animation stacks.
     for astack_key, alayers, alayer_key, name, f_start, f_end in animations:
@@ -1792,7 +1798,7 @@ def fbx_data_animation_elements(root, scene_data):
                         elem_data_single_float64(acurve, b"Default", def_value)
                         elem_data_single_int32(acurve, b"KeyVer", FBX_ANIM_KEY_VERSION)
                         elem_data_single_int64_array(acurve, b"KeyTime", keys_to_ktimes(keys))
-                        elem_data_single_float32_array(acurve, b"KeyValueFloat", (v for _f, v in keys))
+                        elem_data_single_float32_array(acurve, b"KeyValueFloat", keys_to_values(keys))
                         elem_data_single_int32_array(acurve, b"KeyAttrFlags", keyattr_flags)
                         elem_data_single_float32_array(acurve, b"KeyAttrDataFloat", keyattr_datafloat)
                         elem_data_single_int32_array(acurve, b"KeyAttrRefCount", (nbr_keys,))
@@ -2705,7 +2711,7 @@ def fbx_header_elements(root, scene_data, time=None):
 
     elem_data_single_int32(header_ext, b"FBXHeaderVersion", FBX_HEADER_VERSION)
 
-    elem_data_single_int32(header_ext, b"FBXVersion", FBX_VERSION)
+    elem_data_single_int32(header_ext, b"FBXVersion", scene_data.settings.fbx_version)
 
     # No encryption!
     elem_data_single_int32(header_ext, b"EncryptionType", 0)
@@ -2863,28 +2869,40 @@ def fbx_definitions_elements(root, scene_data):
     fbx_templates_generate(definitions, scene_data.templates)
 
 
-def fbx_objects_elements(root, scene_data):
+def fbx_objects_elements(root, scene_data, stream=None):
     """
     Data (objects, geometry, material, textures, armatures, etc.).
+    If an encode_bin.FBXStreamWriter is given, generated elements are written (and freed) as soon as possible.
     """
     perfmon = PerfMon()
     perfmon.level_up()
-    objects = elem_empty(root, b"Objects")
+    if stream is None:
+        objects = elem_empty(root, b"Objects")
+    else:
+        objects = elem_empty(None, b"Objects")
+        stream.open_elem(objects)
+
+    def flush():
+        if stream is not None:
+            stream.add_children(objects)
 
     perfmon.step("FBX export fetch empties (%d)..." % len(scene_data.data_empties))
 
     for empty in scene_data.data_empties:
         fbx_data_empty_elements(objects, empty, scene_data)
+        flush()
 
     perfmon.step("FBX export fetch lamps (%d)..." % len(scene_data.data_lights))
 
     for lamp in scene_data.data_lights:
         fbx_data_light_elements(objects, lamp, scene_data)
+        flush()
 
     perfmon.step("FBX export fetch cameras (%d)..." % len(scene_data.data_cameras))
 
     for cam in scene_data.data_cameras:
         fbx_data_camera_elements(objects, cam, scene_data)
+        flush()
 
     perfmon.step("FBX export fetch meshes (%d)..."
                  % len({me_key for me_key, _me, _free in scene_data.data_meshes.values()}))
@@ -2892,6 +2910,7 @@ def fbx_objects_elements(root, scene_data):
     done_meshes = set()
     for me_obj in scene_data.data_meshes:
         fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
+        flush()
     del done_meshes
 
     perfmon.step("FBX export fetch objects (%d)..." % len(scene_data.objects))
@@ -2904,6 +2923,7 @@ def fbx_objects_elements(root, scene_data):
             if dp_obj not in scene_data.objects:
                 continue
             fbx_data_object_elements(objects, dp_obj, scene_data)
+            flush()
 
     perfmon.step("FBX export fetch remaining...")
 
@@ -2911,24 +2931,33 @@ def fbx_objects_elements(root, scene_data):
         if not (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
             continue
         fbx_data_armature_elements(objects, ob_obj, scene_data)
+        flush()
 
     if scene_data.data_leaf_bones:
         fbx_data_leaf_bone_elements(objects, scene_data)
+        flush()
 
     for ma in scene_data.data_materials:
         fbx_data_material_elements(objects, ma, scene_data)
+        flush()
 
     for blender_tex_key in scene_data.data_textures:
         fbx_data_texture_file_elements(objects, blender_tex_key, scene_data)
+        flush()
 
     for vid in scene_data.data_videos:
         fbx_data_video_elements(objects, vid, scene_data)
+        flush()
 
     perfmon.step("FBX export fetch animations...")
     start_time = time.process_time()
 
     fbx_data_animation_elements(objects, scene_data)
 
+    if stream is not None:
+        flush()
+        stream.close_elem()
+
     perfmon.level_down()
 
 
@@ -3000,6 +3029,9 @@ def save_single(operator, scene, depsgraph, filepath="",
                 use_custom_props=False,
                 bake_space_transform=False,
                 armature_nodetype='NULL',
+                fbx_version='7400',
+                compression_level=1,
+                compression_threshold=128,
                 **kwargs
                 ):
 
@@ -3067,7 +3099,7 @@ def save_single(operator, scene, depsgraph, filepath="",
         add_leaf_bones, bone_correction_matrix, bone_correction_matrix_inv,
         bake_anim, bake_anim_use_all_bones, bake_anim_use_nla_strips, bake_anim_use_all_actions,
         bake_anim_step, bake_anim_simplify_factor, bake_anim_force_startend_keying,
-        False, media_settings, use_custom_props,
+        False, media_settings, use_custom_props, int(fbx_version),
     )
 
     import bpy_extras.io_utils
@@ -3080,30 +3112,33 @@ def save_single(operator, scene, depsgraph, filepath="",
 
     root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
 
-    # Mostly FBXHeaderExtension and GlobalSettings.
-    fbx_header_elements(root, scene_data)
-
-    # Documents and References are pretty much void currently.
-    fbx_documents_elements(root, scene_data)
-    fbx_references_elements(root, scene_data)
+    # Elements are streamed to the file as soon as they are complete, this avoids keeping the whole tree in memory.
+    # Array data is compressed in background threads while the tree is being generated.
+    with encode_bin.FBXStreamWriter(filepath, settings.fbx_version, compression_level, compression_threshold,
+                                    compression_threads=0) as stream:
+        # Mostly FBXHeaderExtension and GlobalSettings.
+        fbx_header_elements(root, scene_data)
 
-    # Templates definitions.
-    fbx_definitions_elements(root, scene_data)
+        # Documents and References are pretty much void currently.
+        fbx_documents_elements(root, scene_data)
+        fbx_references_elements(root, scene_data)
 
-    # Actual data.
-    fbx_objects_elements(root, scene_data)
+        # Templates definitions.
+        fbx_definitions_elements(root, scene_data)
+        stream.add_children(root)
 
-    # How data are inter-connected.
-    fbx_connections_elements(root, scene_data)
+        # Actual data.
+        fbx_objects_elements(root, scene_data, stream)
 
-    # Animation.
-    fbx_takes_elements(root, scene_data)
+        # How data are inter-connected.
+        fbx_connections_elements(root, scene_data)
 
-    # Cleanup!
-    fbx_scene_data_cleanup(scene_data)
+        # Animation.
+        fbx_takes_elements(root, scene_data)
+        stream.add_children(root)
 
-    # And we are down, we can write the whole thing!
-    encode_bin.write(filepath, root, FBX_VERSION)
+        # Cleanup!
+        fbx_scene_data_cleanup(scene_data)
 
     # Clear cached ObjectWrappers!
     ObjectWrapper.cache_clear()
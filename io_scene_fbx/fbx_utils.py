@@ -21,6 +21,7 @@
 # Script copyright (C) Campbell Barton, Bastien Montagne
 
 
+import array
 import math
 import time
 
@@ -33,6 +34,8 @@ import bpy_extras
 from bpy.types import Object, Bone, PoseBone, DepsgraphObjectInstance
 from mathutils import Vector, Matrix
 
+import numpy as np
+
 from . import encode_bin, data_types
 
 
@@ -719,13 +722,27 @@ def fbx_templates_generate(root, fbx_templates):
 # ##### FBX animation helpers. #####
 
 
+class AnimationCurveKeys:
+    """
+    Keyframes of a single FBX AnimationCurve, as two arrays of same length (times in frames, and values).
+    """
+    __slots__ = ('times', 'values')
+
+    def __init__(self, times, values):
+        self.times = times
+        self.values = values
+
+    def __len__(self):
+        return len(self.times)
+
+
 class AnimationCurveNodeWrapper:
     """
     This class provides a same common interface for all (FBX-wise) AnimationCurveNode and AnimationCurve elements,
     and easy API to handle those.
     """
     __slots__ = (
-        'elem_keys', '_keys', 'default_values', 'fbx_group', 'fbx_gname', 'fbx_props',
+        'elem_keys', '_frames', '_values', '_write', 'default_values', 'fbx_group', 'fbx_gname', 'fbx_props',
         'force_keying', 'force_startend_keying')
 
     kinds = {
@@ -744,7 +761,11 @@ class AnimationCurveNodeWrapper:
         self.fbx_props = [self.kinds[kind][2]]
         self.force_keying = force_keying
         self.force_startend_keying = force_startend_keying
-        self._keys = []  # (frame, values, write_flags)
+        # Sampled frames, and values of each channel, as contiguous arrays.
+        self._frames = array.array('d')
+        self._values = tuple(array.array('d') for _p in self.fbx_props[0])
+        # (channels, keys) array of booleans telling which keys to write, None meaning 'write everything'.
+        self._write = None
         if default_values is not ...:
             assert(len(default_values) == len(self.fbx_props[0]))
             self.default_values = default_values
@@ -753,7 +774,7 @@ class AnimationCurveNodeWrapper:
 
     def __bool__(self):
         # We are 'True' if we do have some validated keyframes...
-        return bool(self._keys) and (True in ((True in k[2]) for k in self._keys))
+        return bool(self._frames) and (self._write is None or bool(self._write.any()))
 
     def add_group(self, elem_key, fbx_group, fbx_gname, fbx_props):
         """
@@ -771,14 +792,20 @@ class AnimationCurveNodeWrapper:
         Add a new keyframe to all curves of the group.
         """
         assert(len(values) == len(self.fbx_props[0]))
-        self._keys.append((frame, values, [True] * len(values)))  # write everything by default.
+        self._frames.append(frame)
+        for channel, val in zip(self._values, values):
+            channel.append(val)
+        self._write = None  # write everything by default.
+
+    def _values_as_array(self):
+        return np.array(self._values, dtype=np.float64).reshape(len(self._values), len(self._frames))
 
     def simplify(self, fac, step, force_keep=False):
         """
         Simplifies sampled curves by only enabling samples when:
             * their values relatively differ from the previous sample ones.
         """
-        if not self._keys:
+        if not self._frames:
             return
 
         if fac == 0.0:
@@ -787,36 +814,48 @@ class AnimationCurveNodeWrapper:
         # So that, with default factor and step values (1), we get:
         min_reldiff_fac = fac * 1.0e-3  # min relative value evolution: 0.1% of current 'order of magnitude'.
         min_absdiff_fac = 0.1  # A tenth of reldiff...
-        keys = self._keys
-
-        p_currframe, p_key, p_key_write = keys[0]
-        p_keyed = list(p_key)
-        are_keyed = [False] * len(p_key)
-        for currframe, key, key_write in keys:
-            for idx, (val, p_val) in enumerate(zip(key, p_key)):
-                key_write[idx] = False
-                p_keyedval = p_keyed[idx]
-                if val == p_val:
-                    # Never write keyframe when value is exactly the same as prev one!
-                    continue
-                # This is contracted form of relative + absolute-near-zero difference:
-                #     absdiff = abs(a - b)
-                #     if absdiff < min_reldiff_fac * min_absdiff_fac:
-                #         return False
-                #     return (absdiff / ((abs(a) + abs(b)) / 2)) > min_reldiff_fac
-                # Note that we ignore the '/ 2' part here, since it's not much significant for us.
-                if abs(val - p_val) > (min_reldiff_fac * max(abs(val) + abs(p_val), min_absdiff_fac)):
-                    # If enough difference from previous sampled value, key this value *and* the previous one!
-                    key_write[idx] = True
-                    p_key_write[idx] = True
-                    p_keyed[idx] = val
-                    are_keyed[idx] = True
-                elif abs(val - p_keyedval) > (min_reldiff_fac * max((abs(val) + abs(p_keyedval)), min_absdiff_fac)):
-                    # Else, if enough difference from previous keyed value, key this value only!
-                    key_write[idx] = True
-                    p_keyed[idx] = val
+        values = self._values_as_array()
+        num_keys = values.shape[1]
+
+        # This is contracted form of relative + absolute-near-zero difference:
+        #     absdiff = abs(a - b)
+        #     if absdiff < min_reldiff_fac * min_absdiff_fac:
+        #         return False
+        #     return (absdiff / ((abs(a) + abs(b)) / 2)) > min_reldiff_fac
+        # Note that we ignore the '/ 2' part here, since it's not much significant for us.
+        vals = values[:, 1:]
+        p_vals = values[:, :-1]
+        # Never write keyframe when value is exactly the same as prev one!
+        is_diff = vals != p_vals
+        # If enough difference from previous sampled value, key this value *and* the previous one!
+        is_keyed_prev = is_diff & (np.abs(vals - p_vals) >
+                                   (min_reldiff_fac * np.maximum(np.abs(vals) + np.abs(p_vals), min_absdiff_fac)))
+        write = np.zeros(values.shape, dtype=bool)
+        write[:, 1:] |= is_keyed_prev
+        write[:, :-1] |= is_keyed_prev
+        are_keyed = is_keyed_prev.any(axis=1)
+
+        # Else, if enough difference from previous keyed value, key this value only!
+        # This depends on previous decisions, so remaining candidates have to be checked in order,
+        # the previous keyed value being the latest one keyed either way (or the first one).
+        indices = np.arange(num_keys)
+        for idx, (channel_vals, channel_diff, channel_keyed_prev) in enumerate(zip(values, is_diff, is_keyed_prev)):
+            candidates = np.flatnonzero(channel_diff & ~channel_keyed_prev) + 1
+            if not len(candidates):
+                continue
+            last_keyed_prev = np.maximum.accumulate(np.where(np.append(False, channel_keyed_prev), indices, 0))
+            channel_vals = channel_vals.tolist()
+            channel_write = write[idx]
+            last_keyed = 0
+            for i, last_kp in zip(candidates.tolist(), last_keyed_prev[candidates].tolist()):
+                val = channel_vals[i]
+                p_keyedval = channel_vals[max(last_keyed, last_kp)]
+                if abs(val - p_keyedval) > (min_reldiff_fac * max((abs(val) + abs(p_keyedval)), min_absdiff_fac)):
+                    channel_write[i] = True
+                    last_keyed = i
                     are_keyed[idx] = True
-            p_currframe, p_key, p_key_write = currframe, key, key_write
+
+        self._write = write
 
         # If we write nothing (action doing nothing) and are in 'force_keep' mode, we key everything! :P
         # See T41766.
@@ -825,24 +864,25 @@ class AnimationCurveNodeWrapper:
         # one key in this case.
         # See T41719, T41605, T41254...
         if self.force_keying or (force_keep and not self):
-            are_keyed[:] = [True] * len(are_keyed)
+            are_keyed[:] = True
 
         # If we did key something, ensure first and last sampled values are keyed as well.
         if self.force_startend_keying:
-            for idx, is_keyed in enumerate(are_keyed):
-                if is_keyed:
-                    keys[0][2][idx] = keys[-1][2][idx] = True
+            write[are_keyed, 0] = True
+            write[are_keyed, -1] = True
 
     def get_final_data(self, scene, ref_id, force_keep=False):
         """
         Yield final anim data for this 'curvenode' (for all curvenodes defined).
         force_keep is to force to keep a curve even if it only has one valid keyframe.
         """
-        curves = [[] for k in self._keys[0][1]]
-        for currframe, key, key_write in self._keys:
-            for curve, val, wrt in zip(curves, key, key_write):
-                if wrt:
-                    curve.append((currframe, val))
+        frames = np.array(self._frames, dtype=np.float64)
+        values = self._values_as_array()
+        if self._write is None:
+            curves = [AnimationCurveKeys(frames, channel_vals) for channel_vals in values]
+        else:
+            curves = [AnimationCurveKeys(frames[channel_write], channel_vals[channel_write])
+                      for channel_vals, channel_write in zip(values, self._write)]
 
         force_keep = force_keep or self.force_keying
         for elem_key, fbx_group, fbx_gname, fbx_props in \
@@ -1229,7 +1269,7 @@ FBXExportSettings = namedtuple("FBXExportSettings", (
     "bone_correction_matrix", "bone_correction_matrix_inv",
     "bake_anim", "bake_anim_use_all_bones", "bake_anim_use_nla_strips", "bake_anim_use_all_actions",
     "bake_anim_step", "bake_anim_simplify_factor", "bake_anim_force_startend_keying",
-    "use_metadata", "media_settings", "use_custom_props",
+    "use_metadata", "media_settings", "use_custom_props", "fbx_version",
 ))
 
 # Helper container gathering some data we need multiple times:
@@ -35,6 +35,8 @@ if "bpy" in locals():
 import bpy
 from mathutils import Matrix, Euler, Vector
 
+import numpy as np
+
 # -----
 # Utils
 from . import parse_fbx, fbx_utils
@@ -862,6 +864,101 @@ def blen_read_geom_array_gen_direct_looptovert(mesh, fbx_data, stride):
                 yield lidx, vidx * stride
 
 
+# vectorized (numpy) counterparts of above generic setter and generators,
+# used for common mappings of Blender data supporting foreach_get/foreach_set.
+BLEN_DOMAIN_FBX_MAPPING = {
+    'VERTEX': b'ByVertice',
+    'EDGE': b'ByEdge',
+    'POLYGON': b'ByPolygon',
+    'LOOP': b'ByPolygonVertex',
+}
+
+
+def blen_read_geom_array_np_index_map(mesh, blen_domain, blen_len, fbx_items_len,
+                                      fbx_layer_index, fbx_layer_mapping, fbx_layer_ref):
+    """
+    Return an array giving, for each Blender element of given domain, the index of the FBX item to use
+    (negative values meaning 'skip'), or None if this mapping is not supported here.
+    """
+    if fbx_layer_mapping == b'AllSame':
+        if fbx_layer_ref != b'IndexToDirect' or fbx_layer_index is not None or fbx_items_len == 0:
+            return None
+        return np.zeros(blen_len, dtype=np.int64)
+
+    if fbx_layer_mapping == b'ByVertice' and blen_domain == 'LOOP':
+        if fbx_layer_ref != b'Direct' or fbx_layer_index is not None:
+            return None
+        index_map = np.empty(blen_len, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", index_map)
+        index_map[index_map >= fbx_items_len] = -1
+        return index_map
+
+    if fbx_layer_mapping != BLEN_DOMAIN_FBX_MAPPING[blen_domain]:
+        return None
+
+    # XXX Looks like we often get no fbx_layer_index with IndexToDirect, shall not happen but happens...
+    #     We fallback to 'Direct' mapping in this case.
+    use_index = blen_domain in {'POLYGON', 'LOOP'} and fbx_layer_ref == b'IndexToDirect'
+    if use_index and fbx_layer_index is not None:
+        index_map = np.asarray(fbx_layer_index, dtype=np.int64)
+        index_map = np.where(index_map < fbx_items_len, index_map, -1)
+    elif use_index or fbx_layer_ref == b'Direct':
+        index_map = np.arange(fbx_items_len, dtype=np.int64)
+    else:
+        return None
+
+    if len(index_map) > blen_len:
+        print("ERROR: too much data in this layer, compared to elements in mesh, skipping!")
+        index_map = index_map[:blen_len]
+    elif len(index_map) < blen_len:
+        index_map = np.concatenate((index_map, np.full(blen_len - len(index_map), -1, dtype=index_map.dtype)))
+    return index_map
+
+
+def blen_read_geom_array_np_foreach_set(blen_data, blen_attr, blen_dtype, fbx_data, stride, item_size,
+                                        index_map, xform=None):
+    """
+    Set blen_attr of all blen_data items at once, from fbx_data items selected by index_map.
+    xform, if given, shall operate on a (num_items, item_size) array.
+    """
+    fbx_items = np.asarray(fbx_data)
+    fbx_items = fbx_items[:(len(fbx_items) // stride) * stride].reshape(-1, stride)[:, :item_size]
+
+    valid = index_map >= 0
+    if valid.all():
+        values = fbx_items[index_map]
+        if xform is not None:
+            values = xform(values)
+    else:
+        # Skipped items keep their current values.
+        values = np.empty((len(index_map), item_size), dtype=blen_dtype)
+        blen_data.foreach_get(blen_attr, values.ravel())
+        fbx_values = fbx_items[index_map[valid]]
+        values[valid] = fbx_values if xform is None else xform(fbx_values)
+
+    blen_data.foreach_set(blen_attr, np.ascontiguousarray(values, dtype=blen_dtype).ravel())
+
+
+def blen_read_geom_array_np_mapped(
+        mesh, blen_data, blen_attr, blen_domain, blen_dtype,
+        fbx_layer_data, fbx_layer_index,
+        fbx_layer_mapping, fbx_layer_ref,
+        stride, item_size,
+        xform=None,
+        ):
+    """
+    Vectorized version of blen_read_geom_array_mapped_* functions, return False when the mapping is not handled,
+    in which case caller shall use the generic (per-item) path.
+    """
+    index_map = blen_read_geom_array_np_index_map(mesh, blen_domain, len(blen_data), len(fbx_layer_data) // stride,
+                                                  fbx_layer_index, fbx_layer_mapping, fbx_layer_ref)
+    if index_map is None:
+        return False
+    blen_read_geom_array_np_foreach_set(blen_data, blen_attr, blen_dtype, fbx_layer_data, stride, item_size,
+                                        index_map, xform)
+    return True
+
+
 # generic error printers.
 def blen_read_geom_array_error_mapping(descr, fbx_layer_mapping, quiet=False):
     if not quiet:
@@ -1022,6 +1119,13 @@ def blen_read_geom_layer_material(fbx_obj, mesh):
     fbx_layer_data = elem_prop_first(elem_find_first(fbx_layer, layer_id))
 
     blen_data = mesh.polygons
+    if blen_read_geom_array_np_mapped(
+            mesh, blen_data, "material_index", 'POLYGON', np.int32,
+            fbx_layer_data, None,
+            fbx_layer_mapping, fbx_layer_ref,
+            1, 1,
+            ):
+        return
     blen_read_geom_array_mapped_polygon(
         mesh, blen_data, "material_index",
         fbx_layer_data, None,
@@ -1056,6 +1160,14 @@ def blen_read_geom_layer_uv(fbx_obj, mesh):
                 print("%r %r missing data" % (layer_id, fbx_layer_name))
                 continue
 
+            if blen_read_geom_array_np_mapped(
+                    mesh, blen_data, "uv", 'LOOP', np.float32,
+                    fbx_layer_data, fbx_layer_index,
+                    fbx_layer_mapping, fbx_layer_ref,
+                    2, 2,
+                    ):
+                continue
+
             blen_read_geom_array_mapped_polyloop(
                 mesh, blen_data, "uv",
                 fbx_layer_data, fbx_layer_index,
@@ -1092,6 +1204,14 @@ def blen_read_geom_layer_color(fbx_obj, mesh):
                 print("%r %r missing data" % (layer_id, fbx_layer_name))
                 continue
 
+            if blen_read_geom_array_np_mapped(
+                    mesh, blen_data, "color", 'LOOP', np.float32,
+                    fbx_layer_data, fbx_layer_index,
+                    fbx_layer_mapping, fbx_layer_ref,
+                    4, 4,
+                    ):
+                continue
+
             blen_read_geom_array_mapped_polyloop(
                 mesh, blen_data, "color",
                 fbx_layer_data, fbx_layer_index,
@@ -1126,18 +1246,33 @@ def blen_read_geom_layer_smooth(fbx_obj, mesh):
             return False
 
         blen_data = mesh.edges
-        blen_read_geom_array_mapped_edge(
-            mesh, blen_data, "use_edge_sharp",
-            fbx_layer_data, None,
-            fbx_layer_mapping, fbx_layer_ref,
-            1, 1, layer_id,
-            xform=lambda s: not s,
-            )
+        if not blen_read_geom_array_np_mapped(
+                mesh, blen_data, "use_edge_sharp", 'EDGE', bool,
+                fbx_layer_data, None,
+                fbx_layer_mapping, fbx_layer_ref,
+                1, 1,
+                xform=np.logical_not,
+                ):
+            blen_read_geom_array_mapped_edge(
+                mesh, blen_data, "use_edge_sharp",
+                fbx_layer_data, None,
+                fbx_layer_mapping, fbx_layer_ref,
+                1, 1, layer_id,
+                xform=lambda s: not s,
+                )
         # We only set sharp edges here, not face smoothing itself...
         mesh.use_auto_smooth = True
         return False
     elif fbx_layer_mapping == b'ByPolygon':
         blen_data = mesh.polygons
+        if blen_read_geom_array_np_mapped(
+                mesh, blen_data, "use_smooth", 'POLYGON', bool,
+                fbx_layer_data, None,
+                fbx_layer_mapping, fbx_layer_ref,
+                1, 1,
+                xform=lambda s: (s != 0),  # smoothgroup bitflags, treat as booleans for now
+                ):
+            return True
         return blen_read_geom_array_mapped_polygon(
             mesh, blen_data, "use_smooth",
             fbx_layer_data, None,
@@ -1181,6 +1316,16 @@ def blen_read_geom_layer_edge_crease(fbx_obj, mesh):
             return False
 
         blen_data = mesh.edges
+        if blen_read_geom_array_np_mapped(
+                mesh, blen_data, "crease", 'EDGE', np.float32,
+                fbx_layer_data, None,
+                fbx_layer_mapping, fbx_layer_ref,
+                1, 1,
+                # Blender squares those values before sending them to OpenSubdiv, when other softwares don't,
+                # so we need to compensate that to get similar results through FBX...
+                xform=np.sqrt,
+                ):
+            return True
         return blen_read_geom_array_mapped_edge(
             mesh, blen_data, "crease",
             fbx_layer_data, None,
@@ -1194,7 +1339,7 @@ def blen_read_geom_layer_edge_crease(fbx_obj, mesh):
         print("warning layer %r mapping type unsupported: %r" % (fbx_layer.id, fbx_layer_mapping))
         return False
 
-def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
+def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None, xform_np=None):
     fbx_layer = elem_find_first(fbx_obj, b'LayerElementNormal')
 
     if fbx_layer is None:
@@ -1213,6 +1358,32 @@ def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
         print("warning %r %r missing data" % (layer_id, fbx_layer_name))
         return False
 
+    # Vectorized path: map FBX normals to loops, either directly, or through polygons or vertices.
+    num_loops = len(mesh.loops)
+    fbx_items_len = len(fbx_layer_data) // 3
+    index_map = blen_read_geom_array_np_index_map(mesh, 'LOOP', num_loops, fbx_items_len,
+                                                  fbx_layer_index, fbx_layer_mapping, fbx_layer_ref)
+    if index_map is None:
+        for blen_domain, blen_len, loop_attr in (('POLYGON', len(mesh.polygons), None),
+                                                 ('VERTEX', len(mesh.vertices), "vertex_index")):
+            elem_index_map = blen_read_geom_array_np_index_map(mesh, blen_domain, blen_len, fbx_items_len,
+                                                               fbx_layer_index, fbx_layer_mapping, fbx_layer_ref)
+            if elem_index_map is None:
+                continue
+            if loop_attr is None:
+                loop_totals = np.empty(blen_len, dtype=np.int32)
+                mesh.polygons.foreach_get("loop_total", loop_totals)
+                loop_elems = np.repeat(np.arange(blen_len), loop_totals)
+            else:
+                loop_elems = np.empty(num_loops, dtype=np.int32)
+                mesh.loops.foreach_get(loop_attr, loop_elems)
+            index_map = elem_index_map[loop_elems]
+            break
+    if index_map is not None:
+        blen_read_geom_array_np_foreach_set(mesh.loops, "normal", np.float32, fbx_layer_data, 3, 3,
+                                            index_map, xform_np)
+        return True
+
     # try loops, then vertices.
     tries = ((mesh.loops, "Loops", False, blen_read_geom_array_mapped_polyloop),
              (mesh.polygons, "Polygons", True, blen_read_geom_array_mapped_polygon),
@@ -1340,7 +1511,12 @@ def blen_read_geom(fbx_tmpl, fbx_obj, settings):
         else:
             def nortrans(v):
                 return geom_mat_no @ Vector(v)
-            ok_normals = blen_read_geom_layer_normal(fbx_obj, mesh, nortrans)
+            # Translation has been removed, so only the 3x3 part of the matrix matters.
+            geom_mat_no_np = np.array(geom_mat_no.to_3x3(), dtype=np.float64)
+
+            def nortrans_np(vecs):
+                return vecs @ geom_mat_no_np.T
+            ok_normals = blen_read_geom_layer_normal(fbx_obj, mesh, nortrans, nortrans_np)
 
     mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
@@ -2363,7 +2539,8 @@ def load(operator, context, filepath="",
          automatic_bone_orientation=False,
          primary_bone_axis='Y',
          secondary_bone_axis='X',
-         use_prepost_rot=True):
+         use_prepost_rot=True,
+         decompress_threads=1):
 
     global fbx_elem_nil
     fbx_elem_nil = FBXElem('', (), (), ())
@@ -2403,7 +2580,7 @@ def load(operator, context, filepath="",
     # End ascii detection.
 
     try:
-        elem_root, version = parse_fbx.parse(filepath)
+        elem_root, version = parse_fbx.parse(filepath, use_lazy=True, decompress_threads=decompress_threads)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -23,22 +23,27 @@
 
 __all__ = (
     "parse",
+    "parse_lazy",
     "data_types",
     "parse_version",
     "FBXElem",
     )
 
-from struct import unpack
+from struct import unpack, Struct
 import array
 import zlib
 
-from . import data_types
+try:
+    from . import data_types
+except:
+    import data_types
 
 # at the end of each nested block, there is a NUL record to indicate
 # that the sub-scope exists (i.e. to distinguish between P: and P : {})
 _BLOCK_SENTINEL_LENGTH = ...
 _BLOCK_SENTINEL_DATA = ...
 read_fbx_elem_uint = ...
+_ELEM_HEAD_STRUCT = ...
 _IS_BIG_ENDIAN = (__import__("sys").byteorder != 'little')
 _HEAD_MAGIC = b'Kaydara FBX Binary\x20\x20\x00\x1a\x00'
 from collections import namedtuple
@@ -106,18 +111,21 @@ read_data_dict = {
 #   * The NULL block marking end of nested stuff switches from 13 bytes long to 25 bytes long.
 #   * The FBX element metadata (end_offset, prop_count and prop_length) switch from uint32 to uint64.
 def init_version(fbx_version):
-    global _BLOCK_SENTINEL_LENGTH, _BLOCK_SENTINEL_DATA, read_fbx_elem_uint
+    global _BLOCK_SENTINEL_LENGTH, _BLOCK_SENTINEL_DATA, read_fbx_elem_uint, _ELEM_HEAD_STRUCT
 
     _BLOCK_SENTINEL_LENGTH = ...
     _BLOCK_SENTINEL_DATA = ...
     read_fbx_elem_uint = ...
+    _ELEM_HEAD_STRUCT = ...
 
     if fbx_version < 7500:
         _BLOCK_SENTINEL_LENGTH = 13
         read_fbx_elem_uint = read_uint
+        _ELEM_HEAD_STRUCT = Struct(b'<3I')
     else:
         _BLOCK_SENTINEL_LENGTH = 25
         read_fbx_elem_uint = read_uint64
+        _ELEM_HEAD_STRUCT = Struct(b'<3Q')
     _BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
 
 
@@ -157,6 +165,161 @@ def read_elem(read, tell, use_namedtuple):
     return FBXElem(*args) if use_namedtuple else args
 
 
+# -----------------------------------------------------------------------------
+# Lazy (memory-mapped) parsing
+#
+# Instead of reading the file field by field, the whole file is memory-mapped and element headers are decoded
+# with struct.unpack_from() directly over a memoryview. Array properties are kept as views over the mapped pages
+# and only decompressed the first time they are accessed, so arrays the importer never touches cost nothing.
+
+class _LazyArray:
+    """
+    Placeholder for an array property, holding a view over its (possibly compressed) raw data.
+    """
+    __slots__ = ("data", "length", "encoding", "array_type", "array_stride", "array_byteswap")
+
+    def __init__(self, data, length, encoding, array_type, array_stride, array_byteswap):
+        self.data = data
+        self.length = length
+        self.encoding = encoding
+        self.array_type = array_type
+        self.array_stride = array_stride
+        self.array_byteswap = array_byteswap
+
+    def load(self):
+        data = self.data
+        if self.encoding == 1:
+            data = zlib.decompress(data)
+
+        assert(self.length * self.array_stride == len(data))
+
+        data_array = array.array(self.array_type)
+        data_array.frombytes(data)
+        if self.array_byteswap and _IS_BIG_ENDIAN:
+            data_array.byteswap()
+        return data_array
+
+
+class FBXLazyProps(list):
+    """
+    List of element properties, where array properties are only unpacked on first access
+    (and then replace their placeholder, so they are unpacked only once).
+    """
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        prop = list.__getitem__(self, index)
+        if prop.__class__ is _LazyArray:
+            prop = prop.load()
+            list.__setitem__(self, index, prop)
+        return prop
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+_UINT_STRUCT = Struct(b'<I')
+_ARRAY_HEAD_STRUCT = Struct(b'<3I')
+
+read_data_lazy_scalar_dict = {
+    b'Y'[0]: Struct(b'<h'),  # 16 bit int
+    b'C'[0]: Struct(b'?'),   # 1 bit bool (yes/no)
+    b'I'[0]: Struct(b'<i'),  # 32 bit int
+    b'F'[0]: Struct(b'<f'),  # 32 bit float
+    b'D'[0]: Struct(b'<d'),  # 64 bit float
+    b'L'[0]: Struct(b'<q'),  # 64 bit int
+    }
+
+read_data_lazy_array_dict = {
+    b'f'[0]: (data_types.ARRAY_FLOAT32, 4, False),  # array (float)
+    b'i'[0]: (data_types.ARRAY_INT32, 4, True),     # array (int)
+    b'd'[0]: (data_types.ARRAY_FLOAT64, 8, False),  # array (double)
+    b'l'[0]: (data_types.ARRAY_INT64, 8, True),     # array (long)
+    b'b'[0]: (data_types.ARRAY_BOOL, 1, False),     # array (bool)
+    b'c'[0]: (data_types.ARRAY_BYTE, 1, False),     # array (ubyte)
+    }
+
+
+# Elements whose array data is read by the importer, only those are worth decompressing ahead of time.
+PREFETCH_ARRAY_ELEM_IDS = {
+    b'Vertices', b'PolygonVertexIndex', b'Edges',
+    b'Normals', b'NormalsIndex', b'UV', b'UVIndex', b'Colors', b'ColorIndex',
+    b'Materials', b'Smoothing', b'EdgeCrease',
+    b'Indexes', b'Weights', b'FullWeights',
+    b'KeyTime', b'KeyValueFloat',
+    }
+
+
+def read_prop_lazy(buf, offset, data_type):
+    """
+    Read a single property of given type at given offset in buf, return it and the offset following it.
+    """
+    scalar_struct = read_data_lazy_scalar_dict.get(data_type)
+    if scalar_struct is not None:
+        return scalar_struct.unpack_from(buf, offset)[0], offset + scalar_struct.size
+
+    array_info = read_data_lazy_array_dict.get(data_type)
+    if array_info is not None:
+        length, encoding, comp_len = _ARRAY_HEAD_STRUCT.unpack_from(buf, offset)
+        offset += _ARRAY_HEAD_STRUCT.size
+        return _LazyArray(buf[offset:offset + comp_len], length, encoding, *array_info), offset + comp_len
+
+    if data_type in {data_types.BYTES, data_types.STRING}:
+        size = _UINT_STRUCT.unpack_from(buf, offset)[0]
+        offset += _UINT_STRUCT.size
+        return bytes(buf[offset:offset + size]), offset + size
+
+    raise IOError("unknown property type %r" % chr(data_type))
+
+
+def read_elem_lazy(buf, offset, use_namedtuple, prefetch_arrays):
+    """
+    Same as read_elem(), but working on a memoryview, return the element and the offset following it.
+    Placeholders of compressed arrays read by the importer are appended to prefetch_arrays.
+    """
+    end_offset, prop_count, _prop_length = _ELEM_HEAD_STRUCT.unpack_from(buf, offset)
+    offset += _ELEM_HEAD_STRUCT.size
+    if end_offset == 0:
+        return None, offset
+
+    elem_id_len = buf[offset]
+    offset += 1
+    elem_id = bytes(buf[offset:offset + elem_id_len])      # elem name of the scope/key
+    offset += elem_id_len
+    elem_props_type = bytearray(prop_count)                 # elem property types
+    elem_props_data = FBXLazyProps([None] * prop_count)     # elem properties (if any)
+    elem_subtree = []                                       # elem children (if any)
+    is_prefetched = elem_id in PREFETCH_ARRAY_ELEM_IDS
+
+    for i in range(prop_count):
+        data_type = buf[offset]
+        prop, offset = read_prop_lazy(buf, offset + 1, data_type)
+        list.__setitem__(elem_props_data, i, prop)
+        elem_props_type[i] = data_type
+        if is_prefetched and prop.__class__ is _LazyArray and prop.encoding == 1:
+            prefetch_arrays.append(prop)
+
+    if offset < end_offset:
+        sub_end_offset = end_offset - _BLOCK_SENTINEL_LENGTH
+        while offset < sub_end_offset:
+            elem, offset = read_elem_lazy(buf, offset, use_namedtuple, prefetch_arrays)
+            elem_subtree.append(elem)
+
+        if buf[offset:offset + _BLOCK_SENTINEL_LENGTH] != _BLOCK_SENTINEL_DATA:
+            raise IOError("failed to read nested block sentinel, "
+                          "expected all bytes to be 0")
+        offset += _BLOCK_SENTINEL_LENGTH
+
+    if offset != end_offset:
+        raise IOError("scope length not reached, something is wrong")
+
+    args = (elem_id, elem_props_data, elem_props_type, elem_subtree)
+    return (FBXElem(*args) if use_namedtuple else args), offset
+
+
 def parse_version(fn):
     """
     Return the FBX version,
@@ -171,7 +334,63 @@ def parse_version(fn):
         return read_uint(read)
 
 
-def parse(fn, use_namedtuple=True):
+def decompress_arrays(compressed_arrays, num_threads):
+    """
+    Inflate given compressed array placeholders using a pool of threads (zlib releases the GIL while working).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for lazy_array, data in zip(compressed_arrays,
+                                    executor.map(zlib.decompress, [la.data for la in compressed_arrays])):
+            lazy_array.data = data
+            lazy_array.encoding = 0
+
+
+def parse_lazy(fn, use_namedtuple=True, decompress_threads=1):
+    """
+    Same as parse(), but memory-maps the file instead of reading it.
+
+    With decompress_threads set to 1, array properties are only decompressed when first accessed.
+    Otherwise, the compressed arrays the importer reads (see PREFETCH_ARRAY_ELEM_IDS) are inflated in parallel
+    by that many threads once the file is parsed (zero meaning as many threads as there are CPU cores),
+    all other arrays are still only decompressed when first accessed.
+    """
+    import mmap
+
+    root_elems = []
+    prefetch_arrays = []
+
+    with open(fn, 'rb') as f:
+        # The map remains valid once the file is closed, it lives as long as some element data references it.
+        buf = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    offset = len(_HEAD_MAGIC)
+    if buf[:offset] != _HEAD_MAGIC:
+        raise IOError("Invalid header")
+
+    fbx_version = _UINT_STRUCT.unpack_from(buf, offset)[0]
+    offset += _UINT_STRUCT.size
+    init_version(fbx_version)
+
+    while True:
+        elem, offset = read_elem_lazy(buf, offset, use_namedtuple, prefetch_arrays)
+        if elem is None:
+            break
+        root_elems.append(elem)
+
+    if decompress_threads != 1 and prefetch_arrays:
+        import os
+        decompress_arrays(prefetch_arrays, decompress_threads or os.cpu_count())
+
+    args = (b'', [], bytearray(0), root_elems)
+    return FBXElem(*args) if use_namedtuple else args, fbx_version
+
+
+def parse(fn, use_namedtuple=True, use_lazy=False, decompress_threads=1):
+    if use_lazy:
+        return parse_lazy(fn, use_namedtuple, decompress_threads)
+
     root_elems = []
 
     with open(fn, 'rb') as f:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""
+Benchmark of the binary FBX parser on a synthetic file, run it from the io_scene_fbx directory:
+
+    python3 parse_fbx_benchmark.py [num_meshes] [num_verts_per_mesh]
+
+Compares the plain parser, the lazy parser decompressing arrays on demand (the default),
+and the lazy parser decompressing the arrays read by the importer with all cores.
+"""
+
+import array
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import encode_bin
+import parse_fbx
+
+
+def write_synthetic_fbx(fn, num_meshes, num_verts):
+    rng = np.random.default_rng(0)
+    root = encode_bin.FBXElem(b'')
+    for elem_id, add in ((b'FileId', encode_bin.FBXElem.add_bytes), (b'CreationTime', encode_bin.FBXElem.add_string)):
+        elem = encode_bin.FBXElem(elem_id)
+        add(elem, b'')
+        root.elems.append(elem)
+    objects = encode_bin.FBXElem(b'Objects')
+    root.elems.append(objects)
+    for i in range(num_meshes):
+        geom = encode_bin.FBXElem(b'Geometry')
+        geom.add_int64(i)
+        geom.add_string(b'Mesh%d\x00\x01Geometry' % i)
+        geom.add_string(b'Mesh')
+        objects.elems.append(geom)
+
+        def add_array(parent, name, data):
+            elem = encode_bin.FBXElem(name)
+            if data.dtype == np.int32:
+                elem.add_int32_array(array.array(parse_fbx.data_types.ARRAY_INT32, data.tobytes()))
+            else:
+                elem.add_float64_array(array.array(parse_fbx.data_types.ARRAY_FLOAT64, data.tobytes()))
+            parent.elems.append(elem)
+
+        # Quantized coordinates, so that the data compresses about as well as real meshes do.
+        add_array(geom, b'Vertices', np.round(rng.random(num_verts * 3), 3))
+        polys = rng.integers(0, num_verts, num_verts * 4, dtype=np.int32)
+        polys[3::4] ^= -1
+        add_array(geom, b'PolygonVertexIndex', polys)
+        for layer_id, data_id in ((b'LayerElementNormal', b'Normals'),
+                                  (b'LayerElementBinormal', b'Binormals'),
+                                  (b'LayerElementTangent', b'Tangents')):
+            layer = encode_bin.FBXElem(layer_id)
+            layer.add_int32(0)
+            add_array(layer, data_id, np.round(rng.random(num_verts * 4 * 3) * 2.0 - 1.0, 3))
+            geom.elems.append(layer)
+
+    encode_bin.write(fn, root, 7400)
+
+
+def read_consumed_arrays(elem_root):
+    """Access the arrays the importer reads, like it does (Binormals and Tangents are left untouched)."""
+    arrays = []
+    for geom in elem_root.elems[2].elems:
+        arrays.append(geom.elems[0].props[0])
+        arrays.append(geom.elems[1].props[0])
+        arrays.append(geom.elems[2].elems[0].props[0])
+    return arrays
+
+
+def bench(name, func):
+    t = time.perf_counter()
+    arrays = func()
+    print("%-45s %.3f sec" % (name, time.perf_counter() - t))
+    return arrays
+
+
+def main():
+    num_meshes = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    num_verts = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "benchmark.fbx")
+        write_synthetic_fbx(fn, num_meshes, num_verts)
+        print("%d meshes of %d vertices, %.1f MiB file" % (num_meshes, num_verts, os.path.getsize(fn) / 1048576))
+
+        ref = bench("parse (plain)",
+                    lambda: read_consumed_arrays(parse_fbx.parse(fn)[0]))
+        lazy = bench("parse_lazy, decompress on demand",
+                     lambda: read_consumed_arrays(parse_fbx.parse_lazy(fn, decompress_threads=1)[0]))
+        threaded = bench("parse_lazy, prefetch with %d threads" % os.cpu_count(),
+                         lambda: read_consumed_arrays(parse_fbx.parse_lazy(fn, decompress_threads=0)[0]))
+
+        assert(lazy == ref)
+        assert(threaded == ref)
+
+
+if __name__ == '__main__':
+    main()
@@ -173,6 +173,40 @@ class ExportGLTF2_Base:
         default='',
     )
 
+    export_image_threads: IntProperty(
+        name='Image Threads',
+        description=(
+            'Number of threads used to encode images while the rest of the scene is exported '
+            '(0 to use all available cores, 1 to encode images on the main thread)'
+        ),
+        min=0, max=1024,
+        default=0,
+    )
+
+    export_extract_cache: BoolProperty(
+        name='Mesh Cache',
+        description=(
+            'Cache extracted mesh data on disk, so that meshes that did not change are not processed '
+            'again by later exports'
+        ),
+        default=False
+    )
+
+    export_extract_cache_dir: StringProperty(
+        name='Directory',
+        description='Folder to store the mesh cache in. Use the system temporary folder when empty',
+        default='',
+        subtype='DIR_PATH'
+    )
+
+    export_extract_cache_size: IntProperty(
+        name='Size Limit (MB)',
+        description='Maximum size of the mesh cache, least recently used meshes are removed first',
+        default=1024,
+        min=1,
+        max=1024 * 1024
+    )
+
     export_texcoords: BoolProperty(
         name='UVs',
         description='Export UVs (texture coordinates) with meshes',
@@ -499,6 +533,8 @@ class ExportGLTF2_Base:
 
         export_settings['gltf_format'] = self.export_format
         export_settings['gltf_image_format'] = self.export_image_format
+        export_settings['gltf_image_threads'] = self.export_image_threads
+        export_settings['gltf_image_executor'] = None
         export_settings['gltf_copyright'] = self.export_copyright
         export_settings['gltf_texcoords'] = self.export_texcoords
         export_settings['gltf_normals'] = self.export_normals
@@ -506,6 +542,16 @@ class ExportGLTF2_Base:
         export_settings['gltf_loose_edges'] = self.use_mesh_edges
         export_settings['gltf_loose_points'] = self.use_mesh_vertices
 
+        if self.export_extract_cache:
+            from .blender.exp import gltf2_blender_extract_cache
+            export_settings['gltf_extract_cache_dir'] = (
+                bpy.path.abspath(self.export_extract_cache_dir) or
+                gltf2_blender_extract_cache.default_cache_directory()
+            )
+            export_settings['gltf_extract_cache_size'] = self.export_extract_cache_size * 1024 * 1024
+        else:
+            export_settings['gltf_extract_cache_dir'] = None
+
         if self.is_draco_available:
             export_settings['gltf_draco_mesh_compression'] = self.export_draco_mesh_compression_enable
             export_settings['gltf_draco_mesh_compression_level'] = self.export_draco_mesh_compression_level
@@ -727,6 +773,7 @@ class GLTF_PT_export_geometry(bpy.types.Panel):
         col = layout.column()
         col.active = operator.export_materials == "EXPORT"
         col.prop(operator, 'export_image_format')
+        col.prop(operator, 'export_image_threads')
 
 
 class GLTF_PT_export_geometry_compression(bpy.types.Panel):
@@ -771,6 +818,38 @@ class GLTF_PT_export_geometry_compression(bpy.types.Panel):
         col.prop(operator, 'export_draco_generic_quantization', text="Generic")
 
 
+class GLTF_PT_export_geometry_cache(bpy.types.Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Mesh Cache"
+    bl_parent_id = "GLTF_PT_export_geometry"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        return operator.bl_idname == "EXPORT_SCENE_OT_gltf"
+
+    def draw_header(self, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        self.layout.prop(operator, "export_extract_cache", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False  # No animation.
+
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        layout.active = operator.export_extract_cache
+        layout.prop(operator, 'export_extract_cache_dir')
+        layout.prop(operator, 'export_extract_cache_size')
+
+
 class GLTF_PT_export_animation(bpy.types.Panel):
     bl_space_type = 'FILE_BROWSER'
     bl_region_type = 'TOOL_PROPS'
@@ -1045,6 +1124,7 @@ class ImportGLTF2(Operator, ImportHelper):
         from .io.imp.gltf2_io_gltf import glTFImporter, ImportError
         from .blender.imp.gltf2_blender_gltf import BlenderGlTF
 
+        gltf_importer = None
         try:
             gltf_importer = glTFImporter(filename, import_settings)
             gltf_importer.read()
@@ -1065,6 +1145,10 @@ class ImportGLTF2(Operator, ImportHelper):
             self.report({'ERROR'}, e.args[0])
             return {'CANCELLED'}
 
+        finally:
+            if gltf_importer is not None:
+                gltf_importer.close()
+
     def set_debug_log(self):
         import logging
         if bpy.app.debug_value == 0:
@@ -1090,6 +1174,7 @@ classes = (
     GLTF_PT_export_transform,
     GLTF_PT_export_geometry,
     GLTF_PT_export_geometry_compression,
+    GLTF_PT_export_geometry_cache,
     GLTF_PT_export_animation,
     GLTF_PT_export_animation_export,
     GLTF_PT_export_animation_shapekeys,
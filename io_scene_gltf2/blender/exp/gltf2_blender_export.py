@@ -14,8 +14,11 @@
 import time
 
 import bpy
+import os
 import sys
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from io_scene_gltf2.blender.com import gltf2_blender_json
 from io_scene_gltf2.blender.exp import gltf2_blender_export_keys
@@ -60,9 +63,20 @@ def save(context, export_settings):
 
 def __export(export_settings):
     exporter = GlTF2Exporter(export_settings)
-    __gather_gltf(exporter, export_settings)
-    buffer = __create_buffer(exporter, export_settings)
-    exporter.finalize_images()
+
+    # Images are encoded by worker threads while the rest of the scene is gathered,
+    # the encoded data is waited for when buffers and images are finalized.
+    image_threads = export_settings['gltf_image_threads']
+    if image_threads != 1:
+        export_settings['gltf_image_executor'] = _BoundedThreadPoolExecutor(max_workers=image_threads or os.cpu_count())
+    try:
+        __gather_gltf(exporter, export_settings)
+        buffer = __create_buffer(exporter, export_settings)
+        exporter.finalize_images()
+    finally:
+        if export_settings['gltf_image_executor'] is not None:
+            export_settings['gltf_image_executor'].shutdown()
+
     json = __fix_json(exporter.glTF.to_dict())
 
     export_user_extensions('gather_gltf_hook', export_settings, exporter.glTF)
@@ -71,6 +85,27 @@ def __export(export_settings):
     return json, buffer
 
 
+class _BoundedThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool which limits the number of jobs in flight.
+
+    Jobs hold the pixels of an image until they are done, so submitting
+    waits for the oldest job once twice as many jobs as workers are pending.
+    """
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self._max_pending = 2 * max_workers
+        self._pending = deque()
+
+    def submit(self, fn, *args, **kwargs):
+        while self._pending and self._pending[0].done():
+            self._pending.popleft()
+        if len(self._pending) >= self._max_pending:
+            self._pending.popleft().exception()
+        future = super().submit(fn, *args, **kwargs)
+        self._pending.append(future)
+        return future
+
+
 def __gather_gltf(exporter, export_settings):
     active_scene_idx, scenes, animations = gltf2_blender_gather.gather_gltf2(export_settings)
 
@@ -85,7 +120,7 @@ def __gather_gltf(exporter, export_settings):
 
 
 def __create_buffer(exporter, export_settings):
-    buffer = bytes()
+    buffer = []
     if export_settings[gltf2_blender_export_keys.FORMAT] == 'GLB':
         buffer = exporter.finalize_buffer(export_settings[gltf2_blender_export_keys.FILE_DIRECTORY], is_glb=True)
     else:
@@ -17,6 +17,7 @@ from mathutils import Vector
 
 from . import gltf2_blender_export_keys
 from ...io.com.gltf2_io_debug import print_console
+from io_scene_gltf2.blender.exp import gltf2_blender_extract_cache
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_skins
 
 
@@ -28,15 +29,6 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
     if use_normals:
         blender_mesh.calc_normals_split()
 
-    use_tangents = False
-    if use_normals and export_settings[gltf2_blender_export_keys.TANGENTS]:
-        if blender_mesh.uv_layers.active and len(blender_mesh.uv_layers) > 0:
-            try:
-                blender_mesh.calc_tangents()
-                use_tangents = True
-            except Exception:
-                print_console('WARNING', 'Could not calculate tangents. Please try to triangulate the mesh first.')
-
     tex_coord_max = 0
     if export_settings[gltf2_blender_export_keys.TEX_COORDS]:
         if blender_mesh.uv_layers.active:
@@ -73,7 +65,6 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
                 armature = None
 
     use_morph_normals = use_normals and export_settings[gltf2_blender_export_keys.MORPH_NORMAL]
-    use_morph_tangents = use_morph_normals and use_tangents and export_settings[gltf2_blender_export_keys.MORPH_TANGENT]
 
     key_blocks = []
     if blender_mesh.shape_keys and export_settings[gltf2_blender_export_keys.MORPH]:
@@ -85,11 +76,38 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
 
     use_materials = export_settings[gltf2_blender_export_keys.MATERIALS]
 
+    if skin:
+        vertex_group_elements = __get_vertex_group_elements(blender_mesh)
+
+    cache_dir = export_settings['gltf_extract_cache_dir']
+    if cache_dir:
+        cache_key = __get_cache_key(
+            blender_mesh, blender_object, blender_vertex_groups, modifiers, armature,
+            skin, vertex_group_elements if skin else None, key_blocks,
+            tex_coord_max, color_max, export_settings
+        )
+        primitives = gltf2_blender_extract_cache.load(cache_dir, cache_key)
+        if primitives is not None:
+            print_console('INFO', 'Primitives loaded from cache: %d' % len(primitives))
+            return primitives
+
+    use_tangents = False
+    if use_normals and export_settings[gltf2_blender_export_keys.TANGENTS]:
+        if blender_mesh.uv_layers.active and len(blender_mesh.uv_layers) > 0:
+            try:
+                blender_mesh.calc_tangents()
+                use_tangents = True
+            except Exception:
+                print_console('WARNING', 'Could not calculate tangents. Please try to triangulate the mesh first.')
+
+    use_morph_tangents = use_morph_normals and use_tangents and export_settings[gltf2_blender_export_keys.MORPH_TANGENT]
+
     # Fetch vert positions and bone data (joint,weights)
 
     locs, morph_locs = __get_positions(blender_mesh, key_blocks, armature, blender_object, export_settings)
     if skin:
-        vert_bones, num_joint_sets = __get_bone_data(blender_mesh, skin, blender_vertex_groups)
+        vert_joints, vert_weights = __get_bone_data(vertex_group_elements, skin, blender_vertex_groups)
+        del vertex_group_elements
 
     # In Blender there is both per-vert data, like position, and also per-loop
     # (loop=corner-of-poly) data, like normals or UVs. glTF only has per-vert
@@ -260,22 +278,7 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
             attributes['COLOR_%d' % color_i] = colors
 
         if skin:
-            joints = [[] for _ in range(num_joint_sets)]
-            weights = [[] for _ in range(num_joint_sets)]
-
-            for vi in blender_idxs:
-                bones = vert_bones[vi]
-                for j in range(0, 4 * num_joint_sets):
-                    if j < len(bones):
-                        joint, weight = bones[j]
-                    else:
-                        joint, weight = 0, 0.0
-                    joints[j//4].append(joint)
-                    weights[j//4].append(weight)
-
-            for i, (js, ws) in enumerate(zip(joints, weights)):
-                attributes['JOINTS_%d' % i] = js
-                attributes['WEIGHTS_%d' % i] = ws
+            __set_bone_attributes(attributes, vert_joints, vert_weights, blender_idxs)
 
         primitives.append({
             'attributes': attributes,
@@ -301,22 +304,7 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
                 attributes['MORPH_POSITION_%d' % morph_i] = vs[blender_idxs]
 
             if skin:
-                joints = [[] for _ in range(num_joint_sets)]
-                weights = [[] for _ in range(num_joint_sets)]
-
-                for vi in blender_idxs:
-                    bones = vert_bones[vi]
-                    for j in range(0, 4 * num_joint_sets):
-                        if j < len(bones):
-                            joint, weight = bones[j]
-                        else:
-                            joint, weight = 0, 0.0
-                        joints[j//4].append(joint)
-                        weights[j//4].append(weight)
-
-                for i, (js, ws) in enumerate(zip(joints, weights)):
-                    attributes['JOINTS_%d' % i] = js
-                    attributes['WEIGHTS_%d' % i] = ws
+                __set_bone_attributes(attributes, vert_joints, vert_weights, blender_idxs)
 
             primitives.append({
                 'attributes': attributes,
@@ -344,22 +332,7 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
                 attributes['MORPH_POSITION_%d' % morph_i] = vs[blender_idxs]
 
             if skin:
-                joints = [[] for _ in range(num_joint_sets)]
-                weights = [[] for _ in range(num_joint_sets)]
-
-                for vi in blender_idxs:
-                    bones = vert_bones[vi]
-                    for j in range(0, 4 * num_joint_sets):
-                        if j < len(bones):
-                            joint, weight = bones[j]
-                        else:
-                            joint, weight = 0, 0.0
-                        joints[j//4].append(joint)
-                        weights[j//4].append(weight)
-
-                for i, (js, ws) in enumerate(zip(joints, weights)):
-                    attributes['JOINTS_%d' % i] = js
-                    attributes['WEIGHTS_%d' % i] = ws
+                __set_bone_attributes(attributes, vert_joints, vert_weights, blender_idxs)
 
             primitives.append({
                 'attributes': attributes,
@@ -369,9 +342,70 @@ def extract_primitives(glTF, blender_mesh, library, blender_object, blender_vert
 
     print_console('INFO', 'Primitives created: %d' % len(primitives))
 
+    if cache_dir:
+        gltf2_blender_extract_cache.store(
+            cache_dir, cache_key, primitives, export_settings['gltf_extract_cache_size'])
+
     return primitives
 
 
+def __get_cache_key(blender_mesh, blender_object, blender_vertex_groups, modifiers, armature,
+                    skin, vertex_group_elements, key_blocks, tex_coord_max, color_max, export_settings):
+    """Hash everything the extracted primitives depend on."""
+    key = gltf2_blender_extract_cache.CacheKey()
+
+    key.add([
+        export_settings[setting] for setting in (
+            gltf2_blender_export_keys.NORMALS,
+            gltf2_blender_export_keys.TANGENTS,
+            gltf2_blender_export_keys.TEX_COORDS,
+            gltf2_blender_export_keys.COLORS,
+            gltf2_blender_export_keys.SKINS,
+            gltf2_blender_export_keys.MORPH,
+            gltf2_blender_export_keys.MORPH_NORMAL,
+            gltf2_blender_export_keys.MORPH_TANGENT,
+            gltf2_blender_export_keys.MATERIALS,
+            gltf2_blender_export_keys.YUP,
+            'gltf_loose_edges',
+            'gltf_loose_points',
+        )
+    ])
+    key.add([(modifier.type, modifier.name) for modifier in modifiers or ()])
+
+    def add_data(collection, attr, dtype, size=1):
+        array = np.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attr, array)
+        key.add_array(array)
+
+    add_data(blender_mesh.vertices, 'co', np.float32, 3)
+    add_data(blender_mesh.edges, 'vertices', np.uint32, 2)
+    add_data(blender_mesh.loops, 'vertex_index', np.uint32)
+    add_data(blender_mesh.polygons, 'loop_start', np.uint32)
+    add_data(blender_mesh.polygons, 'loop_total', np.uint32)
+    add_data(blender_mesh.polygons, 'material_index', np.uint32)
+    if export_settings[gltf2_blender_export_keys.NORMALS]:
+        # Split normals are up to date, they account for smooth/sharp flags and custom normals.
+        add_data(blender_mesh.loops, 'normal', np.float32, 3)
+    for uv_i in range(tex_coord_max):
+        add_data(blender_mesh.uv_layers[uv_i].data, 'uv', np.float32, 2)
+    key.add(tex_coord_max > 0 and blender_mesh.uv_layers.active.name)
+    for color_i in range(color_max):
+        add_data(blender_mesh.vertex_colors[color_i].data, 'color', np.float32, 4)
+    for key_block in key_blocks:
+        add_data(key_block.data, 'co', np.float32, 3)
+
+    if skin:
+        key.add([joint.name for joint in skin.joints])
+        key.add([group.name for group in blender_vertex_groups])
+        for array in vertex_group_elements:
+            key.add_array(array)
+    if armature and blender_object:
+        key.add([list(row) for row in armature.matrix_world])
+        key.add([list(row) for row in blender_object.matrix_world])
+
+    return key.hexdigest()
+
+
 def __get_positions(blender_mesh, key_blocks, armature, blender_object, export_settings):
     locs = np.empty(len(blender_mesh.vertices) * 3, dtype=np.float32)
     blender_mesh.vertices.foreach_get('co', locs)
@@ -536,38 +570,79 @@ def __get_colors(blender_mesh, color_i):
     return colors
 
 
-def __get_bone_data(blender_mesh, skin, blender_vertex_groups):
+def __get_vertex_group_elements(blender_mesh):
+    """Return the (group count per vertex, group indices, weights) of all vertex group elements."""
+    counts = np.empty(len(blender_mesh.vertices), dtype=np.uint32)
+    groups = []
+    weights = []
+    # Vertex groups elements can't be read with foreach_get, this is the only per-element loop.
+    for vi, vertex in enumerate(blender_mesh.vertices):
+        vertex_groups = vertex.groups
+        counts[vi] = len(vertex_groups)
+        for group_element in vertex_groups:
+            groups.append(group_element.group)
+            weights.append(group_element.weight)
+
+    return counts, np.array(groups, dtype=np.int64), np.array(weights, dtype=np.float32)
+
+
+def __get_bone_data(vertex_group_elements, skin, blender_vertex_groups):
+    """
+    Return the (V, 4 * number of joint sets) joints and weights arrays, influences
+    of each vert being sorted by decreasing weight and padded with zeros.
+    """
+    counts, groups, weights = vertex_group_elements
+    vert_count = len(counts)
+
     joint_name_to_index = {joint.name: index for index, joint in enumerate(skin.joints)}
-    group_to_joint = [joint_name_to_index.get(g.name) for g in blender_vertex_groups]
-
-    # List of (joint, weight) pairs for each vert
-    vert_bones = []
-    max_num_influences = 0
-
-    for vertex in blender_mesh.vertices:
-        bones = []
-        if vertex.groups:
-            for group_element in vertex.groups:
-                weight = group_element.weight
-                if weight <= 0.0:
-                    continue
-                try:
-                    joint = group_to_joint[group_element.group]
-                except Exception:
-                    continue
-                if joint is None:
-                    continue
-                bones.append((joint, weight))
-        bones.sort(key=lambda x: x[1], reverse=True)
-        if not bones: bones = ((0, 1.0),)  # HACK for verts with zero weight (#308)
-        vert_bones.append(bones)
-        if len(bones) > max_num_influences:
-            max_num_influences = len(bones)
+    # -1 for groups that are not joints, including one extra for invalid group indices
+    group_to_joint = np.array(
+        [joint_name_to_index.get(g.name, -1) for g in blender_vertex_groups] + [-1],
+        dtype=np.int64,
+    )
+
+    vert_idxs = np.repeat(np.arange(vert_count), counts)
+    groups = np.where((groups >= 0) & (groups < len(blender_vertex_groups)), groups, -1)
+    joints = group_to_joint[groups]
+
+    keep = (weights > 0.0) & (joints >= 0)
+    vert_idxs = vert_idxs[keep]
+    joints = joints[keep]
+    weights = weights[keep]
+
+    # Sort influences by vert, then by decreasing weight (stable, like the order of vertex groups)
+    order = np.lexsort((-weights, vert_idxs))
+    vert_idxs = vert_idxs[order]
+    joints = joints[order]
+    weights = weights[order]
+
+    num_influences = np.bincount(vert_idxs, minlength=vert_count)
+    max_num_influences = max(int(num_influences.max(initial=0)), 1)
 
     # How many joint sets do we need? 1 set = 4 influences
     num_joint_sets = (max_num_influences + 3) // 4
 
-    return vert_bones, num_joint_sets
+    # Rank of each influence for its vert
+    starts = np.cumsum(num_influences) - num_influences
+    ranks = np.arange(len(vert_idxs)) - starts[vert_idxs]
+
+    vert_joints = np.zeros((vert_count, 4 * num_joint_sets), dtype=np.uint32)
+    vert_weights = np.zeros((vert_count, 4 * num_joint_sets), dtype=np.float32)
+    vert_joints[vert_idxs, ranks] = joints
+    vert_weights[vert_idxs, ranks] = weights
+
+    # HACK for verts with zero weight (#308)
+    vert_weights[num_influences == 0, 0] = 1.0
+
+    return vert_joints, vert_weights
+
+
+def __set_bone_attributes(attributes, vert_joints, vert_weights, blender_idxs):
+    joints = vert_joints[blender_idxs]
+    weights = vert_weights[blender_idxs]
+    for i in range(vert_joints.shape[1] // 4):
+        attributes['JOINTS_%d' % i] = joints[:, 4 * i:4 * i + 4]
+        attributes['WEIGHTS_%d' % i] = weights[:, 4 * i:4 * i + 4]
 
 
 def __zup2yup(array):
@@ -0,0 +1,156 @@
+# Copyright 2018-2021 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of extracted primitives, shared between exports.
+
+Entries are .npz files named after a hash of everything the extraction depends on,
+the least recently used ones are removed when the cache grows over its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from ...io.com.gltf2_io_debug import print_console
+
+# Bump when the extraction output changes, to invalidate existing entries.
+CACHE_VERSION = 2
+
+CACHE_EXTENSION = '.npz'
+
+
+def default_cache_directory():
+    return os.path.join(tempfile.gettempdir(), 'gltf2_extract_cache')
+
+
+class CacheKey:
+    """Incremental hash of the extraction inputs."""
+
+    def __init__(self):
+        self.__hash = hashlib.blake2b(digest_size=20)
+        self.add(CACHE_VERSION)
+
+    def add(self, value):
+        """Add a JSON-serializable value."""
+        self.__hash.update(json.dumps(value).encode())
+
+    def add_array(self, array: np.ndarray):
+        self.add([array.dtype.str, array.shape])
+        self.__hash.update(np.ascontiguousarray(array).tobytes())
+
+    def hexdigest(self):
+        return self.__hash.hexdigest()
+
+
+def load(cache_dir, key):
+    """Return the cached primitives for key, or None."""
+    path = os.path.join(cache_dir, key + CACHE_EXTENSION)
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            primitives = json.loads(data['meta'].tobytes().decode())
+            for i, primitive in enumerate(primitives):
+                lists = primitive.pop('lists')
+                primitive['attributes'] = {
+                    name: data['%d/attributes/%s' % (i, name)]
+                    for name in primitive['attributes']
+                }
+                for name in lists:
+                    primitive['attributes'][name] = primitive['attributes'][name].tolist()
+                if primitive.pop('has_indices'):
+                    primitive['indices'] = data['%d/indices' % i]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print_console('WARNING', 'Could not read extraction cache entry %s: %s' % (path, e))
+        return None
+
+    # Mark as recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return primitives
+
+
+def store(cache_dir, key, primitives, max_size):
+    """Store primitives for key, then evict old entries to stay under max_size bytes."""
+    arrays = {}
+    meta = []
+    for i, primitive in enumerate(primitives):
+        lists = []
+        for name, value in primitive['attributes'].items():
+            if not isinstance(value, np.ndarray):
+                value = np.array(value)
+                lists.append(name)
+            arrays['%d/attributes/%s' % (i, name)] = value
+        indices = primitive.get('indices')
+        if indices is not None:
+            arrays['%d/indices' % i] = indices
+        meta.append({
+            'attributes': list(primitive['attributes'].keys()),
+            'lists': lists,
+            'has_indices': indices is not None,
+            'material': int(primitive['material']),
+            'mode': primitive.get('mode'),
+        })
+    arrays['meta'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+
+    path = os.path.join(cache_dir, key + CACHE_EXTENSION)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first, so that concurrent exports never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError as e:
+        print_console('WARNING', 'Could not write extraction cache entry %s: %s' % (path, e))
+        return
+
+    evict(cache_dir, max_size)
+
+
+def evict(cache_dir, max_size):
+    """Remove the least recently used entries until the cache is at most max_size bytes."""
+    entries = []
+    total_size = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(CACHE_EXTENSION):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
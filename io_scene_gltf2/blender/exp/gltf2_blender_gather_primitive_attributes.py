@@ -172,7 +172,7 @@ def __gather_skins(blender_primitive, export_settings):
         bone_set_index = 0
         joint_id = 'JOINTS_' + str(bone_set_index)
         weight_id = 'WEIGHTS_' + str(bone_set_index)
-        while blender_primitive["attributes"].get(joint_id) and blender_primitive["attributes"].get(weight_id):
+        while joint_id in blender_primitive["attributes"] and weight_id in blender_primitive["attributes"]:
             if bone_set_index >= 1:
                 if not export_settings['gltf_all_vertex_influences']:
                     gltf2_io_debug.print_console("WARNING", "There are more than 4 joint vertex influences."
@@ -182,10 +182,10 @@ def __gather_skins(blender_primitive, export_settings):
             # joints
             internal_joint = blender_primitive["attributes"][joint_id]
             component_type = gltf2_io_constants.ComponentType.UnsignedShort
-            if max(internal_joint) < 256:
+            if internal_joint.max() < 256:
                 component_type = gltf2_io_constants.ComponentType.UnsignedByte
             joint = array_to_accessor(
-                internal_joint,
+                internal_joint.astype(gltf2_io_constants.ComponentType.to_numpy_dtype(component_type)),
                 component_type,
                 data_type=gltf2_io_constants.DataType.Vec4,
             )
@@ -195,12 +195,10 @@ def __gather_skins(blender_primitive, export_settings):
             internal_weight = blender_primitive["attributes"][weight_id]
             # normalize first 4 weights, when not exporting all influences
             if not export_settings['gltf_all_vertex_influences']:
-                for idx in range(0, len(internal_weight), 4):
-                    weight_slice = internal_weight[idx:idx + 4]
-                    total = sum(weight_slice)
-                    if total > 0:
-                        factor = 1.0 / total
-                        internal_weight[idx:idx + 4] = [w * factor for w in weight_slice]
+                internal_weight = internal_weight.astype(np.float64)
+                total = internal_weight.sum(axis=1, keepdims=True)
+                factor = np.divide(1.0, total, out=np.ones_like(total), where=total > 0)
+                internal_weight = (internal_weight * factor).astype(np.float32)
 
             weight = array_to_accessor(
                 internal_weight,
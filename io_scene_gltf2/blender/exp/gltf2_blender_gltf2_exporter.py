@@ -125,7 +125,7 @@ class GlTF2Exporter:
                 uri = None
             elif output_path and buffer_name:
                 with open(output_path + buffer_name, 'wb') as f:
-                    f.write(self.__buffer.to_bytes())
+                    f.writelines(self.__buffer.to_chunks())
                 uri = buffer_name
             else:
                 uri = self.__buffer.to_embed_string()
@@ -142,7 +142,7 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return self.__buffer.to_bytes()
+            return self.__buffer.to_chunks()
 
     def add_draco_extension(self):
         """
@@ -18,6 +18,8 @@ from typing import Optional, Tuple
 import numpy as np
 import tempfile
 import enum
+import struct
+import zlib
 
 
 class Channel(enum.IntEnum):
@@ -104,7 +106,13 @@ class ExportImage:
             len(set(fill.image.name for fill in self.fills.values())) == 1
         )
 
-    def encode(self, mime_type: Optional[str]) -> bytes:
+    def encode(self, mime_type: Optional[str], executor=None):
+        """Encode the image.
+
+        With an executor, the work that does not need Blender data (reading
+        image files, packing channels and encoding PNGs) is done in the
+        executor, and a Future of the encoded bytes may be returned instead.
+        """
         self.file_format = {
             "image/jpeg": "JPEG",
             "image/png": "PNG"
@@ -112,15 +120,15 @@ class ExportImage:
 
         # Happy path = we can just use an existing Blender image
         if self.__on_happy_path():
-            return self.__encode_happy()
+            return self.__encode_happy(executor)
 
         # Unhappy path = we need to create the image self.fills describes.
-        return self.__encode_unhappy()
+        return self.__encode_unhappy(executor)
 
-    def __encode_happy(self) -> bytes:
-        return self.__encode_from_image(self.blender_image())
+    def __encode_happy(self, executor):
+        return self.__encode_from_image(self.blender_image(), executor)
 
-    def __encode_unhappy(self) -> bytes:
+    def __encode_unhappy(self, executor):
         # We need to assemble the image out of channels.
         # Do it with numpy and image.pixels.
 
@@ -139,7 +147,14 @@ class ExportImage:
         width = max(image.size[0] for image in images)
         height = max(image.size[1] for image in images)
 
-        out_buf = np.ones(width * height * 4, np.float32)
+        # Blender's PNG encoder can only be used from the main thread, but
+        # packing channels and encoding PNGs can be done by the executor.
+        # Pixels are read from Blender images here in any case.
+        deferred = executor is not None and self.file_format == 'PNG'
+        sources = []
+
+        out_buf = None if deferred else np.ones(width * height * 4, np.float32)
+
         tmp_buf = np.empty(width * height * 4, np.float32)
 
         for image in images:
@@ -154,12 +169,22 @@ class ExportImage:
                     tmp_image.pixels.foreach_get(tmp_buf)
 
             # Copy any channels for this image to the output
-            for dst_chan, fill in self.fills.items():
-                if isinstance(fill, FillImage) and fill.image == image:
-                    out_buf[int(dst_chan)::4] = tmp_buf[int(fill.src_chan)::4]
+            channels = [
+                (int(dst_chan), int(fill.src_chan))
+                for dst_chan, fill in self.fills.items()
+                if isinstance(fill, FillImage) and fill.image == image
+            ]
+            if deferred:
+                # Only keep the channels which are used, tmp_buf is reused
+                sources.extend((dst_chan, tmp_buf[src_chan::4].copy()) for dst_chan, src_chan in channels)
+            else:
+                _copy_channels(out_buf, tmp_buf, channels)
 
         tmp_buf = None  # GC this
 
+        if deferred:
+            return executor.submit(_pack_and_encode_png, sources, width, height, Channel.A in self.fills)
+
         return self.__encode_from_numpy_array(out_buf, (width, height))
 
     def __encode_from_numpy_array(self, pixels: np.ndarray, dim: Tuple[int, int]) -> bytes:
@@ -176,7 +201,7 @@ class ExportImage:
 
             return _encode_temp_image(tmp_image, self.file_format)
 
-    def __encode_from_image(self, image: bpy.types.Image) -> bytes:
+    def __encode_from_image(self, image: bpy.types.Image, executor=None):
         # See if there is an existing file we can use.
         data = None
         if image.source == 'FILE' and image.file_format == self.file_format and \
@@ -187,15 +212,15 @@ class ExportImage:
                 src_path = bpy.path.abspath(image.filepath_raw)
                 if os.path.isfile(src_path):
                     with open(src_path, 'rb') as f:
-                        data = f.read()
+                        if executor is None:
+                            data = f.read()
+                        else:
+                            # Only check the magic number now, the file is read by the executor.
+                            if _has_magic_number(f.read(4), self.file_format):
+                                return executor.submit(_read_file, src_path)
         # Check magic number is right
-        if data:
-            if self.file_format == 'PNG':
-                if data.startswith(b'\x89PNG'):
-                    return data
-            elif self.file_format == 'JPEG':
-                if data.startswith(b'\xff\xd8\xff'):
-                    return data
+        if data and _has_magic_number(data, self.file_format):
+            return data
 
         # Copy to a temp image and save.
         with TmpImageGuard() as guard:
@@ -204,6 +229,58 @@ class ExportImage:
             return _encode_temp_image(tmp_image, self.file_format)
 
 
+def _has_magic_number(data: bytes, file_format: str) -> bool:
+    if file_format == 'PNG':
+        return data.startswith(b'\x89PNG')
+    elif file_format == 'JPEG':
+        return data.startswith(b'\xff\xd8\xff')
+    return False
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _copy_channels(out_buf: np.ndarray, src_buf: np.ndarray, channels):
+    for dst_chan, src_chan in channels:
+        out_buf[dst_chan::4] = src_buf[src_chan::4]
+
+
+def _pack_and_encode_png(sources, width: int, height: int, alpha: bool) -> bytes:
+    """Pack the (dst_chan, pixels) sources into one RGBA image, and encode it as PNG.
+
+    Does not use Blender data, so that it can run in a worker thread.
+    """
+    out_buf = np.ones(width * height * 4, np.float32)
+    for dst_chan, chan_buf in sources:
+        out_buf[dst_chan::4] = chan_buf
+    return _encode_png(out_buf, width, height, alpha)
+
+
+def _encode_png(pixels: np.ndarray, width: int, height: int, alpha: bool) -> bytes:
+    """Encode float RGBA pixels (in Blender's bottom to top row order) as an 8 bits PNG."""
+    # Same float to byte conversion as Blender's byte images.
+    pixels = pixels.reshape(height, width, 4)[::-1]
+    if not alpha:
+        pixels = pixels[:, :, :3]
+    channels_nbr = pixels.shape[2]
+
+    # Each row starts with its filter type (0 = None).
+    rows = np.zeros((height, 1 + width * channels_nbr), np.uint8)
+    rows[:, 1:] = np.clip(pixels * 255.0 + 0.5, 0.0, 255.0).astype(np.uint8).reshape(height, -1)
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n',
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6 if alpha else 2, 0, 0, 0)),
+        chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)),
+        chunk(b'IEND', b''),
+    ))
+
+
 def _encode_temp_image(tmp_image: bpy.types.Image, file_format: str) -> bytes:
     with tempfile.TemporaryDirectory() as tmpdirname:
         tmpfilename = tmpdirname + '/img'
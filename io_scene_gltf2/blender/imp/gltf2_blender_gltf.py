@@ -47,6 +47,7 @@ class BlenderGlTF():
         BlenderGlTF.set_convert_functions(gltf)
         BlenderGlTF.pre_compute(gltf)
         BlenderScene.create(gltf)
+        gltf.log.info("Accessor cache: %(hits)d hits, %(misses)d misses" % gltf.decode_accessor_cache.stats())
 
     @staticmethod
     def set_convert_functions(gltf):
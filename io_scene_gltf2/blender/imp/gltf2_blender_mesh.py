@@ -221,9 +221,8 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
                     cols = np.ones((len(indices), 4), dtype=np.float32)
                 loop_cols[col_i] = np.concatenate((loop_cols[col_i], cols))
 
-    # Accessors are cached in case they are shared between primitives; clear
-    # the cache now that all prims are done.
-    gltf.decode_accessor_cache = {}
+    # Accessors are cached in case they are shared between primitives or
+    # meshes; the cache is bounded in size and released at the end of import.
 
     if gltf.import_settings['merge_vertices']:
         vert_locs, vert_normals, vert_joints, vert_weights, \
@@ -0,0 +1,104 @@
+# Copyright 2018-2021 The glTF-Blender-IO authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Check that encoding images with worker threads doesn't change the exported files, run it with:
+
+    blender --background --factory-startup --python export_image_threads_test.py
+
+Exports a scene using several generated images (one used twice, two packed into a single texture)
+as GLB and as embedded glTF, with one thread and with all cores, and compares the files byte for byte.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import bpy
+
+
+def make_image(name, size, rng):
+    image = bpy.data.images.new(name, size, size)
+    image.pixels.foreach_set([rng.random() for _ in range(size * size * 4)])
+    image.pack()
+    return image
+
+
+def make_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    rng = random.Random(0)
+
+    bpy.ops.mesh.primitive_plane_add()
+    plane = bpy.context.object
+    mat = bpy.data.materials.new("Material")
+    mat.use_nodes = True
+    plane.data.materials.append(mat)
+
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes["Principled BSDF"]
+
+    def add_texture(image):
+        node = nodes.new('ShaderNodeTexImage')
+        node.image = image
+        return node
+
+    color = make_image("Color", 256, rng)
+    links.new(add_texture(color).outputs['Color'], bsdf.inputs['Base Color'])
+    links.new(add_texture(color).outputs['Alpha'], bsdf.inputs['Alpha'])
+
+    # Metallic and roughness come from different images, the exporter packs them into one texture.
+    for input_name, image, channel in (('Metallic', make_image("Metallic", 128, rng), 'B'),
+                                       ('Roughness', make_image("Roughness", 128, rng), 'G')):
+        separate = nodes.new('ShaderNodeSeparateRGB')
+        links.new(add_texture(image).outputs['Color'], separate.inputs['Image'])
+        links.new(separate.outputs[channel], bsdf.inputs[input_name])
+
+    normal_map = nodes.new('ShaderNodeNormalMap')
+    links.new(add_texture(make_image("Normal", 64, rng)).outputs['Color'], normal_map.inputs['Color'])
+    links.new(normal_map.outputs['Normal'], bsdf.inputs['Normal'])
+
+
+def export(filepath, export_format, image_threads):
+    bpy.ops.export_scene.gltf(
+        filepath=filepath,
+        export_format=export_format,
+        export_image_threads=image_threads,
+    )
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
+class ExportImageThreadsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        make_scene()
+
+    def check_format(self, export_format, ext):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            single = export(os.path.join(tmpdir, "single" + ext), export_format, 1)
+            threaded = export(os.path.join(tmpdir, "threaded" + ext), export_format, 0)
+        self.assertEqual(single, threaded)
+
+    def test_glb(self):
+        self.check_format('GLB', ".glb")
+
+    def test_gltf_embedded(self):
+        self.check_format('GLTF_EMBEDDED', ".gltf")
+
+
+if __name__ == '__main__':
+    import sys
+    unittest.main(argv=[sys.argv[0]])
@@ -14,21 +14,38 @@
 
 import typing
 import array
+from concurrent.futures import Future
 from io_scene_gltf2.io.com import gltf2_io_constants
 
 
 class BinaryData:
-    """Store for gltf binary data that can later be stored in a buffer."""
+    """Store for gltf binary data that can later be stored in a buffer.
 
-    def __init__(self, data: bytes):
-        if not isinstance(data, bytes):
+    data may be a Future, resolved when the data is first accessed.
+    Deferred data (such as images, which may still be encoded by worker threads) is compared by identity,
+    and only accessed once the buffer is finalized.
+    """
+
+    def __init__(self, data: typing.Union[bytes, Future], deferred: bool = False):
+        if not isinstance(data, (bytes, Future)):
             raise TypeError("Data is not a bytes array")
-        self.data = data
+        self._data = data
+        self.deferred = deferred
+
+    @property
+    def data(self):
+        if isinstance(self._data, Future):
+            self._data = self._data.result()
+        return self._data
 
     def __eq__(self, other):
+        if self.deferred or other.deferred:
+            return self is other
         return self.data == other.data
 
     def __hash__(self):
+        if self.deferred:
+            return id(self)
         return hash(self.data)
 
     @classmethod
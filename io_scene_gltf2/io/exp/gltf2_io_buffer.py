@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+import hashlib
 
 from io_scene_gltf2.io.com import gltf2_io
 from io_scene_gltf2.io.exp import gltf2_io_binary_data
@@ -22,41 +23,85 @@ class Buffer:
     """Class representing binary data for use in a glTF file as 'buffer' property."""
 
     def __init__(self, buffer_index=0):
-        self.__data = bytearray(b"")
+        self.__chunks = []
+        self.__byte_length = 0
+        self.__views = {}
+        self.__offsets = {}
+        self.__pending = []
         self.__buffer_index = buffer_index
 
     def add_and_get_view(self, binary_data: gltf2_io_binary_data.BinaryData) -> gltf2_io.BufferView:
-        """Add binary data to the buffer. Return a glTF BufferView."""
-        offset = len(self.__data)
-        self.__data.extend(binary_data.data)
+        """
+        Add binary data to the buffer. Return a glTF BufferView.
 
-        length = binary_data.byte_length
-
-        # offsets should be a multiple of 4 --> therefore add padding if necessary
-        padding = (4 - (length % 4)) % 4
-        self.__data.extend(b"\x00" * padding)
+        Identical data (same BLAKE2 digest) is only stored once, and shares the same BufferView.
+        Deferred data gets its own BufferView, its offset and length are only known once the buffer is laid out,
+        so that data still being encoded by worker threads isn't waited for while the scene is traversed.
+        """
+        key = None
+        if not binary_data.deferred:
+            key = hashlib.blake2b(binary_data.data, digest_size=32).digest()
+            buffer_view = self.__views.get(key)
+            if buffer_view is not None:
+                return buffer_view
 
         buffer_view = gltf2_io.BufferView(
             buffer=self.__buffer_index,
-            byte_length=length,
-            byte_offset=offset,
+            byte_length=None,
+            byte_offset=None,
             byte_stride=None,
             extensions=None,
             extras=None,
             name=None,
             target=None
         )
+        if key is not None:
+            self.__views[key] = buffer_view
+        self.__pending.append((binary_data, buffer_view, key))
         return buffer_view
 
+    def __layout(self):
+        """Append the data added since the last call to the buffer, in the order it was added."""
+        for binary_data, buffer_view, key in self.__pending:
+            data = binary_data.data
+            if key is None:
+                key = hashlib.blake2b(data, digest_size=32).digest()
+            offset = self.__offsets.get(key)
+            if offset is None:
+                offset = self.__byte_length
+                self.__offsets[key] = offset
+                self.__chunks.append(data)
+
+                # offsets should be a multiple of 4 --> therefore add padding if necessary
+                padding = (4 - (len(data) % 4)) % 4
+                if padding:
+                    self.__chunks.append(b"\x00" * padding)
+                self.__byte_length += len(data) + padding
+
+            buffer_view.byte_offset = offset
+            buffer_view.byte_length = len(data)
+        self.__pending = []
+
     @property
     def byte_length(self):
-        return len(self.__data)
+        self.__layout()
+        return self.__byte_length
+
+    def to_chunks(self):
+        """Return the buffer content as a list of memoryviews, to be written one after the other."""
+        self.__layout()
+        return [memoryview(chunk) for chunk in self.__chunks]
 
     def to_bytes(self):
-        return self.__data
+        self.__layout()
+        return b"".join(self.__chunks)
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
 
     def clear(self):
-        self.__data = b""
+        self.__chunks = []
+        self.__byte_length = 0
+        self.__views = {}
+        self.__offsets = {}
+        self.__pending = []
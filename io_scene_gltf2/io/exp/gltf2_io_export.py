@@ -30,6 +30,11 @@ from collections import OrderedDict
 
 
 def save_gltf(gltf, export_settings, encoder, glb_buffer):
+    """
+    Save the glTF JSON, and binary data for GLB.
+
+    glb_buffer is a list of bytes-like chunks, written one after the other without being concatenated.
+    """
     indent = None
     separators = (',', ':')
 
@@ -86,7 +91,7 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         spaces_gltf = (4 - (length_gltf & 3)) & 3
         length_gltf += spaces_gltf
 
-        length_bin = len(binary)
+        length_bin = sum(memoryview(chunk).nbytes for chunk in binary)
         zeros_bin = (4 - (length_bin & 3)) & 3
         length_bin += zeros_bin
 
@@ -95,22 +100,31 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
             length += 8 + length_bin
 
         # Header (Version 2)
-        file.write('glTF'.encode())
-        file.write(struct.pack("I", 2))
-        file.write(struct.pack("I", length))
+        chunks = [
+            'glTF'.encode(),
+            struct.pack("I", 2),
+            struct.pack("I", length),
+        ]
 
         # Chunk 0 (JSON)
-        file.write(struct.pack("I", length_gltf))
-        file.write('JSON'.encode())
-        file.write(gltf_data)
-        file.write(b' ' * spaces_gltf)
+        chunks += [
+            struct.pack("I", length_gltf),
+            'JSON'.encode(),
+            gltf_data,
+            b' ' * spaces_gltf,
+        ]
 
         # Chunk 1 (BIN)
         if length_bin > 0:
-            file.write(struct.pack("I", length_bin))
-            file.write('BIN\0'.encode())
-            file.write(binary)
-            file.write(b'\0' * zeros_bin)
+            chunks += [
+                struct.pack("I", length_bin),
+                'BIN\0'.encode(),
+            ]
+            chunks += binary
+            chunks.append(b'\0' * zeros_bin)
+
+        # Gather-write: chunks are not concatenated in memory
+        file.writelines(chunks)
 
         file.close()
 
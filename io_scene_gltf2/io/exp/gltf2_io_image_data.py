@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+from concurrent.futures import Future
 
 
 class ImageData:
-    """Contains encoded images"""
+    """Contains encoded images (data may be a Future, resolved when the data is first accessed, images are compared
+    by identity so that comparing them does not wait for their data)"""
     # FUTURE_WORK: as a method to allow the node graph to be better supported, we could model some of
     # the node graph elements with numpy functions
 
@@ -24,12 +26,6 @@ class ImageData:
         self._mime_type = mime_type
         self._name = name
 
-    def __eq__(self, other):
-        return self._data == other.data
-
-    def __hash__(self):
-        return hash(self._data)
-
     def adjusted_name(self):
         regex_dot = re.compile("\.")
         adjusted_name = re.sub(regex_dot, "_", self.name)
@@ -38,6 +34,8 @@ class ImageData:
 
     @property
     def data(self):
+        if isinstance(self._data, Future):
+            self._data = self._data.result()
         return self._data
 
     @property
@@ -52,4 +50,4 @@ class ImageData:
 
     @property
     def byte_length(self):
-        return len(self._data)
+        return len(self.data)
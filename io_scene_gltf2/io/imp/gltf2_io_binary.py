@@ -13,12 +13,76 @@
 # limitations under the License.
 
 import struct
+from collections import OrderedDict
 import numpy as np
 
 from ..com.gltf2_io import Accessor
 from ..com.gltf2_io_constants import ComponentType, DataType
 
 
+class AccessorCache():
+    """
+    LRU cache of decoded accessors, keyed by accessor index.
+
+    The total size of the cached arrays is kept under max_bytes, least
+    recently used accessors being evicted first. Cached arrays are read-only.
+    """
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.arrays = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, accessor_idx):
+        return accessor_idx in self.arrays
+
+    def __len__(self):
+        return len(self.arrays)
+
+    def get(self, accessor_idx):
+        """Return a read-only view of the cached array, or None."""
+        array = self.arrays.get(accessor_idx)
+        if array is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.arrays.move_to_end(accessor_idx)
+        return array.view()
+
+    def put(self, accessor_idx, array):
+        """Cache an array, and return a read-only view of it."""
+        # Prevent accidentally modifying cached arrays
+        array.flags.writeable = False
+        if array.nbytes > self.max_bytes:
+            return array.view()
+
+        old = self.arrays.pop(accessor_idx, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self.arrays[accessor_idx] = array
+        self.nbytes += array.nbytes
+        while self.nbytes > self.max_bytes:
+            _idx, evicted = self.arrays.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return array.view()
+
+    def clear(self):
+        self.arrays.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        """Return hit/miss statistics."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.arrays),
+            'bytes': self.nbytes,
+        }
+
+
 class BinaryData():
     """Binary reader."""
     def __new__(cls, *args, **kwargs):
@@ -74,17 +138,22 @@ class BinaryData():
 
     @staticmethod
     def decode_accessor(gltf, accessor_idx, cache=False):
-        """Decodes accessor to 2D numpy array (count x num_components)."""
-        if accessor_idx in gltf.decode_accessor_cache:
-            return gltf.accessor_cache[accessor_idx]
+        """
+        Decodes accessor to 2D numpy array (count x num_components).
+
+        With cache=True, the array is looked up in/stored to the accessor cache
+        and is returned read-only.
+        """
+        if cache:
+            array = gltf.decode_accessor_cache.get(accessor_idx)
+            if array is not None:
+                return array
 
         accessor = gltf.data.accessors[accessor_idx]
         array = BinaryData.decode_accessor_obj(gltf, accessor)
 
         if cache:
-            gltf.accessor_cache[accessor_idx] = array
-            # Prevent accidentally modifying cached arrays
-            array.flags.writeable = False
+            array = gltf.decode_accessor_cache.put(accessor_idx, array)
 
         return array
 
@@ -14,8 +14,10 @@
 
 from ..com.gltf2_io import gltf_from_dict
 from ..com.gltf2_io_debug import Log
+from .gltf2_io_binary import AccessorCache
 import logging
 import json
+import mmap
 import struct
 import base64
 from os.path import dirname, join, isfile
@@ -36,8 +38,9 @@ class glTFImporter():
         self.import_settings = import_settings
         self.glb_buffer = None
         self.buffers = {}
+        self.file_maps = []
         self.accessor_cache = {}
-        self.decode_accessor_cache = {}
+        self.decode_accessor_cache = AccessorCache()
 
         if 'loglevel' not in self.import_settings.keys():
             self.import_settings['loglevel'] = logging.ERROR
@@ -139,8 +142,7 @@ class glTFImporter():
         if not isfile(self.filename):
             raise ImportError("Please select a file")
 
-        with open(self.filename, 'rb') as f:
-            content = memoryview(f.read())
+        content = self.map_file(self.filename)
 
         if content[:4] == b'glTF':
             gltf, self.glb_buffer = self.load_glb(content)
@@ -184,8 +186,36 @@ class glTFImporter():
 
         path = join(dirname(self.filename), unquote(uri))
         try:
-            with open(path, 'rb') as f_:
-                return memoryview(f_.read())
+            return self.map_file(path)
         except Exception:
             self.log.error("Couldn't read file: " + path)
             return None
+
+    def map_file(self, path):
+        """
+        Memory-map a file (read-only), so that buffers and accessors data are only paged in when accessed,
+        instead of being fully read in memory. The maps are released by close().
+        """
+        with open(path, 'rb') as f:
+            try:
+                file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                return memoryview(f.read())
+        self.file_maps.append(file_map)
+        return memoryview(file_map)
+
+    def close(self):
+        """Release loaded buffers and memory-mapped files."""
+        self.glb_buffer = None
+        self.buffers.clear()
+        self.accessor_cache.clear()
+        self.decode_accessor_cache.clear()
+        for file_map in self.file_maps:
+            try:
+                file_map.close()
+            except BufferError:
+                # Some data still references the map (e.g. a decoded accessor kept around),
+                # it will be unmapped once garbage collected.
+                pass
+        self.file_maps.clear()
@@ -43,6 +43,7 @@ import bpy
 from bpy.props import (
         BoolProperty,
         FloatProperty,
+        IntProperty,
         StringProperty,
         EnumProperty,
         )
@@ -350,6 +351,14 @@ class ExportOBJ(bpy.types.Operator, ExportHelper):
             default=1.0,
             )
 
+    num_processes: IntProperty(
+            name="Processes",
+            description="Number of worker processes formatting meshes data in parallel "
+                        "(0 to use all CPU cores, 1 to format everything in Blender's own process)",
+            min=0, max=256,
+            default=1,
+            )
+
     path_mode: path_reference_mode
 
     check_extension = True
@@ -472,6 +481,7 @@ class OBJ_PT_export_geometry(bpy.types.Panel):
         layout.prop(operator, 'use_nurbs', text="Curves as NURBS")
         layout.prop(operator, 'use_vertex_groups')
         layout.prop(operator, 'keep_vertex_order')
+        layout.prop(operator, 'num_processes')
 
 
 def menu_func_import(self, context):
@@ -19,8 +19,11 @@
 # <pep8 compliant>
 
 import os
+from collections import deque
+from contextlib import ExitStack
 
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector, Color
 from bpy_extras import io_utils, node_shader_utils
 
@@ -29,6 +32,12 @@ from bpy_extras.wm_utils.progress_report import (
     ProgressReportSubstep,
 )
 
+from .export_obj_format import (
+    iter_pieces,
+    format_pieces,
+    process_pool,
+)
+
 
 def name_compat(name):
     if name is None:
@@ -46,6 +55,53 @@ def mesh_triangulate(me):
     bm.free()
 
 
+def ranges_indices(starts, totals):
+    """Concatenated indices of the ranges [start, start + total[."""
+    totals = np.asarray(totals, dtype=np.int64)
+    totals_start = np.cumsum(totals) - totals
+    return np.repeat(np.asarray(starts, dtype=np.int64) - totals_start, totals) + np.arange(totals.sum())
+
+
+def round_keys(values, ndigits):
+    """
+    Return integer-valued keys (as floats) of given values rounded to ndigits decimals,
+    two values giving the same key exactly when Python's round(value, ndigits) are equal.
+    """
+    scale = 10.0 ** ndigits
+    scaled = np.asarray(values, dtype=np.float64) * scale
+    keys = np.rint(scaled)
+    # Scaled values too close to a rounding tie may not be rounded the same way as Python does
+    # (which uses their exact decimal representation), use Python's round for those.
+    with np.errstate(invalid='ignore'):
+        is_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) <= 4 * np.abs(np.spacing(scaled))
+    for idx in zip(*np.nonzero(is_tie)):
+        keys[idx] = np.rint(round(float(values[idx]), ndigits) * scale)
+    return keys
+
+
+def unique_rows_first_appearance(keys):
+    """
+    Return the indices of the first appearance of each unique row of given 2D keys array (in order of appearance),
+    and for each row, the index of its unique row in the former.
+    """
+    num_rows = len(keys)
+    if not num_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # Stable sort, first row of each group of equal rows is its first appearance.
+    order = np.lexsort(keys.T[::-1])
+    keys_sorted = keys[order]
+    is_first = np.empty(num_rows, dtype=np.bool_)
+    is_first[0] = True
+    is_first[1:] = (keys_sorted[1:] != keys_sorted[:-1]).any(axis=1)
+    firsts = order[is_first]
+    firsts_order = np.argsort(firsts)
+    firsts_rank = np.empty_like(firsts_order)
+    firsts_rank[firsts_order] = np.arange(len(firsts_order))
+    unique_idx = np.empty(num_rows, dtype=np.int64)
+    unique_idx[order] = firsts_rank[np.cumsum(is_first) - 1]
+    return firsts[firsts_order], unique_idx
+
+
 def write_mtl(scene, filepath, path_mode, copy_set, mtl_dict):
     source_dir = os.path.dirname(bpy.data.filepath)
     dest_dir = os.path.dirname(filepath)
@@ -253,22 +309,20 @@ def write_file(filepath, objects, depsgraph, scene,
                EXPORT_GLOBAL_MATRIX=None,
                EXPORT_PATH_MODE='AUTO',
                progress=ProgressReport(),
+               EXPORT_PROCESSES=1,
                ):
     """
     Basic write function. The context and options must be already set
     This can be accessed externaly
     eg.
     write( 'c:\\test\\foobar.obj', Blender.Object.GetSelected() ) # Using default options.
+
+    Meshes data are gathered into arrays on the main thread, with EXPORT_PROCESSES other than 1
+    (0 meaning all CPU cores), their text is formatted by worker processes, and written in order.
     """
     if EXPORT_GLOBAL_MATRIX is None:
         EXPORT_GLOBAL_MATRIX = Matrix()
 
-    def veckey3d(v):
-        return round(v.x, 4), round(v.y, 4), round(v.z, 4)
-
-    def veckey2d(v):
-        return round(v[0], 4), round(v[1], 4)
-
     def findVertexGroupName(face, vWeightMap):
         """
         Searches the vertexDict to see what groups is assigned to a given face.
@@ -290,9 +344,34 @@ def write_file(filepath, objects, depsgraph, scene,
             return '(null)'
 
     with ProgressReportSubstep(progress, 2, "OBJ Export path: %r" % filepath, "OBJ Export Finished") as subprogress1:
-        with open(filepath, "w", encoding="utf8", newline="\n") as f:
+        with open(filepath, "w", encoding="utf8", newline="\n") as f, ExitStack() as exit_stack:
             fw = f.write
 
+            # Meshes data being formatted in worker processes, in writing order.
+            pending_pieces = deque()
+            executor = None
+            if EXPORT_PROCESSES != 1:
+                num_processes = EXPORT_PROCESSES or os.cpu_count()
+                executor = process_pool(num_processes)
+                if executor is None:
+                    print("OBJ Export: worker processes can't be used here, formatting everything in Blender's process")
+                else:
+                    exit_stack.enter_context(executor)
+
+            def write_pieces(pieces):
+                if executor is None:
+                    for data in iter_pieces(pieces):
+                        fw(data)
+                else:
+                    pending_pieces.append(executor.submit(format_pieces, pieces))
+                    # Do not keep too many formatted meshes around.
+                    while len(pending_pieces) > 2 * num_processes:
+                        fw(pending_pieces.popleft().result())
+
+            def flush_pieces():
+                while pending_pieces:
+                    fw(pending_pieces.popleft().result())
+
             # Write Header
             fw('# Blender v%s OBJ File: %r\n' % (bpy.app.version_string, os.path.basename(bpy.data.filepath)))
             fw('# www.blender.org\n')
@@ -341,6 +420,7 @@ def write_file(filepath, objects, depsgraph, scene,
                         # Nurbs curve support
                         if EXPORT_CURVE_AS_NURBS and test_nurbs_compat(ob):
                             ob_mat = EXPORT_GLOBAL_MATRIX @ ob_mat
+                            flush_pieces()
                             totverts += write_nurb(fw, ob, ob_mat)
                             continue
                         # END NURBS
@@ -368,37 +448,38 @@ def write_file(filepath, objects, depsgraph, scene,
                         if EXPORT_UV:
                             faceuv = len(me.uv_layers) > 0
                             if faceuv:
-                                uv_layer = me.uv_layers.active.data[:]
+                                uv_layer = me.uv_layers.active.data
                         else:
                             faceuv = False
 
-                        me_verts = me.vertices[:]
-
-                        # Make our own list so it can be sorted to reduce context switching
-                        face_index_pairs = [(face, index) for index, face in enumerate(me.polygons)]
+                        me_verts = me.vertices
+                        me_polys = me.polygons
+                        me_loops = me.loops
 
                         if EXPORT_EDGES:
                             edges = me.edges
                         else:
                             edges = []
 
-                        if not (len(face_index_pairs) + len(edges) + len(me.vertices)):  # Make sure there is something to write
+                        if not (len(me_polys) + len(edges) + len(me_verts)):  # Make sure there is something to write
                             # clean up
                             ob_for_convert.to_mesh_clear()
                             continue  # dont bother with this mesh.
 
-                        if EXPORT_NORMALS and face_index_pairs:
+                        # Data written for this mesh.
+                        pieces = []
+
+                        if EXPORT_NORMALS and me_polys:
                             me.calc_normals_split()
                             # No need to call me.free_normals_split later, as this mesh is deleted anyway!
 
-                        loops = me.loops
-
-                        if (EXPORT_SMOOTH_GROUPS or EXPORT_SMOOTH_GROUPS_BITFLAGS) and face_index_pairs:
+                        if (EXPORT_SMOOTH_GROUPS or EXPORT_SMOOTH_GROUPS_BITFLAGS) and me_polys:
                             smooth_groups, smooth_groups_tot = me.calc_smooth_groups(use_bitflags=EXPORT_SMOOTH_GROUPS_BITFLAGS)
                             if smooth_groups_tot <= 1:
                                 smooth_groups, smooth_groups_tot = (), 0
                         else:
                             smooth_groups, smooth_groups_tot = (), 0
+                        smooth_groups = np.array(smooth_groups, dtype=np.int64)
 
                         materials = me.materials[:]
                         material_names = [m.name if m else None for m in materials]
@@ -408,32 +489,46 @@ def write_file(filepath, objects, depsgraph, scene,
                             materials = [None]
                             material_names = [name_compat(None)]
 
+                        co = np.empty(len(me_verts) * 3, dtype=np.float32)
+                        me_verts.foreach_get("co", co)
+                        loops_vert_idx = np.empty(len(me_loops), dtype=np.int32)
+                        me_loops.foreach_get("vertex_index", loops_vert_idx)
+                        faces_loop_start = np.empty(len(me_polys), dtype=np.int32)
+                        me_polys.foreach_get("loop_start", faces_loop_start)
+                        faces_loop_total = np.empty(len(me_polys), dtype=np.int32)
+                        me_polys.foreach_get("loop_total", faces_loop_total)
+                        faces_material_index = np.empty(len(me_polys), dtype=np.int32)
+                        me_polys.foreach_get("material_index", faces_material_index)
+                        faces_use_smooth = np.empty(len(me_polys), dtype=np.bool_)
+                        me_polys.foreach_get("use_smooth", faces_use_smooth)
+
                         # Sort by Material, then images
                         # so we dont over context switch in the obj file.
                         if EXPORT_KEEP_VERT_ORDER:
-                            pass
+                            faces_order = np.arange(len(me_polys))
                         else:
                             if len(materials) > 1:
-                                if smooth_groups:
-                                    sort_func = lambda a: (a[0].material_index,
-                                                           smooth_groups[a[1]] if a[0].use_smooth else False)
+                                if len(smooth_groups):
+                                    sort_keys = (faces_material_index, np.where(faces_use_smooth, smooth_groups, 0))
                                 else:
-                                    sort_func = lambda a: (a[0].material_index,
-                                                           a[0].use_smooth)
+                                    sort_keys = (faces_material_index, faces_use_smooth)
                             else:
                                 # no materials
-                                if smooth_groups:
-                                    sort_func = lambda a: smooth_groups[a[1] if a[0].use_smooth else False]
+                                if len(smooth_groups):
+                                    sort_keys = (smooth_groups[np.where(faces_use_smooth, np.arange(len(me_polys)), 0)],)
                                 else:
-                                    sort_func = lambda a: a[0].use_smooth
-
-                            face_index_pairs.sort(key=sort_func)
-
-                            del sort_func
+                                    sort_keys = (faces_use_smooth,)
+                            # Stable sort, like the python one.
+                            faces_order = np.lexsort(sort_keys[::-1])
+                            del sort_keys
 
                         # Set the default mat to no material and no image.
                         contextMat = 0, 0  # Can never be this, so we will label a new material the first chance we get.
                         contextSmooth = None  # Will either be true or false,  set bad to force initialization switch.
+                        currentVGroup = ''
+
+                        # Loops indices, in the order they are written.
+                        loops_order = ranges_indices(faces_loop_start[faces_order], faces_loop_total[faces_order])
 
                         if EXPORT_BLEN_OBS or EXPORT_GROUP_BY_OB:
                             name1 = ob.name
@@ -444,99 +539,105 @@ def write_file(filepath, objects, depsgraph, scene,
                                 obnamestring = '%s_%s' % (name_compat(name1), name_compat(name2))
 
                             if EXPORT_BLEN_OBS:
-                                fw('o %s\n' % obnamestring)  # Write Object name
+                                pieces.append('o %s\n' % obnamestring)  # Write Object name
                             else:  # if EXPORT_GROUP_BY_OB:
-                                fw('g %s\n' % obnamestring)
+                                pieces.append('g %s\n' % obnamestring)
 
                         subprogress2.step()
 
                         # Vert
-                        for v in me_verts:
-                            fw('v %.6f %.6f %.6f\n' % v.co[:])
+                        pieces.append(('v %.6f %.6f %.6f\n', co.reshape(-1, 3)))
 
                         subprogress2.step()
 
                         # UV
                         if faceuv:
-                            # in case removing some of these dont get defined.
-                            uv = f_index = uv_index = uv_key = uv_val = uv_ls = None
-
-                            uv_face_mapping = [None] * len(face_index_pairs)
-
-                            uv_dict = {}
-                            uv_get = uv_dict.get
-                            for f, f_index in face_index_pairs:
-                                uv_ls = uv_face_mapping[f_index] = []
-                                for uv_index, l_index in enumerate(f.loop_indices):
-                                    uv = uv_layer[l_index].uv
-                                    # include the vertex index in the key so we don't share UV's between vertices,
-                                    # allowed by the OBJ spec but can cause issues for other importers, see: T47010.
-
-                                    # this works too, shared UV's for all verts
-                                    #~ uv_key = veckey2d(uv)
-                                    uv_key = loops[l_index].vertex_index, veckey2d(uv)
-
-                                    uv_val = uv_get(uv_key)
-                                    if uv_val is None:
-                                        uv_val = uv_dict[uv_key] = uv_unique_count
-                                        fw('vt %.6f %.6f\n' % uv[:])
-                                        uv_unique_count += 1
-                                    uv_ls.append(uv_val)
-
-                            del uv_dict, uv, f_index, uv_index, uv_ls, uv_get, uv_key, uv_val
-                            # Only need uv_unique_count and uv_face_mapping
+                            uv = np.empty(len(me_loops) * 2, dtype=np.float32)
+                            uv_layer.foreach_get("uv", uv)
+                            uv = uv.reshape(-1, 2)[loops_order]
+                            # include the vertex index in the key so we don't share UV's between vertices,
+                            # allowed by the OBJ spec but can cause issues for other importers, see: T47010.
+                            uv_keys = np.column_stack((loops_vert_idx[loops_order], round_keys(uv, 4)))
+                            uv_unique, uv_unique_idx = unique_rows_first_appearance(uv_keys)
+                            pieces.append(('vt %.6f %.6f\n', uv[uv_unique]))
+                            uv_unique_count = len(uv_unique)
+
+                            del uv, uv_keys, uv_unique
+                            # Only need uv_unique_count and uv_unique_idx (of each written loop)
 
                         subprogress2.step()
 
                         # NORMAL, Smooth/Non smoothed.
                         if EXPORT_NORMALS:
-                            no_key = no_val = None
-                            normals_to_idx = {}
-                            no_get = normals_to_idx.get
-                            loops_to_normals = [0] * len(loops)
-                            for f, f_index in face_index_pairs:
-                                for l_idx in f.loop_indices:
-                                    no_key = veckey3d(loops[l_idx].normal)
-                                    no_val = no_get(no_key)
-                                    if no_val is None:
-                                        no_val = normals_to_idx[no_key] = no_unique_count
-                                        fw('vn %.4f %.4f %.4f\n' % no_key)
-                                        no_unique_count += 1
-                                    loops_to_normals[l_idx] = no_val
-                            del normals_to_idx, no_get, no_key, no_val
-                        else:
-                            loops_to_normals = []
+                            no = np.empty(len(me_loops) * 3, dtype=np.float32)
+                            me_loops.foreach_get("normal", no)
+                            no = no.reshape(-1, 3)[loops_order]
+                            no_unique, no_unique_idx = unique_rows_first_appearance(round_keys(no, 4))
+                            pieces.append(('vn %.4f %.4f %.4f\n', no[no_unique]))
+                            no_unique_count = len(no_unique)
+                            del no, no_unique
 
                         subprogress2.step()
 
+                        # Per-face context (material, smooth group, vertex group), in the order faces are written.
+                        faces_mat = np.minimum(faces_material_index[faces_order], len(materials) - 1)
+                        material_names_idx = {}
+                        materials_key = np.array([material_names_idx.setdefault(name, len(material_names_idx))
+                                                  for name in material_names], dtype=np.int64)
+                        faces_key = materials_key[faces_mat]
+                        faces_smooth = faces_use_smooth[faces_order].astype(np.int64)
+                        if len(smooth_groups):
+                            faces_smooth = np.where(faces_smooth, smooth_groups[faces_order], 0)
+                        contexts_switch = np.zeros(len(me_polys), dtype=np.bool_)
+                        contexts_switch[:1] = True
+                        contexts_switch[1:] = (faces_key[1:] != faces_key[:-1]) | (faces_smooth[1:] != faces_smooth[:-1])
+
                         # XXX
+                        faces_vgroup = None
                         if EXPORT_POLYGROUPS:
                             # Retrieve the list of vertex groups
                             vertGroupNames = ob.vertex_groups.keys()
                             if vertGroupNames:
-                                currentVGroup = ''
                                 # Create a dictionary keyed by face id and listing, for each vertex, the vertex groups it belongs to
                                 vgroupsMap = [[] for _i in range(len(me_verts))]
                                 for v_idx, v_ls in enumerate(vgroupsMap):
                                     v_ls[:] = [(vertGroupNames[g.group], g.weight) for g in me_verts[v_idx].groups]
-
-                        for f, f_index in face_index_pairs:
-                            f_smooth = f.use_smooth
-                            if f_smooth and smooth_groups:
-                                f_smooth = smooth_groups[f_index]
-                            f_mat = min(f.material_index, len(materials) - 1)
+                                # find what vertext group each face belongs to
+                                faces_vgroup = [findVertexGroupName(me_polys[f_index], vgroupsMap)
+                                                for f_index in faces_order.tolist()]
+                                contexts_switch[1:] |= np.array([vg != prev_vg for prev_vg, vg in
+                                                                 zip(faces_vgroup[:-1], faces_vgroup[1:])], dtype=np.bool_)
+
+                        # Indices written for each loop of the faces.
+                        loops_values = [totverts + loops_vert_idx[loops_order]]
+                        if faceuv:
+                            loops_values.append(totuvco + uv_unique_idx)
+                        if EXPORT_NORMALS:
+                            loops_values.append(totno + no_unique_idx)
+                        loops_values = np.column_stack(loops_values)
+                        if faceuv:
+                            loop_fmt = " %d/%d/%d" if EXPORT_NORMALS else " %d/%d"  # vert, uv, normal
+                            face_vert_index += len(loops_values)
+                        else:  # No UV's
+                            loop_fmt = " %d//%d" if EXPORT_NORMALS else " %d"
+                        faces_total = faces_loop_total[faces_order]
+                        faces_loops_start = np.cumsum(faces_total) - faces_total
+
+                        # Write faces, by blocks of faces sharing the same context.
+                        contexts_start = np.flatnonzero(contexts_switch).tolist()
+                        for start, end in zip(contexts_start, contexts_start[1:] + [len(me_polys)]):
+                            f_smooth = faces_smooth[start]
+                            f_mat = faces_mat[start]
 
                             # MAKE KEY
                             key = material_names[f_mat], None  # No image, use None instead.
 
                             # Write the vertex group
-                            if EXPORT_POLYGROUPS:
-                                if vertGroupNames:
-                                    # find what vertext group the face belongs to
-                                    vgroup_of_face = findVertexGroupName(f, vgroupsMap)
-                                    if vgroup_of_face != currentVGroup:
-                                        currentVGroup = vgroup_of_face
-                                        fw('g %s\n' % vgroup_of_face)
+                            if faces_vgroup is not None:
+                                vgroup_of_face = faces_vgroup[start]
+                                if vgroup_of_face != currentVGroup:
+                                    currentVGroup = vgroup_of_face
+                                    pieces.append('g %s\n' % vgroup_of_face)
 
                             # CHECK FOR CONTEXT SWITCH
                             if key == contextMat:
@@ -546,9 +647,9 @@ def write_file(filepath, objects, depsgraph, scene,
                                     # Write a null material, since we know the context has changed.
                                     if EXPORT_GROUP_BY_MAT:
                                         # can be mat_image or (null)
-                                        fw("g %s_%s\n" % (name_compat(ob.name), name_compat(ob.data.name)))
+                                        pieces.append("g %s_%s\n" % (name_compat(ob.name), name_compat(ob.data.name)))
                                     if EXPORT_MTL:
-                                        fw("usemtl (null)\n")  # mat, image
+                                        pieces.append("usemtl (null)\n")  # mat, image
 
                                 else:
                                     mat_data = mtl_dict.get(key)
@@ -578,68 +679,49 @@ def write_file(filepath, objects, depsgraph, scene,
 
                                     if EXPORT_GROUP_BY_MAT:
                                         # can be mat_image or (null)
-                                        fw("g %s_%s_%s\n" % (name_compat(ob.name), name_compat(ob.data.name), mat_data[0]))
+                                        pieces.append("g %s_%s_%s\n" % (name_compat(ob.name), name_compat(ob.data.name), mat_data[0]))
                                     if EXPORT_MTL:
-                                        fw("usemtl %s\n" % mat_data[0])  # can be mat_image or (null)
+                                        pieces.append("usemtl %s\n" % mat_data[0])  # can be mat_image or (null)
 
                             contextMat = key
                             if f_smooth != contextSmooth:
                                 if f_smooth:  # on now off
-                                    if smooth_groups:
-                                        f_smooth = smooth_groups[f_index]
-                                        fw('s %d\n' % f_smooth)
+                                    if len(smooth_groups):
+                                        pieces.append('s %d\n' % f_smooth)
                                     else:
-                                        fw('s 1\n')
+                                        pieces.append('s 1\n')
                                 else:  # was off now on
-                                    fw('s off\n')
+                                    pieces.append('s off\n')
                                 contextSmooth = f_smooth
 
-                            f_v = [(vi, me_verts[v_idx], l_idx)
-                                   for vi, (v_idx, l_idx) in enumerate(zip(f.vertices, f.loop_indices))]
-
-                            fw('f')
-                            if faceuv:
-                                if EXPORT_NORMALS:
-                                    for vi, v, li in f_v:
-                                        fw(" %d/%d/%d" % (totverts + v.index,
-                                                          totuvco + uv_face_mapping[f_index][vi],
-                                                          totno + loops_to_normals[li],
-                                                          ))  # vert, uv, normal
-                                else:  # No Normals
-                                    for vi, v, li in f_v:
-                                        fw(" %d/%d" % (totverts + v.index,
-                                                       totuvco + uv_face_mapping[f_index][vi],
-                                                       ))  # vert, uv
-
-                                face_vert_index += len(f_v)
-
-                            else:  # No UV's
-                                if EXPORT_NORMALS:
-                                    for vi, v, li in f_v:
-                                        fw(" %d//%d" % (totverts + v.index, totno + loops_to_normals[li]))
-                                else:  # No Normals
-                                    for vi, v, li in f_v:
-                                        fw(" %d" % (totverts + v.index))
-
-                            fw('\n')
+                            loops_start = faces_loops_start[start]
+                            loops_end = faces_loops_start[end - 1] + faces_total[end - 1]
+                            pieces.append((loop_fmt, faces_total[start:end], loops_values[loops_start:loops_end]))
 
                         subprogress2.step()
 
                         # Write edges.
-                        if EXPORT_EDGES:
-                            for ed in edges:
-                                if ed.is_loose:
-                                    fw('l %d %d\n' % (totverts + ed.vertices[0], totverts + ed.vertices[1]))
+                        if EXPORT_EDGES and len(edges):
+                            edges_is_loose = np.empty(len(edges), dtype=np.bool_)
+                            edges.foreach_get("is_loose", edges_is_loose)
+                            edges_vert_idx = np.empty(len(edges) * 2, dtype=np.int32)
+                            edges.foreach_get("vertices", edges_vert_idx)
+                            edges_vert_idx = totverts + edges_vert_idx.reshape(-1, 2)[edges_is_loose]
+                            pieces.append(('l %d %d\n', edges_vert_idx))
 
                         # Make the indices global rather then per mesh
                         totverts += len(me_verts)
                         totuvco += uv_unique_count
                         totno += no_unique_count
 
+                        write_pieces(pieces)
+                        del pieces
+
                         # clean up
                         ob_for_convert.to_mesh_clear()
 
                 subprogress1.leave_substeps("Finished writing geometry of '%s'." % ob_main.name)
+            flush_pieces()
             subprogress1.leave_substeps()
 
         subprogress1.step("Finished exporting geometry, now exporting materials")
@@ -672,6 +754,7 @@ def _write(context, filepath,
            EXPORT_ANIMATION,
            EXPORT_GLOBAL_MATRIX,
            EXPORT_PATH_MODE,  # Not used
+           EXPORT_PROCESSES,
            ):
 
     with ProgressReport(context.window_manager) as progress:
@@ -729,6 +812,7 @@ def _write(context, filepath,
                        EXPORT_GLOBAL_MATRIX,
                        EXPORT_PATH_MODE,
                        progress,
+                       EXPORT_PROCESSES=EXPORT_PROCESSES,
                        )
             progress.leave_substeps()
 
@@ -764,7 +848,8 @@ def save(context,
          use_selection=True,
          use_animation=False,
          global_matrix=None,
-         path_mode='AUTO'
+         path_mode='AUTO',
+         num_processes=1,
          ):
 
     _write(context, filepath,
@@ -787,6 +872,7 @@ def save(context,
            EXPORT_ANIMATION=use_animation,
            EXPORT_GLOBAL_MATRIX=global_matrix,
            EXPORT_PATH_MODE=path_mode,
+           EXPORT_PROCESSES=num_processes,
            )
 
     return {'FINISHED'}
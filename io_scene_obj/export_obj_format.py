@@ -0,0 +1,117 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""
+Formatting of OBJ export data gathered into arrays.
+
+This module doesn't depend on bpy, so that worker processes can run its functions.
+"""
+
+import os
+
+# Amount of rows formatted at once when writing arrays of data.
+FORMAT_CHUNK_SIZE = 1 << 16
+
+
+def format_rows(fmt, values):
+    """Yield given 2D array formatted with fmt (one row at a time), by chunks of rows."""
+    for i in range(0, len(values), FORMAT_CHUNK_SIZE):
+        chunk = values[i:i + FORMAT_CHUNK_SIZE]
+        yield (fmt * len(chunk)) % tuple(chunk.ravel().tolist())
+
+
+def format_faces(loop_fmt, faces_total, loops_values):
+    """
+    Yield 'f' records of given faces, loops_values being the indices written for each of their loops,
+    formatted with loop_fmt, by chunks of faces.
+    """
+    faces_fmt = {}
+    loops_start = 0
+    for i in range(0, len(faces_total), FORMAT_CHUNK_SIZE):
+        chunk_total = faces_total[i:i + FORMAT_CHUNK_SIZE].tolist()
+        fmt = []
+        for total in chunk_total:
+            face_fmt = faces_fmt.get(total)
+            if face_fmt is None:
+                face_fmt = faces_fmt[total] = 'f' + loop_fmt * total + '\n'
+            fmt.append(face_fmt)
+        loops_end = loops_start + sum(chunk_total)
+        yield ''.join(fmt) % tuple(loops_values[loops_start:loops_end].ravel().tolist())
+        loops_start = loops_end
+
+
+def iter_pieces(pieces):
+    """
+    Yield formatted OBJ data from given pieces, each being either a string,
+    a (fmt, values) tuple for format_rows() or a (loop_fmt, faces_total, loops_values) tuple for format_faces().
+    """
+    for piece in pieces:
+        if isinstance(piece, str):
+            yield piece
+        elif len(piece) == 2:
+            yield from format_rows(*piece)
+        else:
+            yield from format_faces(*piece)
+
+
+def format_pieces(pieces):
+    """Format given pieces (see iter_pieces()) into a single string, used by worker processes."""
+    return ''.join(iter_pieces(pieces))
+
+
+def _init_worker(package_path):
+    """
+    Register an empty package in place of the add-on one (which needs bpy) in a worker process,
+    so that the functions of this module can be imported there under their usual names.
+    """
+    import sys
+    import types
+
+    package = types.ModuleType(os.path.basename(package_path))
+    package.__path__ = [package_path]
+    sys.modules[package.__name__] = package
+
+
+def process_pool(num_processes):
+    """
+    Return a ProcessPoolExecutor with num_processes worker processes able to run this module's functions,
+    or None when worker processes can't be started from this Python.
+    """
+    import multiprocessing
+    import runpy
+    import sys
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Workers are started with a new Python interpreter, never by forking Blender.
+    # Blender's sys.executable is the Python it ships with (since 2.91), older versions point it to Blender itself.
+    if not os.path.basename(sys.executable).lower().startswith('python'):
+        return None
+
+    # Unpickling _init_worker itself would import the add-on package, workers run this file instead, which calls it.
+    return ProcessPoolExecutor(
+        num_processes,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=runpy.run_path,
+        initargs=(__file__, None, '__mp_worker__'),
+    )
+
+
+if __name__ == '__mp_worker__':
+    _init_worker(os.path.dirname(__file__))
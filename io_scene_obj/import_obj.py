@@ -32,15 +32,19 @@ http://wiki.blender.org/index.php/Scripts/Manual/Import/wavefront_obj
 """
 
 import array
+import itertools
 import os
 import time
 import bpy
 import mathutils
+import numpy as np
 
-from bpy_extras.io_utils import unpack_list
 from bpy_extras.image_utils import load_image
 from bpy_extras.wm_utils.progress_report import ProgressReport
 
+# Size hint (in bytes) of the chunks of lines read at once from OBJ files.
+OBJ_READ_CHUNK_SIZE = 1 << 24
+
 
 def line_value(line_split):
     """
@@ -479,14 +483,135 @@ def create_materials(filepath, relpath,
             mtl.close()
 
 
-def face_is_edge(face):
-    """Simple check to test whether given (temp, working) data is an edge, and not a real face."""
-    face_vert_loc_indices = face[0]
-    face_vert_nor_indices = face[1]
-    return len(face_vert_nor_indices) == 1 or len(face_vert_loc_indices) == 2
+def face_is_invalid_blenpoly(face_vert_loc_indices):
+    """Check whether given face uses a same edge more than once (i.e. is a Blender-invalid ngon, with holes...)."""
+    edges_usage = set()
+    prev_vidx = face_vert_loc_indices[-1]
+    for vidx in face_vert_loc_indices:
+        edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
+        if edge_key in edges_usage:
+            return True
+        edges_usage.add(edge_key)
+        prev_vidx = vidx
+    return False
+
+
+def bulk_line_tag(line):
+    """Return the tag of given line if it is a vertex or face record that can be bulk-parsed, None otherwise."""
+    if line[1:2] in {b' ', b'\t'}:
+        tag = line[:1]
+        return tag if tag in {b'v', b'f'} else None
+    if line[2:3] in {b' ', b'\t'}:
+        tag = line[:2]
+        return tag if tag in {b'vt', b'vn'} else None
+    return None
+
+
+def bulk_parse_vecs(lines, vec_len, float_func):
+    """
+    Parse a block of single-line 'v', 'vt' or 'vn' records (all with the same tag) at once.
+    Returns a (len(lines), vec_len) float64 array, or None if the block cannot be parsed in bulk
+    (varying amount of values, multi-line records, invalid numbers...).
+    """
+    data = b' '.join(lines)
+    if b'\\' in data:
+        return None
+    if float_func is not float:
+        data = data.replace(b',', b'.')
+    tokens = data.split()
+    num_lines = len(lines)
+    stride, remainder = divmod(len(tokens), num_lines)
+    if remainder or stride <= vec_len or tokens[::stride].count(tokens[0]) != num_lines:
+        return None
+    try:
+        return np.array(tokens).reshape(num_lines, stride)[:, 1:vec_len + 1].astype(np.float64)
+    except ValueError:
+        return None
+
+
+def bulk_parse_faces(lines, verts_loc_len, verts_tex_len, verts_nor_len):
+    """
+    Parse a block of single-line 'f' records at once.
+    Returns (faces_total, faces_invalid_blenpoly, loc_indices, tex_indices, nor_indices) arrays,
+    with zero-based (and resolved relative) indices, undefined tex and nor indices being set to zero.
+    Returns None if the block cannot be parsed in bulk (multi-line or malformed records...).
+    """
+    if b'\\' in b''.join(lines):
+        return None
+    lines_split = [line.split() for line in lines]
+    faces_total = np.fromiter(map(len, lines_split), dtype=np.int64, count=len(lines_split)) - 1
+    if not faces_total.all():
+        return None
+    tokens = [v for line_split in lines_split for v in line_split[1:]]
+    num_items = tokens[0].count(b'/') + 1
+    if num_items > 3:
+        return None
+    # Each line must use the same amount of items per vertex as the first one,
+    # else the split tokens below would not map to the right vertices.
+    num_slashes = num_items - 1
+    if any(line.count(b'/') != num_slashes * face_total
+           for line, face_total in zip(lines, faces_total.tolist())):
+        return None
+    tokens = b'/'.join(tokens).split(b'/')
+    num_loops = int(faces_total.sum())
+    if len(tokens) != num_loops * num_items:
+        return None
+    tokens = np.array(tokens).reshape(num_loops, num_items)
+
+    def resolve_indices(items, verts_len):
+        # Undefined indices ('' or '0') are set to 0, others are made zero-based, relative ones (negative) resolved.
+        indices = np.zeros(num_loops, dtype=np.int64)
+        is_defined = (items != b'') & (items != b'0')
+        indices[is_defined] = items[is_defined].astype(np.int64)
+        return np.where(indices < 1, indices + verts_len, indices - 1) * is_defined
+
+    try:
+        loc_indices = tokens[:, 0].astype(np.int64)  # Note that we assume here we cannot get OBJ invalid 0 index...
+        loc_indices = np.where(loc_indices < 1, loc_indices + verts_loc_len, loc_indices - 1)
+        empty_indices = np.zeros(num_loops, dtype=np.int64)
+        tex_indices = resolve_indices(tokens[:, 1], verts_tex_len) if num_items > 1 else empty_indices
+        nor_indices = resolve_indices(tokens[:, 2], verts_nor_len) if num_items > 2 else empty_indices
+    except ValueError:
+        return None
+
+    # Quick-detect ngons that *may* use a same edge more than once (they use a same vertex more than once),
+    # potential candidates are then fully checked.
+    faces_invalid_blenpoly = np.zeros(len(faces_total), dtype=np.bool_)
+    loops_face = np.repeat(np.arange(len(faces_total)), faces_total)
+    sort_order = np.lexsort((loc_indices, loops_face))
+    sorted_face = loops_face[sort_order]
+    sorted_loc = loc_indices[sort_order]
+    is_dup = (sorted_face[1:] == sorted_face[:-1]) & (sorted_loc[1:] == sorted_loc[:-1])
+    if is_dup.any():
+        faces_start = np.cumsum(faces_total) - faces_total
+        for f_idx in np.unique(sorted_face[1:][is_dup]).tolist():
+            start = faces_start[f_idx]
+            face_vert_loc_indices = loc_indices[start:start + faces_total[f_idx]].tolist()
+            faces_invalid_blenpoly[f_idx] = face_is_invalid_blenpoly(face_vert_loc_indices)
+
+    return faces_total, faces_invalid_blenpoly, loc_indices, tex_indices, nor_indices
+
+
+def faces_is_edge(faces):
+    """Simple check to test whether given (temp, working) faces data are edges, and not real faces."""
+    faces_total = faces[3]
+    faces_is_polyline = faces[5]
+    return faces_is_polyline | (faces_total == 2)
+
+
+def first_appearance_remap(indices):
+    """
+    Returns the unique values of given indices array in order of first appearance,
+    and the indices remapped to their position in those unique values.
+    """
+    unique_indices, first_index, remapped = np.unique(indices, return_index=True, return_inverse=True)
+    order = np.argsort(first_index)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return unique_indices[order], rank[remapped.reshape(-1)]
 
 
-def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
+def split_mesh(verts_loc, faces, contexts, unique_materials, filepath, SPLIT_OB_OR_GROUP):
     """
     Takes vert_loc and faces, and separates into multiple sets of
     (verts_loc, faces, unique_materials, dataname)
@@ -494,9 +619,18 @@ def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
 
     filename = os.path.splitext((os.path.basename(filepath)))[0]
 
-    if not SPLIT_OB_OR_GROUP or not faces:
-        use_verts_nor = any(f[1] for f in faces)
-        use_verts_tex = any(f[2] for f in faces)
+    (faces_loc,
+     faces_tex,
+     faces_nor,
+     faces_total,
+     faces_context,
+     faces_is_polyline,
+     faces_invalid_blenpoly,
+     ) = faces
+
+    if not SPLIT_OB_OR_GROUP or not len(faces_total):
+        use_verts_nor = bool(len(faces_total))
+        use_verts_tex = bool((~faces_is_polyline).any())
         # use the filename for the object name since we aren't chopping up the mesh.
         return [(verts_loc, faces, unique_materials, filename, use_verts_nor, use_verts_tex)]
 
@@ -510,53 +644,41 @@ def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
             return "_".join(k.decode('utf-8', 'replace') for k in key)
 
     # Return a key that makes the faces unique.
-    face_split_dict = {}
-
-    oldkey = -1  # initialize to a value that will never match the key
-
-    for face in faces:
-        (face_vert_loc_indices,
-         face_vert_nor_indices,
-         face_vert_tex_indices,
-         context_material,
-         _context_smooth_group,
-         context_object_key,
-         _face_invalid_blenpoly,
-         ) = face
-        key = context_object_key
-
-        if oldkey != key:
-            # Check the key has changed.
-            (verts_split, faces_split, unique_materials_split, vert_remap,
-             use_verts_nor, use_verts_tex) = face_split_dict.setdefault(key, ([], [], {}, {}, [], []))
-            oldkey = key
-
-        if not face_is_edge(face):
-            if not use_verts_nor and face_vert_nor_indices:
-                use_verts_nor.append(True)
-
-            if not use_verts_tex and face_vert_tex_indices:
-                use_verts_tex.append(True)
-
-        # Remap verts to new vert list and add where needed
-        for loop_idx, vert_idx in enumerate(face_vert_loc_indices):
-            map_index = vert_remap.get(vert_idx)
-            if map_index is None:
-                map_index = len(verts_split)
-                vert_remap[vert_idx] = map_index  # set the new remapped index so we only add once and can reference next time.
-                verts_split.append(verts_loc[vert_idx])  # add the vert to the local verts
-
-            face_vert_loc_indices[loop_idx] = map_index  # remap to the local index
-
+    keys = {}
+    contexts_key = np.array([keys.setdefault(context_object_key, len(keys))
+                             for (_, _, context_object_key) in contexts], dtype=np.int64)
+    keys = list(keys)
+    faces_key = contexts_key[faces_context]
+    faces_edge = faces_is_edge(faces)
+
+    ret = []
+    for key_idx in first_appearance_remap(faces_key)[0].tolist():
+        faces_mask = faces_key == key_idx
+        loops_mask = np.repeat(faces_mask, faces_total)
+
+        # Remap verts to new vert list, in order of first use.
+        verts_remap, faces_loc_split = first_appearance_remap(faces_loc[loops_mask])
+        verts_split = verts_loc[verts_remap]
+
+        faces_context_split = faces_context[faces_mask]
+        unique_materials_split = {}
+        for context_idx in first_appearance_remap(faces_context_split)[0].tolist():
+            context_material = contexts[context_idx][0]
             if context_material not in unique_materials_split:
                 unique_materials_split[context_material] = unique_materials[context_material]
 
-        faces_split.append(face)
+        faces_split = (faces_loc_split,
+                       faces_tex[loops_mask],
+                       faces_nor[loops_mask],
+                       faces_total[faces_mask],
+                       faces_context_split,
+                       faces_is_polyline[faces_mask],
+                       faces_invalid_blenpoly[faces_mask],
+                       )
+        use_verts = bool((~faces_edge[faces_mask]).any())
+        ret.append((verts_split, faces_split, unique_materials_split, key_to_name(keys[key_idx]), use_verts, use_verts))
 
-    # remove one of the items and reorder
-    return [(verts_split, faces_split, unique_materials_split, key_to_name(key), bool(use_vnor), bool(use_vtex))
-            for key, (verts_split, faces_split, unique_materials_split, _, use_vnor, use_vtex)
-            in face_split_dict.items()]
+    return ret
 
 
 def create_mesh(new_objects,
@@ -565,6 +687,7 @@ def create_mesh(new_objects,
                 verts_nor,
                 verts_tex,
                 faces,
+                contexts,
                 unique_materials,
                 unique_smooth_groups,
                 vertex_groups,
@@ -575,109 +698,92 @@ def create_mesh(new_objects,
     deals with ngons, sharp edges and assigning materials
     """
 
-    if unique_smooth_groups:
-        sharp_edges = set()
-        smooth_group_users = {context_smooth_group: {} for context_smooth_group in unique_smooth_groups.keys()}
-        context_smooth_group_old = -1
+    (faces_loc,
+     faces_tex,
+     faces_nor,
+     faces_total,
+     faces_context,
+     faces_is_polyline,
+     faces_invalid_blenpoly,
+     ) = faces
+
+    faces_start = np.cumsum(faces_total) - faces_total
+
+    # Faces with a single vertex are dropped, polylines (and two-vertices faces) are edges.
+    faces_single = faces_total == 1
+    faces_edge = ~faces_single & faces_is_edge(faces)
+    faces_poly = ~faces_single & ~faces_edge
+
+    def faces_loops(faces_indices, shorten=0):
+        # Loop indices of given faces (optionally skipping their last loops), in faces order.
+        totals = faces_total[faces_indices] - shorten
+        starts = faces_start[faces_indices]
+        totals_start = np.cumsum(totals) - totals
+        return np.repeat(starts - totals_start, totals) + np.arange(totals.sum())
+
+    edges = np.empty((0, 2), dtype=np.int64)
+    if use_edges:
+        # reverse loop through edge faces.
+        edge_faces = np.flatnonzero(faces_edge)[::-1]
+        edges_first_loop = faces_loops(edge_faces, shorten=1)
+        edges = np.column_stack((faces_loc[edges_first_loop], faces_loc[edges_first_loop + 1]))
 
+    # Smooth Group
+    sharp_edges = None
+    if unique_smooth_groups:
+        smooth_groups = {context_smooth_group: i for i, context_smooth_group in enumerate(unique_smooth_groups, 1)}
+        contexts_smooth_group = np.array([smooth_groups.get(context_smooth_group, 0) if context_smooth_group else 0
+                                          for (_, context_smooth_group, _) in contexts], dtype=np.int64)
+        faces_smooth_group = contexts_smooth_group[faces_context]
+        smooth_faces = np.flatnonzero(faces_poly & (faces_smooth_group != 0))
+        # Is a part of of a smooth group and is a face, count users of each edge in each group.
+        loops = faces_loops(smooth_faces)
+        prev_loops = loops - 1
+        first_loops = np.cumsum(faces_total[smooth_faces]) - faces_total[smooth_faces]
+        prev_loops[first_loops] = loops[first_loops] + faces_total[smooth_faces] - 1
+        vidx, prev_vidx = faces_loc[loops], faces_loc[prev_loops]
+        edges_keys = np.column_stack((np.repeat(faces_smooth_group[smooth_faces], faces_total[smooth_faces]),
+                                      np.minimum(prev_vidx, vidx), np.maximum(prev_vidx, vidx)))
+        edges_keys, edges_users = np.unique(edges_keys, axis=0, return_counts=True)
+        # This edge is on the boundary of a group
+        sharp_edges = edges_keys[edges_users == 1, 1:]
+
+    # NGons into triangles
     fgon_edges = set()  # Used for storing fgon keys when we need to tessellate/untessellate them (ngons with hole).
-    edges = []
-    tot_loops = 0
-
-    context_object_key = None
-
-    # reverse loop through face indices
-    for f_idx in range(len(faces) - 1, -1, -1):
-        face = faces[f_idx]
-
-        (face_vert_loc_indices,
-         face_vert_nor_indices,
-         face_vert_tex_indices,
-         context_material,
-         context_smooth_group,
-         context_object_key,
-         face_invalid_blenpoly,
-         ) = face
-
-        len_face_vert_loc_indices = len(face_vert_loc_indices)
-
-        if len_face_vert_loc_indices == 1:
-            faces.pop(f_idx)  # cant add single vert faces
-
-        # Face with a single item in face_vert_nor_indices is actually a polyline!
-        elif face_is_edge(face):
-            if use_edges:
-                edges.extend((face_vert_loc_indices[i], face_vert_loc_indices[i + 1])
-                             for i in range(len_face_vert_loc_indices - 1))
-            faces.pop(f_idx)
-
-        else:
-            # Smooth Group
-            if unique_smooth_groups and context_smooth_group:
-                # Is a part of of a smooth group and is a face
-                if context_smooth_group_old is not context_smooth_group:
-                    edge_dict = smooth_group_users[context_smooth_group]
-                    context_smooth_group_old = context_smooth_group
-
-                prev_vidx = face_vert_loc_indices[-1]
-                for vidx in face_vert_loc_indices:
+    tess_loops = []
+    tess_faces = []
+    for f_idx in np.flatnonzero(faces_poly & faces_invalid_blenpoly)[::-1].tolist():
+        # ignore triangles with invalid indices
+        if faces_total[f_idx] <= 3:
+            continue
+        from bpy_extras.mesh_utils import ngon_tessellate
+        face_loops = np.arange(faces_start[f_idx], faces_start[f_idx] + faces_total[f_idx])
+        face_vert_loc_indices = faces_loc[face_loops].tolist()
+        ngon_face_indices = ngon_tessellate(verts_loc, face_vert_loc_indices, debug_print=bpy.app.debug)
+        tess_loops.extend(face_loops[list(ngon)] for ngon in ngon_face_indices)
+        tess_faces.extend([f_idx] * len(ngon_face_indices))
+
+        # edges to make ngons
+        if len(ngon_face_indices) > 1:
+            edge_users = set()
+            for ngon in ngon_face_indices:
+                prev_vidx = face_vert_loc_indices[ngon[-1]]
+                for ngidx in ngon:
+                    vidx = face_vert_loc_indices[ngidx]
+                    if vidx == prev_vidx:
+                        continue  # broken OBJ... Just skip.
                     edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
                     prev_vidx = vidx
-                    edge_dict[edge_key] = edge_dict.get(edge_key, 0) + 1
-
-            # NGons into triangles
-            if face_invalid_blenpoly:
-                # ignore triangles with invalid indices
-                if len(face_vert_loc_indices) > 3:
-                    from bpy_extras.mesh_utils import ngon_tessellate
-                    ngon_face_indices = ngon_tessellate(verts_loc, face_vert_loc_indices, debug_print=bpy.app.debug)
-                    faces.extend([([face_vert_loc_indices[ngon[0]],
-                                    face_vert_loc_indices[ngon[1]],
-                                    face_vert_loc_indices[ngon[2]],
-                                    ],
-                                [face_vert_nor_indices[ngon[0]],
-                                    face_vert_nor_indices[ngon[1]],
-                                    face_vert_nor_indices[ngon[2]],
-                                    ] if face_vert_nor_indices else [],
-                                [face_vert_tex_indices[ngon[0]],
-                                    face_vert_tex_indices[ngon[1]],
-                                    face_vert_tex_indices[ngon[2]],
-                                    ] if face_vert_tex_indices else [],
-                                context_material,
-                                context_smooth_group,
-                                context_object_key,
-                                [],
-                                )
-                                for ngon in ngon_face_indices]
-                                )
-                    tot_loops += 3 * len(ngon_face_indices)
-
-                    # edges to make ngons
-                    if len(ngon_face_indices) > 1:
-                        edge_users = set()
-                        for ngon in ngon_face_indices:
-                            prev_vidx = face_vert_loc_indices[ngon[-1]]
-                            for ngidx in ngon:
-                                vidx = face_vert_loc_indices[ngidx]
-                                if vidx == prev_vidx:
-                                    continue  # broken OBJ... Just skip.
-                                edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
-                                prev_vidx = vidx
-                                if edge_key in edge_users:
-                                    fgon_edges.add(edge_key)
-                                else:
-                                    edge_users.add(edge_key)
-
-                faces.pop(f_idx)
-            else:
-                tot_loops += len_face_vert_loc_indices
+                    if edge_key in edge_users:
+                        fgon_edges.add(edge_key)
+                    else:
+                        edge_users.add(edge_key)
 
-    # Build sharp edges
-    if unique_smooth_groups:
-        for edge_dict in smooth_group_users.values():
-            for key, users in edge_dict.items():
-                if users == 1:  # This edge is on the boundary of a group
-                    sharp_edges.add(key)
+    # Valid faces, followed by triangles from tessellated ngons.
+    valid_faces = np.flatnonzero(faces_poly & ~faces_invalid_blenpoly)
+    mesh_loops = np.concatenate((faces_loops(valid_faces), np.array(tess_loops, dtype=np.int64).reshape(-1)))
+    mesh_faces = np.concatenate((valid_faces, np.array(tess_faces, dtype=np.int64)))
+    mesh_faces_total = np.concatenate((faces_total[valid_faces], np.full(len(tess_faces), 3, dtype=np.int64)))
 
     # map the material names to an index
     material_mapping = {name: i for i, name in enumerate(unique_materials)}  # enumerate over unique_materials keys()
@@ -694,55 +800,40 @@ def create_mesh(new_objects,
         me.materials.append(material)
 
     me.vertices.add(len(verts_loc))
-    me.loops.add(tot_loops)
-    me.polygons.add(len(faces))
-
-    # verts_loc is a list of (x, y, z) tuples
-    me.vertices.foreach_set("co", unpack_list(verts_loc))
+    me.loops.add(len(mesh_loops))
+    me.polygons.add(len(mesh_faces))
 
-    loops_vert_idx = tuple(vidx for (face_vert_loc_indices, _, _, _, _, _, _) in faces for vidx in face_vert_loc_indices)
-    faces_loop_start = []
-    lidx = 0
-    for f in faces:
-        face_vert_loc_indices = f[0]
-        nbr_vidx = len(face_vert_loc_indices)
-        faces_loop_start.append(lidx)
-        lidx += nbr_vidx
-    faces_loop_total = tuple(len(face_vert_loc_indices) for (face_vert_loc_indices, _, _, _, _, _, _) in faces)
+    # verts_loc is a (N, 3) array
+    me.vertices.foreach_set("co", verts_loc.astype(np.float32).ravel())
 
-    me.loops.foreach_set("vertex_index", loops_vert_idx)
-    me.polygons.foreach_set("loop_start", faces_loop_start)
-    me.polygons.foreach_set("loop_total", faces_loop_total)
+    me.loops.foreach_set("vertex_index", faces_loc[mesh_loops].astype(np.int32))
+    me.polygons.foreach_set("loop_start", (np.cumsum(mesh_faces_total) - mesh_faces_total).astype(np.int32))
+    me.polygons.foreach_set("loop_total", mesh_faces_total.astype(np.int32))
 
-    faces_ma_index = tuple(material_mapping[context_material] for (_, _, _, context_material, _, _, _) in faces)
-    me.polygons.foreach_set("material_index", faces_ma_index)
+    mesh_faces_context = faces_context[mesh_faces]
+    contexts_ma_index = np.array([material_mapping.get(context_material, 0)
+                                  for (context_material, _, _) in contexts], dtype=np.int32)
+    me.polygons.foreach_set("material_index", contexts_ma_index[mesh_faces_context])
 
-    faces_use_smooth = tuple(bool(context_smooth_group) for (_, _, _, _, context_smooth_group, _, _) in faces)
-    me.polygons.foreach_set("use_smooth", faces_use_smooth)
+    contexts_use_smooth = np.array([bool(context_smooth_group)
+                                    for (_, context_smooth_group, _) in contexts], dtype=np.bool_)
+    me.polygons.foreach_set("use_smooth", contexts_use_smooth[mesh_faces_context])
 
-    if verts_nor and me.loops:
+    if len(verts_nor) and len(mesh_loops):
         # Note: we store 'temp' normals in loops, since validate() may alter final mesh,
         #       we can only set custom lnors *after* calling it.
         me.create_normals_split()
-        loops_nor = tuple(no for (_, face_vert_nor_indices, _, _, _, _, _) in faces
-                             for face_noidx in face_vert_nor_indices
-                             for no in verts_nor[face_noidx])
-        me.loops.foreach_set("normal", loops_nor)
-
-    if verts_tex and me.polygons:
-        # Some files Do not explicitely write the 'v' value when it's 0.0, see T68249...
-        verts_tex = [uv if len(uv) == 2 else uv + [0.0] for uv in verts_tex]
+        me.loops.foreach_set("normal", verts_nor[faces_nor[mesh_loops]].astype(np.float32).ravel())
+
+    if len(verts_tex) and len(mesh_faces):
         me.uv_layers.new(do_init=False)
-        loops_uv = tuple(uv for (_, _, face_vert_tex_indices, _, _, _, _) in faces
-                            for face_uvidx in face_vert_tex_indices
-                            for uv in verts_tex[face_uvidx])
-        me.uv_layers[0].data.foreach_set("uv", loops_uv)
+        me.uv_layers[0].data.foreach_set("uv", verts_tex[faces_tex[mesh_loops]].astype(np.float32).ravel())
 
-    use_edges = use_edges and bool(edges)
+    use_edges = use_edges and bool(len(edges))
     if use_edges:
         me.edges.add(len(edges))
-        # edges should be a list of (a, b) tuples
-        me.edges.foreach_set("vertices", unpack_list(edges))
+        # edges is a (N, 2) array
+        me.edges.foreach_set("vertices", edges.astype(np.int32).ravel())
 
     me.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
     me.update(calc_edges=use_edges, calc_edges_loose=use_edges)
@@ -766,12 +857,16 @@ def create_mesh(new_objects,
         bm.free()
 
     # XXX If validate changes the geometry, this is likely to be broken...
-    if unique_smooth_groups and sharp_edges:
-        for e in me.edges:
-            if e.key in sharp_edges:
-                e.use_edge_sharp = True
-
-    if verts_nor:
+    if sharp_edges is not None and len(sharp_edges) and len(me.edges):
+        me_edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+        me.edges.foreach_get("vertices", me_edges)
+        me_edges = np.sort(me_edges.reshape(-1, 2), axis=1).astype(np.int64)
+        num_verts = max(len(verts_loc), 1)
+        is_sharp = np.isin(me_edges[:, 0] * num_verts + me_edges[:, 1],
+                           sharp_edges[:, 0] * num_verts + sharp_edges[:, 1])
+        me.edges.foreach_set("use_edge_sharp", is_sharp)
+
+    if len(verts_nor):
         clnors = array.array('f', [0.0] * (len(me.loops) * 3))
         me.loops.foreach_get("normal", clnors)
 
@@ -822,7 +917,7 @@ def create_nurbs(context_nurbs, vert_loc, new_objects):
 
     nu = cu.splines.new('NURBS')
     nu.points.add(len(curv_idx) - 1)  # a point is added to start with
-    nu.points.foreach_set("co", [co_axis for vt_idx in curv_idx for co_axis in (vert_loc[vt_idx] + [1.0])])
+    nu.points.foreach_set("co", [co_axis for vt_idx in curv_idx for co_axis in (*vert_loc[vt_idx], 1.0)])
 
     nu.order_u = deg[0] + 1
 
@@ -939,22 +1034,23 @@ def load(context,
         elif context_multi_line == tag:
             vec += [float_func(v) for v in line_split]
         if not ret_context_multi_line:
-            data.append(tuple(vec[:vec_len]))
+            data.extend(vec[:vec_len])
+            data.extend([0.0] * (vec_len - len(vec)))
         return ret_context_multi_line
 
-    def create_face(context_material, context_smooth_group, context_object_key):
-        face_vert_loc_indices = []
-        face_vert_nor_indices = []
-        face_vert_tex_indices = []
-        return (
-            face_vert_loc_indices,
-            face_vert_nor_indices,
-            face_vert_tex_indices,
-            context_material,
-            context_smooth_group,
-            context_object_key,
-            [],  # If non-empty, that face is a Blender-invalid ngon (holes...), need a mutable object for that...
-        )
+    def face_context_index(context_material, context_smooth_group, context_object_key):
+        context = (context_material, context_smooth_group, context_object_key)
+        context_index = contexts.get(context)
+        if context_index is None:
+            context_index = contexts[context] = len(contexts)
+        return context_index
+
+    def create_face(context_material, context_smooth_group, context_object_key, is_polyline=False):
+        # Faces are stored in flat arrays, their loops are added afterwards (increasing their faces_total).
+        faces_total.append(0)
+        faces_context.append(face_context_index(context_material, context_smooth_group, context_object_key))
+        faces_is_polyline.append(is_polyline)
+        faces_invalid_blenpoly.append(False)  # If True, that face is a Blender-invalid ngon (holes...).
 
     with ProgressReport(context.window_manager) as progress:
         progress.enter_substeps(1, "Importing OBJ %r..." % filepath)
@@ -965,10 +1061,19 @@ def load(context,
         if use_split_objects or use_split_groups:
             use_groups_as_vgroups = False
 
-        verts_loc = []
-        verts_nor = []
-        verts_tex = []
-        faces = []  # tuples of the faces
+        # Flat arrays of vertex data (3 values per location and normal, 2 per UV).
+        verts_loc = array.array('d')
+        verts_nor = array.array('d')
+        verts_tex = array.array('d')
+        # Faces are stored as flat arrays of their loops' indices, and per-face data arrays.
+        faces_loc = array.array('q')
+        faces_tex = array.array('q')
+        faces_nor = array.array('q')
+        faces_total = array.array('q')
+        faces_context = array.array('q')  # Index in contexts.
+        faces_is_polyline = array.array('b')
+        faces_invalid_blenpoly = array.array('b')
+        contexts = {}  # (material, smooth group, object key) -> index of that context
         material_libs = set()  # filenames to material libs this OBJ uses
         vertex_groups = {}  # when use_groups_as_vgroups is true
 
@@ -1002,14 +1107,9 @@ def load(context,
         context_multi_line = b''
 
         # Per-face handling data.
-        face_vert_loc_indices = None
-        face_vert_nor_indices = None
-        face_vert_tex_indices = None
         verts_loc_len = verts_nor_len = verts_tex_len = 0
         face_items_usage = set()
-        face_invalid_blenpoly = None
-        prev_vidx = None
-        face = None
+        face_invalid_blenpoly = False
         vec = []
 
         quick_vert_failures = 0
@@ -1017,230 +1117,253 @@ def load(context,
 
         progress.enter_substeps(3, "Parsing OBJ file...")
         with open(filepath, 'rb') as f:
-            for line in f:
-                line_split = line.split()
-
-                if not line_split:
-                    continue
-
-                line_start = line_split[0]  # we compare with this a _lot_
-
-                if len(line_split) == 1 and not context_multi_line and line_start != b'end':
-                    print("WARNING, skipping malformatted line: %s" % line.decode('UTF-8', 'replace').rstrip())
-                    continue
-
-                # Handling vertex data are pretty similar, factorize that.
-                # Also, most OBJ files store all those on a single line, so try fast parsing for that first,
-                # and only fallback to full multi-line parsing when needed, this gives significant speed-up
-                # (~40% on affected code).
-                if line_start == b'v':
-                    vdata, vdata_len, do_quick_vert = verts_loc, 3, not skip_quick_vert
-                elif line_start == b'vn':
-                    vdata, vdata_len, do_quick_vert = verts_nor, 3, not skip_quick_vert
-                elif line_start == b'vt':
-                    vdata, vdata_len, do_quick_vert = verts_tex, 2, not skip_quick_vert
-                elif context_multi_line == b'v':
-                    vdata, vdata_len, do_quick_vert = verts_loc, 3, False
-                elif context_multi_line == b'vn':
-                    vdata, vdata_len, do_quick_vert = verts_nor, 3, False
-                elif context_multi_line == b'vt':
-                    vdata, vdata_len, do_quick_vert = verts_tex, 2, False
-                else:
-                    vdata_len = 0
-
-                if vdata_len:
-                    if do_quick_vert:
-                        try:
-                            vdata.append(list(map(float_func, line_split[1:vdata_len + 1])))
-                        except:
-                            do_quick_vert = False
-                            # In case we get too many failures on quick parsing, force fallback to full multi-line one.
-                            # Exception handling can become costly...
-                            quick_vert_failures += 1
-                            if quick_vert_failures > 10000:
-                                skip_quick_vert = True
-                    if not do_quick_vert:
-                        context_multi_line = handle_vec(line_start, context_multi_line, line_split,
-                                                        context_multi_line or line_start,
-                                                        vdata, vec, vdata_len)
-
-                elif line_start == b'f' or context_multi_line == b'f':
-                    if not context_multi_line:
-                        line_split = line_split[1:]
-                        # Instantiate a face
-                        face = create_face(context_material, context_smooth_group, context_object_key)
-                        (face_vert_loc_indices, face_vert_nor_indices, face_vert_tex_indices,
-                         _1, _2, _3, face_invalid_blenpoly) = face
-                        faces.append(face)
-                        face_items_usage.clear()
-                        verts_loc_len = len(verts_loc)
-                        verts_nor_len = len(verts_nor)
-                        verts_tex_len = len(verts_tex)
-                        if context_material is None:
-                            use_default_material = True
-                    # Else, use face_vert_loc_indices and face_vert_tex_indices previously defined and used the obj_face
-
-                    context_multi_line = b'f' if strip_slash(line_split) else b''
-
-                    for v in line_split:
-                        obj_vert = v.split(b'/')
-                        idx = int(obj_vert[0])  # Note that we assume here we cannot get OBJ invalid 0 index...
-                        vert_loc_index = (idx + verts_loc_len) if (idx < 1) else idx - 1
-                        # Add the vertex to the current group
-                        # *warning*, this wont work for files that have groups defined around verts
-                        if use_groups_as_vgroups and context_vgroup:
-                            vertex_groups[context_vgroup].append(vert_loc_index)
-                        # This a first round to quick-detect ngons that *may* use a same edge more than once.
-                        # Potential candidate will be re-checked once we have done parsing the whole face.
-                        if not face_invalid_blenpoly:
-                            # If we use more than once a same vertex, invalid ngon is suspected.
-                            if vert_loc_index in face_items_usage:
-                                face_invalid_blenpoly.append(True)
-                            else:
-                                face_items_usage.add(vert_loc_index)
-                        face_vert_loc_indices.append(vert_loc_index)
-
-                        # formatting for faces with normals and textures is
-                        # loc_index/tex_index/nor_index
-                        if len(obj_vert) > 1 and obj_vert[1] and obj_vert[1] != b'0':
-                            idx = int(obj_vert[1])
-                            face_vert_tex_indices.append((idx + verts_tex_len) if (idx < 1) else idx - 1)
+            # Read the file by chunks of lines, consecutive vertex and face records being bulk-parsed when possible.
+            for lines in iter(lambda: f.readlines(OBJ_READ_CHUNK_SIZE), []):
+                for tag, group in itertools.groupby(lines, key=bulk_line_tag):
+                    group = list(group)
+                    if tag is not None and not context_multi_line and len(group) > 1:
+                        if tag == b'f':
+                            face_data = bulk_parse_faces(group, len(verts_loc) // 3, len(verts_tex) // 2,
+                                                         len(verts_nor) // 3)
+                            if face_data is not None:
+                                totals, invalid_blenpoly, loc_indices, tex_indices, nor_indices = face_data
+                                if use_groups_as_vgroups and context_vgroup:
+                                    vertex_groups[context_vgroup].extend(loc_indices.tolist())
+                                context_index = face_context_index(context_material, context_smooth_group,
+                                                                   context_object_key)
+                                faces_loc.frombytes(loc_indices.tobytes())
+                                faces_tex.frombytes(tex_indices.tobytes())
+                                faces_nor.frombytes(nor_indices.tobytes())
+                                faces_total.frombytes(totals.tobytes())
+                                faces_context.frombytes(np.full(len(totals), context_index, dtype=np.int64).tobytes())
+                                faces_is_polyline.frombytes(bytes(len(totals)))
+                                faces_invalid_blenpoly.frombytes(invalid_blenpoly.astype(np.int8).tobytes())
+                                if context_material is None:
+                                    use_default_material = True
+                                continue
                         else:
-                            face_vert_tex_indices.append(0)
-
-                        if len(obj_vert) > 2 and obj_vert[2] and obj_vert[2] != b'0':
-                            idx = int(obj_vert[2])
-                            face_vert_nor_indices.append((idx + verts_nor_len) if (idx < 1) else idx - 1)
+                            vdata, vdata_len = {b'v': (verts_loc, 3), b'vn': (verts_nor, 3), b'vt': (verts_tex, 2)}[tag]
+                            vecs = bulk_parse_vecs(group, vdata_len, float_func)
+                            if vecs is not None:
+                                vdata.frombytes(vecs.tobytes())
+                                continue
+
+                    for line in group:
+                        line_split = line.split()
+
+                        if not line_split:
+                            continue
+
+                        line_start = line_split[0]  # we compare with this a _lot_
+
+                        if len(line_split) == 1 and not context_multi_line and line_start != b'end':
+                            print("WARNING, skipping malformatted line: %s" % line.decode('UTF-8', 'replace').rstrip())
+                            continue
+
+                        # Handling vertex data are pretty similar, factorize that.
+                        # Also, most OBJ files store all those on a single line, so try fast parsing for that first,
+                        # and only fallback to full multi-line parsing when needed, this gives significant speed-up
+                        # (~40% on affected code).
+                        if line_start == b'v':
+                            vdata, vdata_len, do_quick_vert = verts_loc, 3, not skip_quick_vert
+                        elif line_start == b'vn':
+                            vdata, vdata_len, do_quick_vert = verts_nor, 3, not skip_quick_vert
+                        elif line_start == b'vt':
+                            vdata, vdata_len, do_quick_vert = verts_tex, 2, not skip_quick_vert
+                        elif context_multi_line == b'v':
+                            vdata, vdata_len, do_quick_vert = verts_loc, 3, False
+                        elif context_multi_line == b'vn':
+                            vdata, vdata_len, do_quick_vert = verts_nor, 3, False
+                        elif context_multi_line == b'vt':
+                            vdata, vdata_len, do_quick_vert = verts_tex, 2, False
                         else:
-                            face_vert_nor_indices.append(0)
-
-                    if not context_multi_line:
-                        # Means we have finished a face, we have to do final check if ngon is suspected to be blender-invalid...
-                        if face_invalid_blenpoly:
-                            face_invalid_blenpoly.clear()
-                            face_items_usage.clear()
-                            prev_vidx = face_vert_loc_indices[-1]
-                            for vidx in face_vert_loc_indices:
-                                edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
-                                if edge_key in face_items_usage:
-                                    face_invalid_blenpoly.append(True)
-                                    break
-                                face_items_usage.add(edge_key)
-                                prev_vidx = vidx
-
-                elif use_edges and (line_start == b'l' or context_multi_line == b'l'):
-                    # very similar to the face load function above with some parts removed
-                    if not context_multi_line:
-                        line_split = line_split[1:]
-                        # Instantiate a face
-                        face = create_face(context_material, context_smooth_group, context_object_key)
-                        face_vert_loc_indices = face[0]
-                        # XXX A bit hackish, we use special 'value' of face_vert_nor_indices (a single True item) to tag this
-                        #     as a polyline, and not a regular face...
-                        face[1][:] = [True]
-                        faces.append(face)
-                        if context_material is None:
-                            use_default_material = True
-                    # Else, use face_vert_loc_indices previously defined and used the obj_face
-
-                    context_multi_line = b'l' if strip_slash(line_split) else b''
-
-                    for v in line_split:
-                        obj_vert = v.split(b'/')
-                        idx = int(obj_vert[0]) - 1
-                        face_vert_loc_indices.append((idx + len(verts_loc) + 1) if (idx < 0) else idx)
-
-                elif line_start == b's':
-                    if use_smooth_groups:
-                        context_smooth_group = line_value(line_split)
-                        if context_smooth_group == b'off':
-                            context_smooth_group = None
-                        elif context_smooth_group:  # is not None
-                            unique_smooth_groups[context_smooth_group] = None
-
-                elif line_start == b'o':
-                    if use_split_objects:
-                        context_object_key = unique_name(objects_names, line_value(line_split))
-                        context_object_obpart = context_object_key
-                        # unique_objects[context_object_key]= None
-
-                elif line_start == b'g':
-                    if use_split_groups:
-                        grppart = line_value(line_split)
-                        context_object_key = (context_object_obpart, grppart) if context_object_obpart else grppart
-                        # print 'context_object_key', context_object_key
-                        # unique_objects[context_object_key]= None
-                    elif use_groups_as_vgroups:
-                        context_vgroup = line_value(line.split())
-                        if context_vgroup and context_vgroup != b'(null)':
-                            vertex_groups.setdefault(context_vgroup, [])
-                        else:
-                            context_vgroup = None  # dont assign a vgroup
-
-                elif line_start == b'usemtl':
-                    context_material = line_value(line.split())
-                    unique_materials[context_material] = None
-                elif line_start == b'mtllib':  # usemap or usemat
-                    # can have multiple mtllib filenames per line, mtllib can appear more than once,
-                    # so make sure only occurrence of material exists
-                    material_libs |= {os.fsdecode(f) for f in filenames_group_by_ext(line.lstrip()[7:].strip(), b'.mtl')
-                    }
-
-                    # Nurbs support
-                elif line_start == b'cstype':
-                    context_nurbs[b'cstype'] = line_value(line.split())  # 'rat bspline' / 'bspline'
-                elif line_start == b'curv' or context_multi_line == b'curv':
-                    curv_idx = context_nurbs[b'curv_idx'] = context_nurbs.get(b'curv_idx', [])  # in case were multiline
-
-                    if not context_multi_line:
-                        context_nurbs[b'curv_range'] = float_func(line_split[1]), float_func(line_split[2])
-                        line_split[0:3] = []  # remove first 3 items
-
-                    if strip_slash(line_split):
-                        context_multi_line = b'curv'
-                    else:
-                        context_multi_line = b''
+                            vdata_len = 0
+
+                        if vdata_len:
+                            if do_quick_vert:
+                                try:
+                                    vec[:] = map(float_func, line_split[1:vdata_len + 1])
+                                    vdata.extend(vec)
+                                    # Some files do not explicitly write the 'v' value of UVs when it's 0.0, see T68249...
+                                    vdata.extend([0.0] * (vdata_len - len(vec)))
+                                except:
+                                    do_quick_vert = False
+                                    # In case we get too many failures on quick parsing, force fallback to full multi-line one.
+                                    # Exception handling can become costly...
+                                    quick_vert_failures += 1
+                                    if quick_vert_failures > 10000:
+                                        skip_quick_vert = True
+                            if not do_quick_vert:
+                                context_multi_line = handle_vec(line_start, context_multi_line, line_split,
+                                                                context_multi_line or line_start,
+                                                                vdata, vec, vdata_len)
+
+                        elif line_start == b'f' or context_multi_line == b'f':
+                            if not context_multi_line:
+                                line_split = line_split[1:]
+                                # Instantiate a face
+                                create_face(context_material, context_smooth_group, context_object_key)
+                                face_items_usage.clear()
+                                face_invalid_blenpoly = False
+                                verts_loc_len = len(verts_loc) // 3
+                                verts_nor_len = len(verts_nor) // 3
+                                verts_tex_len = len(verts_tex) // 2
+                                if context_material is None:
+                                    use_default_material = True
+                            # Else, keep adding loops to the last face previously instantiated
+
+                            context_multi_line = b'f' if strip_slash(line_split) else b''
+
+                            for v in line_split:
+                                obj_vert = v.split(b'/')
+                                idx = int(obj_vert[0])  # Note that we assume here we cannot get OBJ invalid 0 index...
+                                vert_loc_index = (idx + verts_loc_len) if (idx < 1) else idx - 1
+                                # Add the vertex to the current group
+                                # *warning*, this wont work for files that have groups defined around verts
+                                if use_groups_as_vgroups and context_vgroup:
+                                    vertex_groups[context_vgroup].append(vert_loc_index)
+                                # This a first round to quick-detect ngons that *may* use a same edge more than once.
+                                # Potential candidate will be re-checked once we have done parsing the whole face.
+                                if not face_invalid_blenpoly:
+                                    # If we use more than once a same vertex, invalid ngon is suspected.
+                                    if vert_loc_index in face_items_usage:
+                                        face_invalid_blenpoly = True
+                                    else:
+                                        face_items_usage.add(vert_loc_index)
+                                faces_loc.append(vert_loc_index)
+                                faces_total[-1] += 1
+
+                                # formatting for faces with normals and textures is
+                                # loc_index/tex_index/nor_index
+                                if len(obj_vert) > 1 and obj_vert[1] and obj_vert[1] != b'0':
+                                    idx = int(obj_vert[1])
+                                    faces_tex.append((idx + verts_tex_len) if (idx < 1) else idx - 1)
+                                else:
+                                    faces_tex.append(0)
 
-                    for i in line_split:
-                        vert_loc_index = int(i) - 1
+                                if len(obj_vert) > 2 and obj_vert[2] and obj_vert[2] != b'0':
+                                    idx = int(obj_vert[2])
+                                    faces_nor.append((idx + verts_nor_len) if (idx < 1) else idx - 1)
+                                else:
+                                    faces_nor.append(0)
+
+                            if not context_multi_line:
+                                # Means we have finished a face, we have to do final check if ngon is suspected to be blender-invalid...
+                                if face_invalid_blenpoly:
+                                    face_vert_loc_indices = faces_loc[len(faces_loc) - faces_total[-1]:]
+                                    faces_invalid_blenpoly[-1] = face_is_invalid_blenpoly(face_vert_loc_indices)
+
+                        elif use_edges and (line_start == b'l' or context_multi_line == b'l'):
+                            # very similar to the face load function above with some parts removed
+                            if not context_multi_line:
+                                line_split = line_split[1:]
+                                # Instantiate a face, tagged as a polyline, and not a regular face...
+                                create_face(context_material, context_smooth_group, context_object_key, True)
+                                if context_material is None:
+                                    use_default_material = True
+                            # Else, keep adding loops to the last face previously instantiated
+
+                            context_multi_line = b'l' if strip_slash(line_split) else b''
+
+                            for v in line_split:
+                                obj_vert = v.split(b'/')
+                                idx = int(obj_vert[0]) - 1
+                                faces_loc.append((idx + len(verts_loc) // 3 + 1) if (idx < 0) else idx)
+                                faces_tex.append(0)
+                                faces_nor.append(0)
+                                faces_total[-1] += 1
+
+                        elif line_start == b's':
+                            if use_smooth_groups:
+                                context_smooth_group = line_value(line_split)
+                                if context_smooth_group == b'off':
+                                    context_smooth_group = None
+                                elif context_smooth_group:  # is not None
+                                    unique_smooth_groups[context_smooth_group] = None
+
+                        elif line_start == b'o':
+                            if use_split_objects:
+                                context_object_key = unique_name(objects_names, line_value(line_split))
+                                context_object_obpart = context_object_key
+                                # unique_objects[context_object_key]= None
+
+                        elif line_start == b'g':
+                            if use_split_groups:
+                                grppart = line_value(line_split)
+                                context_object_key = (context_object_obpart, grppart) if context_object_obpart else grppart
+                                # print 'context_object_key', context_object_key
+                                # unique_objects[context_object_key]= None
+                            elif use_groups_as_vgroups:
+                                context_vgroup = line_value(line.split())
+                                if context_vgroup and context_vgroup != b'(null)':
+                                    vertex_groups.setdefault(context_vgroup, [])
+                                else:
+                                    context_vgroup = None  # dont assign a vgroup
+
+                        elif line_start == b'usemtl':
+                            context_material = line_value(line.split())
+                            unique_materials[context_material] = None
+                        elif line_start == b'mtllib':  # usemap or usemat
+                            # can have multiple mtllib filenames per line, mtllib can appear more than once,
+                            # so make sure only occurrence of material exists
+                            material_libs |= {os.fsdecode(f) for f in filenames_group_by_ext(line.lstrip()[7:].strip(), b'.mtl')
+                            }
+
+                            # Nurbs support
+                        elif line_start == b'cstype':
+                            context_nurbs[b'cstype'] = line_value(line.split())  # 'rat bspline' / 'bspline'
+                        elif line_start == b'curv' or context_multi_line == b'curv':
+                            curv_idx = context_nurbs[b'curv_idx'] = context_nurbs.get(b'curv_idx', [])  # in case were multiline
+
+                            if not context_multi_line:
+                                context_nurbs[b'curv_range'] = float_func(line_split[1]), float_func(line_split[2])
+                                line_split[0:3] = []  # remove first 3 items
+
+                            if strip_slash(line_split):
+                                context_multi_line = b'curv'
+                            else:
+                                context_multi_line = b''
 
-                        if vert_loc_index < 0:
-                            vert_loc_index = len(verts_loc) + vert_loc_index + 1
+                            for i in line_split:
+                                vert_loc_index = int(i) - 1
 
-                        curv_idx.append(vert_loc_index)
+                                if vert_loc_index < 0:
+                                    vert_loc_index = len(verts_loc) // 3 + vert_loc_index + 1
 
-                elif line_start == b'parm' or context_multi_line == b'parm':
-                    if context_multi_line:
-                        context_multi_line = b''
-                    else:
-                        context_parm = line_split[1]
-                        line_split[0:2] = []  # remove first 2
+                                curv_idx.append(vert_loc_index)
 
-                    if strip_slash(line_split):
-                        context_multi_line = b'parm'
-                    else:
-                        context_multi_line = b''
-
-                    if context_parm.lower() == b'u':
-                        context_nurbs.setdefault(b'parm_u', []).extend([float_func(f) for f in line_split])
-                    elif context_parm.lower() == b'v':  # surfaces not supported yet
-                        context_nurbs.setdefault(b'parm_v', []).extend([float_func(f) for f in line_split])
-                    # else: # may want to support other parm's ?
-
-                elif line_start == b'deg':
-                    context_nurbs[b'deg'] = [int(i) for i in line.split()[1:]]
-                elif line_start == b'end':
-                    # Add the nurbs curve
-                    if context_object_key:
-                        context_nurbs[b'name'] = context_object_key
-                    nurbs.append(context_nurbs)
-                    context_nurbs = {}
-                    context_parm = b''
-
-                ''' # How to use usemap? deprecated?
-                elif line_start == b'usema': # usemap or usemat
-                    context_image= line_value(line_split)
-                '''
+                        elif line_start == b'parm' or context_multi_line == b'parm':
+                            if context_multi_line:
+                                context_multi_line = b''
+                            else:
+                                context_parm = line_split[1]
+                                line_split[0:2] = []  # remove first 2
+
+                            if strip_slash(line_split):
+                                context_multi_line = b'parm'
+                            else:
+                                context_multi_line = b''
+
+                            if context_parm.lower() == b'u':
+                                context_nurbs.setdefault(b'parm_u', []).extend([float_func(f) for f in line_split])
+                            elif context_parm.lower() == b'v':  # surfaces not supported yet
+                                context_nurbs.setdefault(b'parm_v', []).extend([float_func(f) for f in line_split])
+                            # else: # may want to support other parm's ?
+
+                        elif line_start == b'deg':
+                            context_nurbs[b'deg'] = [int(i) for i in line.split()[1:]]
+                        elif line_start == b'end':
+                            # Add the nurbs curve
+                            if context_object_key:
+                                context_nurbs[b'name'] = context_object_key
+                            nurbs.append(context_nurbs)
+                            context_nurbs = {}
+                            context_parm = b''
+
+                        ''' # How to use usemap? deprecated?
+                        elif line_start == b'usema': # usemap or usemat
+                            context_image= line_value(line_split)
+                        '''
 
         progress.step("Done, loading materials and images...")
 
@@ -1249,8 +1372,21 @@ def load(context,
         create_materials(filepath, relpath, material_libs, unique_materials,
                          use_image_search, float_func)
 
+        verts_loc = np.frombuffer(verts_loc, dtype=np.float64).reshape(-1, 3)
+        verts_nor = np.frombuffer(verts_nor, dtype=np.float64).reshape(-1, 3)
+        verts_tex = np.frombuffer(verts_tex, dtype=np.float64).reshape(-1, 2)
+        faces = (np.frombuffer(faces_loc, dtype=np.int64),
+                 np.frombuffer(faces_tex, dtype=np.int64),
+                 np.frombuffer(faces_nor, dtype=np.int64),
+                 np.frombuffer(faces_total, dtype=np.int64),
+                 np.frombuffer(faces_context, dtype=np.int64),
+                 np.frombuffer(faces_is_polyline, dtype=np.int8).astype(np.bool_),
+                 np.frombuffer(faces_invalid_blenpoly, dtype=np.int8).astype(np.bool_),
+                 )
+        contexts = list(contexts)
+
         progress.step("Done, building geometries (verts:%i faces:%i materials: %i smoothgroups:%i) ..." %
-                      (len(verts_loc), len(faces), len(unique_materials), len(unique_smooth_groups)))
+                      (len(verts_loc), len(faces_total), len(unique_materials), len(unique_smooth_groups)))
 
         # deselect all
         if bpy.ops.object.select_all.poll():
@@ -1261,16 +1397,17 @@ def load(context,
         # Split the mesh by objects/materials, may
         SPLIT_OB_OR_GROUP = bool(use_split_objects or use_split_groups)
 
-        for data in split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
+        for data in split_mesh(verts_loc, faces, contexts, unique_materials, filepath, SPLIT_OB_OR_GROUP):
             verts_loc_split, faces_split, unique_materials_split, dataname, use_vnor, use_vtex = data
             # Create meshes from the data, warning 'vertex_groups' wont support splitting
             #~ print(dataname, use_vnor, use_vtex)
             create_mesh(new_objects,
                         use_edges,
                         verts_loc_split,
-                        verts_nor if use_vnor else [],
-                        verts_tex if use_vtex else [],
+                        verts_nor if use_vnor else verts_nor[:0],
+                        verts_tex if use_vtex else verts_tex[:0],
                         faces_split,
+                        contexts,
                         unique_materials_split,
                         unique_smooth_groups,
                         vertex_groups,
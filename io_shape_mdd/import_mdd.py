@@ -32,8 +32,63 @@
 # Bill Niewuendorp
 
 import bpy
+import numpy as np
 from struct import unpack
 
+
+class MDDReader:
+    """
+    Frame by frame access to an mdd file.
+
+    With use_mmap the vertex data is memory-mapped instead, so frames can be read
+    in any order (e.g. when scrubbing) without loading the whole file.
+    """
+
+    def __init__(self, filepath, use_mmap=False):
+        self.file = open(filepath, 'rb')
+        self.frames, self.points = unpack(">2i", self.file.read(8))
+        self.times = unpack((">%df" % self.frames), self.file.read(self.frames * 4))
+        self.data_offset = 8 + self.frames * 4
+
+        self.data = None
+        if use_mmap and self.frames and self.points:
+            self.data = np.memmap(
+                self.file, dtype='>f4', mode='r',
+                offset=self.data_offset,
+                shape=(self.frames, self.points, 3),
+            )
+
+    def __len__(self):
+        return self.frames
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read_frame(self, index):
+        """Return the vertex coordinates of a frame, as a (points, 3) float32 array."""
+        if not 0 <= index < self.frames:
+            raise IndexError("mdd frame index %d out of range" % index)
+
+        if self.data is not None:
+            co = self.data[index]
+        else:
+            self.file.seek(self.data_offset + index * self.points * 12)  # 12 is the size of 3 floats
+            co = np.fromfile(self.file, dtype='>f4', count=self.points * 3)
+            if len(co) != self.points * 3:
+                raise EOFError("mdd file is truncated at frame %d" % index)
+            co = co.reshape(self.points, 3)
+
+        return co.astype(np.float32)
+
+    def close(self):
+        # A memory map stays valid until the last reference to it is gone.
+        self.data = None
+        self.file.close()
+
+
 def set_linear_interpolation(obj, shapekey):
     anim_data = obj.data.shape_keys.animation_data
     data_path = "key_blocks[\"" + shapekey.name + "\"].value"
@@ -44,7 +99,7 @@ def set_linear_interpolation(obj, shapekey):
                 keyframe.interpolation = 'LINEAR'
 
 
-def obj_update_frame(file, scene, obj, start, fr, step):
+def obj_update_frame(co, scene, obj, start, fr, step):
 
     # Insert new shape key
     new_shapekey = obj.shape_key_add()
@@ -54,10 +109,7 @@ def obj_update_frame(file, scene, obj, start, fr, step):
     obj.active_shape_key_index = new_shapekey_index
     obj.show_only_shape_key = True
 
-    verts = new_shapekey.data
-
-    for v in verts:  # 12 is the size of 3 floats
-        v.co[:] = unpack('>3f', file.read(12))
+    new_shapekey.data.foreach_set("co", co.ravel())
 
     # me.update()
     obj.show_only_shape_key = False
@@ -90,20 +142,25 @@ def load(context, filepath, frame_start=0, frame_step=1):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
-    file = open(filepath, 'rb')
-    frames, points = unpack(">2i", file.read(8))
-    time = unpack((">%df" % frames), file.read(frames * 4))
+    reader = MDDReader(filepath)
+    frames, points = reader.frames, reader.points
 
     print('\tpoints:%d frames:%d' % (points, frames))
     print('\tstart frame:%d step:%d' % (frame_start, frame_step))
 
+    if points != len(obj.data.vertices):
+        reader.close()
+        raise Exception("Error, mdd has %d points but the mesh has %d vertices, cannot import"
+                        % (points, len(obj.data.vertices)))
+
     # If target object doesn't have Basis shape key, create it.
     if not obj.data.shape_keys:
         basis = obj.shape_key_add()
         basis.name = "Basis"
         obj.data.update()
 
-    for i in range(frames):
-        obj_update_frame(file, scene, obj, frame_start, i, frame_step)
+    with reader:
+        for i in range(frames):
+            obj_update_frame(reader.read_frame(i), scene, obj, frame_start, i, frame_step)
 
     return {'FINISHED'}